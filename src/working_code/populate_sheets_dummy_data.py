@@ -17,7 +17,7 @@ sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 try:
     import gspread
     from google.oauth2.service_account import Credentials
-    from src.utils.config import Config
+    from src.utils.config import get_config
 except ImportError as e:
     print(f"Error importing required modules: {e}")
     print("Please ensure you have installed all requirements: pip install -r requirements.txt")
@@ -173,7 +173,7 @@ class SheetsPopulator:
     def __init__(self):
         """Initialize the sheets populator."""
         try:
-            self.config = Config()
+            self.config = get_config()
             self.client = None
             self.spreadsheet = None
             self._initialize_client()
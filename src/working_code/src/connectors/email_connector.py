@@ -9,8 +9,8 @@ import os
 import logging
 import smtplib
 import uuid
-from email.mime.text import MIMEText
-from email.mime.multipart import MIMEMultipart
+from email.message import EmailMessage
+from email.policy import SMTP as SMTP_POLICY
 from typing import Optional
 from datetime import datetime
 from pathlib import Path
@@ -61,7 +61,7 @@ class EmailConnector:
             self.outbox_dir.mkdir(parents=True, exist_ok=True)
         
         mode = "demo" if self.demo_mode else "SMTP"
-        self.logger.info(f"Email connector initialized in {mode} mode")
+        self.logger.info("Email connector initialized in %s mode", mode)
     
     def send_approval_email(self, to: str, subject: str, html_body: str, 
                            approve_link: str, reject_link: str) -> str:
@@ -96,7 +96,7 @@ class EmailConnector:
                 return self._send_smtp_email(to, subject, complete_html, message_id)
                 
         except Exception as e:
-            self.logger.error(f"Error sending approval email to {to}: {str(e)}")
+            self.logger.error("Error sending approval email to %s: %s", to, e)
             raise
     
     def _create_approval_email_template(self, body_content: str, approve_link: str, reject_link: str) -> str:
@@ -241,27 +241,26 @@ class EmailConnector:
         """
         try:
             # Create message
-            message = MIMEMultipart('alternative')
+            message = EmailMessage(policy=SMTP_POLICY)
             message['From'] = self.smtp_user
             message['To'] = to
             message['Subject'] = subject
             message['Message-ID'] = f"<{message_id}@inventory-system>"
             
-            # Add HTML content
-            html_part = MIMEText(html_body, 'html')
-            message.attach(html_part)
+            # Add HTML content as raw UTF-8 (8bit) rather than base64/QP
+            message.set_content(html_body, subtype='html', charset='utf-8', cte='8bit')
             
-            # Send via SMTP
+            # Send via SMTP; send_message serializes with a BytesGenerator
             with smtplib.SMTP(self.smtp_host, self.smtp_port) as server:
                 server.starttls()
                 server.login(self.smtp_user, self.smtp_password)
-                server.sendmail(self.smtp_user, to, message.as_string())
+                server.send_message(message, from_addr=self.smtp_user, to_addrs=[to])
             
-            self.logger.info(f"Email sent successfully to {to} (Message ID: {message_id})")
+            self.logger.info("Email sent successfully to %s (Message ID: %s)", to, message_id)
             return message_id
             
         except Exception as e:
-            self.logger.error(f"SMTP sending failed: {str(e)}")
+            self.logger.error("SMTP sending failed: %s", e)
             raise
     
     def _write_demo_email(self, to: str, subject: str, html_body: str, message_id: str) -> str:
@@ -299,11 +298,11 @@ Generated: {datetime.now().isoformat()}
             with open(file_path, 'w', encoding='utf-8') as f:
                 f.write(email_content)
             
-            self.logger.info(f"Demo email written to: {file_path}")
+            self.logger.info("Demo email written to: %s", file_path)
             return str(file_path)
             
         except Exception as e:
-            self.logger.error(f"Failed to write demo email: {str(e)}")
+            self.logger.error("Failed to write demo email: %s", e)
             raise
 
 
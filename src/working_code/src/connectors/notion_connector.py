@@ -12,6 +12,45 @@ from datetime import datetime
 import requests
 import json
 
+
+def _make_page_payload_builder(database_id: str):
+    """
+    Build the reorder page payload factory for a given database.
+    
+    The database schema is fixed, so the payload is expressed as a single
+    dict literal inside a closure created once per connector; each call only
+    binds arguments instead of assembling properties key by key.
+    
+    Args:
+        database_id: Notion database ID the pages are created in
+        
+    Returns:
+        Callable returning the ``POST /pages`` request body
+    """
+    parent = {"database_id": database_id}
+    
+    def build(sku: str, qty: int, vendor_name: str, total_cost: float, eoq: int,
+              forecast_text: str, evidence_list: List[str]) -> Dict[str, Any]:
+        return {
+            "parent": parent,
+            "properties": {
+                "SKU": {"title": [{"text": {"content": sku}}]},
+                "Quantity": {"number": qty},
+                "Vendor": {"rich_text": [{"text": {"content": vendor_name}}]},
+                "Total Cost": {"number": total_cost},
+                "EOQ": {"number": eoq},
+                "Status": {"select": {"name": "Pending Approval"}},
+                "Created Date": {"date": {"start": datetime.now().isoformat()}},
+                "Forecast": {"rich_text": [{"text": {"content": forecast_text}}]},
+                "Evidence": {
+                    "rich_text": [{"text": {"content": f"• {evidence}"}} for evidence in evidence_list]
+                },
+            },
+        }
+    
+    return build
+
+
 class NotionConnector:
     """
     Connector for Notion integration using REST API v1.
@@ -45,6 +84,7 @@ class NotionConnector:
             "Content-Type": "application/json",
             "Notion-Version": "2022-06-28"  # Latest stable API version
         }
+        self._build_page_payload = _make_page_payload_builder(self.notion_db_id)
         
         self.logger.info("Notion connector initialized successfully")
     
@@ -69,49 +109,9 @@ class NotionConnector:
             Exception: If page creation fails
         """
         try:
-            # Prepare evidence as rich text blocks
-            evidence_blocks = []
-            for evidence in evidence_list:
-                evidence_blocks.append({
-                    "text": {"content": f"• {evidence}"}
-                })
-            
-            # Create page properties
-            properties = {
-                "SKU": {
-                    "title": [{"text": {"content": sku}}]
-                },
-                "Quantity": {
-                    "number": qty
-                },
-                "Vendor": {
-                    "rich_text": [{"text": {"content": vendor_name}}]
-                },
-                "Total Cost": {
-                    "number": total_cost
-                },
-                "EOQ": {
-                    "number": eoq
-                },
-                "Status": {
-                    "select": {"name": "Pending Approval"}
-                },
-                "Created Date": {
-                    "date": {"start": datetime.now().isoformat()}
-                },
-                "Forecast": {
-                    "rich_text": [{"text": {"content": forecast_text}}]
-                },
-                "Evidence": {
-                    "rich_text": evidence_blocks
-                }
-            }
-            
-            # Create the page
-            payload = {
-                "parent": {"database_id": self.notion_db_id},
-                "properties": properties
-            }
+            payload = self._build_page_payload(
+                sku, qty, vendor_name, total_cost, eoq, forecast_text, evidence_list
+            )
             
             response = requests.post(
                 f"{self.base_url}/pages",
@@ -128,11 +128,11 @@ class NotionConnector:
             page_id = page_data['id']
             page_url = page_data['url']
             
-            self.logger.info(f"Created Notion reorder page for SKU {sku}: {page_url}")
+            self.logger.info("Created Notion reorder page for SKU %s: %s", sku, page_url)
             return page_url
             
         except Exception as e:
-            self.logger.error(f"Error creating Notion reorder page for SKU {sku}: {str(e)}")
+            self.logger.error("Error creating Notion reorder page for SKU %s: %s", sku, e)
             raise
     
     def update_reorder_status(self, page_id: str, status: str, order_confirm: Optional[str] = None) -> bool:
@@ -180,11 +180,11 @@ class NotionConnector:
                 self.logger.error(error_msg)
                 raise Exception(error_msg)
             
-            self.logger.info(f"Updated Notion page {page_id} status to: {status}")
+            self.logger.info("Updated Notion page %s status to: %s", page_id, status)
             return True
             
         except Exception as e:
-            self.logger.error(f"Error updating Notion page {page_id}: {str(e)}")
+            self.logger.error("Error updating Notion page %s: %s", page_id, e)
             raise
 
 
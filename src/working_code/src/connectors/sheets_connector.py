@@ -3,26 +3,110 @@
 Handles all interactions with Google Sheets for inventory data management.
 Reads inventory and transaction data from specified worksheets."""
 
+import asyncio
+import hashlib
+import json
 import logging
-from typing import Dict, List, Optional, Any
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import TYPE_CHECKING, Dict, Iterable, List, Optional, Any, Tuple
 from datetime import datetime, date
 import gspread
 from google.oauth2.service_account import Credentials
 from google.auth.exceptions import GoogleAuthError
 import os
-import sys
-sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
-from src.utils.config import Config
+
+if TYPE_CHECKING:
+    # Only needed for annotations; importing it at runtime required putting
+    # the project root on sys.path every time this module was imported
+    from src.utils.config import Config
+
+# Trailing row number of an A1 range such as "'Transactions'!A1:C10000"
+_RANGE_END_ROW_RE = re.compile(r'(\d+)$')
+
+# YYYY-MM-DD with the same one-or-two digit month/day leniency as strptime
+_DATE_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})')
+
+# Column dtypes for the DataFrame forms of read_inventory/read_transactions
+INVENTORY_FRAME_DTYPES = {
+    'sku': 'object',
+    'description': 'object',
+    'on_hand': 'int32',
+    'unit': 'object',
+    'lead_time_days': 'int32',
+    'min_order_qty': 'int32',
+    'vendor_ids': 'object',
+    'auto_order_threshold': 'float64',
+    'trust_score': 'float64',
+    'row_number': 'int32',
+}
+TRANSACTION_FRAME_DTYPES = {
+    'date': 'datetime64[ns]',
+    'sku': 'object',
+    'qty': 'float64',
+    'row_number': 'Int32',  # nullable: rows served by query pushdown have no row number
+}
+
+
+def _records_to_frame(records: List[Dict[str, Any]], dtypes: Dict[str, str]):
+    """
+    Build a typed pandas DataFrame from processed connector records.
+    
+    pandas is imported lazily so callers that only use the list form do
+    not pay its import cost.
+    """
+    import pandas as pd
+    
+    frame = pd.DataFrame.from_records(records, columns=list(dtypes))
+    return frame.astype(dtypes)
+
 
 class SheetsConnector:
     """Connector for Google Sheets integration."""
     
-    def __init__(self, config: Config):
-        """Initialize the Google Sheets connector."""
+    # Seconds a fetched worksheet stays valid in the in-process cache
+    RECORDS_CACHE_TTL = 60.0
+    
+    # Worksheets read by this connector; fetched together in one batch request
+    WORKSHEETS = ("Inventory", "Transactions")
+    
+    # Worksheets read_transactions filters server-side; never prefetched along
+    # with another worksheet, as a warm cache would bypass the query pushdown
+    QUERY_PUSHDOWN_WORKSHEETS = ("Transactions",)
+    
+    # Rows per values request; larger worksheets are read page by page
+    PAGE_ROWS = 10000
+    
+    # Value rendering shared by every values request; gspread adds keys such as
+    # ``ranges`` to the dict it is given, so each request gets its own copy
+    VALUES_PARAMS = {
+        'majorDimension': 'COLUMNS',
+        'valueRenderOption': 'UNFORMATTED_VALUE',
+        'dateTimeRenderOption': 'FORMATTED_STRING',
+    }
+    
+    # Google Visualization query endpoint used to filter rows server-side
+    GVIZ_QUERY_URL = "https://docs.google.com/spreadsheets/d/{spreadsheet_id}/gviz/tq"
+    
+    # Directory holding cached OAuth access tokens between process runs
+    TOKEN_CACHE_DIR = os.path.join(os.path.expanduser("~"), ".cache", "inventory_pulse")
+    
+    def __init__(self, config: "Config", cache_ttl: Optional[float] = None):
+        """
+        Initialize the Google Sheets connector.
+        
+        Args:
+            config: Application configuration
+            cache_ttl: Seconds to reuse fetched worksheet records before
+                re-reading them from the API (0 disables caching)
+        """
         self.config = config
         self.logger = logging.getLogger(__name__)
         self.client = None
         self.spreadsheet = None
+        self.cache_ttl = self.RECORDS_CACHE_TTL if cache_ttl is None else cache_ttl
+        self._records_cache: Dict[str, tuple] = {}
         self._initialize_client()
     
     def _initialize_client(self):
@@ -44,11 +128,13 @@ class SheetsConnector:
                     f"and placed it at the specified path."
                 )
             
-            # Load credentials
+            # Load credentials, reusing a still-valid access token from a previous run
             credentials = Credentials.from_service_account_file(
                 credentials_path,
                 scopes=scope
             )
+            token_cache_path = self._token_cache_path(credentials, scope)
+            cached_token = self._load_cached_token(credentials, token_cache_path)
             
             # Initialize client
             self.client = gspread.authorize(credentials)
@@ -57,6 +143,8 @@ class SheetsConnector:
             try:
                 self.spreadsheet = self.client.open_by_key(self.config.google_sheets_spreadsheet_id)
                 self.logger.info("Google Sheets client initialized successfully")
+                if credentials.token != cached_token:
+                    self._save_cached_token(credentials, token_cache_path)
             except gspread.SpreadsheetNotFound:
                 raise ValueError(
                     f"Spreadsheet with ID '{self.config.google_sheets_spreadsheet_id}' not found. "
@@ -73,7 +161,304 @@ class SheetsConnector:
             self.logger.error(f"Failed to initialize Google Sheets client: {e}")
             raise
     
-    def read_inventory(self) -> List[Dict[str, Any]]:
+    def _token_cache_path(self, credentials: Credentials, scope: List[str]) -> str:
+        """Return the token cache file for a service account and scope set."""
+        key = "|".join([credentials.service_account_email] + sorted(scope))
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()[:16]
+        return os.path.join(self.TOKEN_CACHE_DIR, f"sheets_token_{digest}.json")
+    
+    def _load_cached_token(self, credentials: Credentials, path: str) -> Optional[str]:
+        """
+        Seed credentials with a cached access token if it is still valid.
+        
+        The service-account credentials stay in place, so google-auth
+        refreshes them as usual once the cached token expires.
+        
+        Returns:
+            The cached token if it was applied, otherwise None
+        """
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                cached = json.load(f)
+            credentials.token = cached["token"]
+            credentials.expiry = datetime.fromisoformat(cached["expiry"])
+        except (OSError, ValueError, KeyError, TypeError):
+            return None
+        
+        if not credentials.valid:
+            credentials.token = None
+            credentials.expiry = None
+            return None
+        
+        self.logger.debug("Reusing cached Google Sheets access token")
+        return credentials.token
+    
+    def _save_cached_token(self, credentials: Credentials, path: str):
+        """Persist the current access token (owner-readable only) for the next run."""
+        if not credentials.token or credentials.expiry is None:
+            return
+        
+        try:
+            os.makedirs(os.path.dirname(path), exist_ok=True)
+            fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+            with os.fdopen(fd, "w", encoding="utf-8") as f:
+                json.dump({"token": credentials.token, "expiry": credentials.expiry.isoformat()}, f)
+        except OSError as e:
+            self.logger.debug("Could not cache Google Sheets access token: %s", e)
+    
+    def _get_records(self, title: str) -> List[Dict[str, Any]]:
+        """
+        Return the rows of a worksheet as header-keyed dictionaries.
+        
+        Rows are served from the TTL cache when fresh. On a miss, the other
+        worksheets in ``WORKSHEETS`` that are not cached are fetched in the same
+        ``values.batchGet`` round-trip, so a transactions full scan also warms
+        the inventory cache. Worksheets in ``QUERY_PUSHDOWN_WORKSHEETS`` are
+        only fetched when requested. If the batch fails, the requested
+        worksheet is fetched on its own. Values are requested column-major
+        so short trailing rows are padded per column rather than per row.
+        
+        The batch covers the first ``PAGE_ROWS`` rows of each worksheet; any
+        worksheet whose grid extends past that is read page by page, with the
+        next page fetched in the background while the current one is parsed.
+        
+        Args:
+            title: Worksheet title
+            
+        Returns:
+            List of row dictionaries keyed by header
+            
+        Raises:
+            ValueError: If the requested worksheet does not exist
+        """
+        if self._is_cached(title):
+            return self._records_cache[title][1]
+        
+        titles = [title] + [
+            other for other in self.WORKSHEETS
+            if other != title and other not in self.QUERY_PUSHDOWN_WORKSHEETS and not self._is_cached(other)
+        ]
+        
+        try:
+            response = self._batch_get_first_pages(titles)
+        except gspread.exceptions.APIError:
+            self._raise_if_worksheet_missing([title])
+            if len(titles) == 1:
+                raise
+            # Another worksheet in the batch is missing or unreadable; that
+            # must not fail this read, so fetch the requested worksheet alone
+            titles = [title]
+            response = self._batch_get_first_pages(titles)
+        
+        for fetched_title, value_range in zip(titles, response.get('valueRanges', [])):
+            columns = value_range.get('values', [])
+            if self._page_is_full(value_range, self.PAGE_ROWS):
+                # Keep trailing empty rows so later pages start at the right sheet row
+                records = self._columns_to_records(columns, body_rows=self.PAGE_ROWS - 1)
+                header = [column[0] if column else '' for column in columns]
+                records.extend(self._read_remaining_pages(fetched_title, header))
+            else:
+                records = self._columns_to_records(columns)
+            self._records_cache[fetched_title] = (time.monotonic(), records)
+        return self._records_cache[title][1]
+    
+    def _batch_get_first_pages(self, titles: List[str]) -> Dict[str, Any]:
+        """Fetch the first page of each worksheet in one ``values.batchGet`` request."""
+        return self.spreadsheet.values_batch_get(
+            [self._page_range(t, 1) for t in titles],
+            params=dict(self.VALUES_PARAMS)
+        )
+    
+    def _page_range(self, title: str, first_row: int) -> str:
+        """A1 range covering ``PAGE_ROWS`` rows of a worksheet starting at ``first_row``."""
+        return f"'{title}'!{first_row}:{first_row + self.PAGE_ROWS - 1}"
+    
+    @staticmethod
+    def _page_is_full(value_range: Dict[str, Any], last_row: int) -> bool:
+        """
+        Check whether the worksheet grid extends to ``last_row``.
+        
+        The API clips the returned range to the grid, so a range ending
+        before the requested last row means there is nothing further to read.
+        A grid ending exactly on ``last_row`` also reads as full; the request
+        for the next page then fails (see _is_past_grid_end).
+        """
+        match = _RANGE_END_ROW_RE.search(value_range.get('range', ''))
+        return match is not None and int(match.group(1)) >= last_row
+    
+    @staticmethod
+    def _is_past_grid_end(error: gspread.exceptions.APIError) -> bool:
+        """Check whether a values request failed only because its range starts below the grid."""
+        return error.code == 400 and 'exceeds grid limits' in str(error.error.get('message', ''))
+    
+    def _read_remaining_pages(self, title: str, header: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Read the rows after the first page, prefetching one page ahead.
+        
+        Args:
+            title: Worksheet title
+            header: Header row from the first page
+            
+        Returns:
+            Row dictionaries for every row after the first page
+        """
+        records = []
+        first_row = self.PAGE_ROWS + 1
+        
+        with ThreadPoolExecutor(max_workers=1, thread_name_prefix="sheets-page") as pool:
+            future = pool.submit(
+                self.spreadsheet.values_get, self._page_range(title, first_row), dict(self.VALUES_PARAMS)
+            )
+            while future is not None:
+                try:
+                    value_range = future.result()
+                except gspread.exceptions.APIError as e:
+                    if not self._is_past_grid_end(e):
+                        raise
+                    # The previous page ended on the last row of the grid
+                    break
+                last_row = first_row + self.PAGE_ROWS - 1
+                
+                # Request the next page before parsing this one
+                future = None
+                page_is_full = self._page_is_full(value_range, last_row)
+                if page_is_full:
+                    first_row = last_row + 1
+                    future = pool.submit(
+                        self.spreadsheet.values_get, self._page_range(title, first_row), dict(self.VALUES_PARAMS)
+                    )
+                
+                # A full page spans PAGE_ROWS sheet rows even when the API drops
+                # its trailing empty rows; pad it so row positions stay aligned
+                columns = value_range.get('values', [])
+                records.extend(self._columns_to_records([
+                    [name] + (columns[i] if i < len(columns) else [])
+                    for i, name in enumerate(header)
+                ], body_rows=self.PAGE_ROWS if page_is_full else 0))
+        
+        return records
+    
+    def _is_cached(self, title: str) -> bool:
+        """Check whether a worksheet's records are cached and still within the TTL."""
+        cached = self._records_cache.get(title)
+        return cached is not None and time.monotonic() - cached[0] < self.cache_ttl
+    
+    def _query_transactions(self, start_iso: str, end_iso: str) -> Optional[List[Dict[str, Any]]]:
+        """
+        Fetch only the transactions inside a date range via the Visualization query API.
+        
+        The query assumes the Date column is column A and date-typed in the
+        sheet. Any failure (including text-typed dates, which the query
+        rejects) returns None so the caller can fall back to a full scan.
+        
+        The API gives each column a single type and returns null for cells
+        of any other type (e.g. a date typed as text, or an alphanumeric SKU
+        in a numeric column). Rows with a null date are requested too, and
+        any null Date, SKU or Qty cell in a non-blank row also returns None,
+        so mixed-type worksheets are read by the full scan rather than
+        silently losing rows. Whole numbers come back as floats and are
+        returned as ints, as the full scan's unformatted values are.
+        
+        Args:
+            start_iso: Inclusive start date (YYYY-MM-DD)
+            end_iso: Inclusive end date (YYYY-MM-DD)
+            
+        Returns:
+            Header-keyed row dictionaries, or None if the query could not be served
+        """
+        query = f"select * where (A >= date '{start_iso}' and A <= date '{end_iso}') or A is null"
+        try:
+            response = self.client.http_client.request(
+                "get",
+                self.GVIZ_QUERY_URL.format(spreadsheet_id=self.spreadsheet.id),
+                params={'sheet': 'Transactions', 'headers': 1, 'tq': query, 'tqx': 'out:json'}
+            )
+            # Body is JSONP: google.visualization.Query.setResponse({...});
+            text = response.text
+            payload = json.loads(text[text.index('(') + 1:text.rindex(')')])
+        except Exception as e:
+            self.logger.debug("Transactions query pushdown unavailable: %s", e)
+            return None
+        
+        if payload.get('status') != 'ok':
+            self.logger.debug("Transactions query pushdown rejected: %s", payload.get('errors'))
+            return None
+        
+        table = payload['table']
+        labels = [col.get('label') or col.get('id') for col in table['cols']]
+        if not {'Date', 'SKU', 'Qty'}.issubset(labels):
+            # Header row not recognised as labels; let the full scan handle it
+            return None
+        
+        required = [labels.index(name) for name in ('Date', 'SKU', 'Qty')]
+        records = []
+        for row in table['rows']:
+            values = []
+            for cell in row['c']:
+                value = cell.get('v') if cell else None
+                if value is None:
+                    value = ''
+                elif isinstance(value, str) and value.startswith('Date('):
+                    # Dates are encoded as Date(year, zero-based month, day)
+                    year, month, day = value[5:-1].split(',')[:3]
+                    value = f"{int(year):04d}-{int(month) + 1:02d}-{int(day):02d}"
+                elif isinstance(value, float) and value.is_integer():
+                    # Numeric SKUs must read "123", not "123.0"
+                    value = int(value)
+                values.append(value)
+            
+            missing = sum(1 for i in required if i >= len(values) or values[i] == '')
+            if missing == len(required):
+                continue  # Blank row
+            if missing:
+                self.logger.debug("Transactions query pushdown returned null cells; using a full scan")
+                return None
+            records.append(dict(zip(labels, values)))
+        return records
+    
+    @staticmethod
+    def _columns_to_records(columns: List[List[Any]], body_rows: int = 0) -> List[Dict[str, Any]]:
+        """
+        Convert a column-major value range (header cell first) into row dictionaries.
+        
+        Args:
+            columns: Columns of cell values, each starting with its header cell
+            body_rows: Minimum number of rows to return; shorter ranges are
+                padded with empty rows
+        """
+        if not columns:
+            return []
+        
+        # The API omits trailing empty cells, so pad each column once to full height
+        height = max(max(len(column) for column in columns), body_rows + 1)
+        header = [column[0] if column else '' for column in columns]
+        body = [column[1:] + [''] * (height - len(column)) for column in columns]
+        return [dict(zip(header, row)) for row in zip(*body)]
+    
+    def _raise_if_worksheet_missing(self, titles: List[str]):
+        """Raise a descriptive ValueError if any of the given worksheets does not exist."""
+        for title in titles:
+            try:
+                self.spreadsheet.worksheet(title)
+            except gspread.WorksheetNotFound:
+                raise ValueError(
+                    f"Worksheet '{title}' not found. Please ensure your spreadsheet "
+                    f"contains a worksheet named '{title}' with the required columns."
+                )
+    
+    def clear_cache(self, title: Optional[str] = None):
+        """
+        Drop cached worksheet records so the next read hits the API.
+        
+        Args:
+            title: Worksheet to invalidate; clears every worksheet when omitted
+        """
+        if title is None:
+            self._records_cache.clear()
+        else:
+            self._records_cache.pop(title, None)
+    
+    def read_inventory(self, as_dataframe: bool = False):
         """
         Read inventory data from the 'Inventory' worksheet.
         
@@ -88,59 +473,56 @@ class SheetsConnector:
         - AutoOrderThreshold: Monetary threshold for auto-ordering
         - TrustScore: Supplier reliability score (0-100)
         
+        Args:
+            as_dataframe: Return a typed pandas DataFrame instead of a list
+            
         Returns:
-            List of dictionaries containing inventory data
+            List of dictionaries containing inventory data, or a DataFrame
+            with the same columns when ``as_dataframe`` is True
         """
         try:
-            # Get the Inventory worksheet
-            try:
-                worksheet = self.spreadsheet.worksheet("Inventory")
-            except gspread.WorksheetNotFound:
-                raise ValueError(
-                    "Worksheet 'Inventory' not found. Please ensure your spreadsheet "
-                    "contains a worksheet named 'Inventory' with the required columns."
-                )
-            
-            # Get all records
-            records = worksheet.get_all_records()
+            # Get all records from the Inventory worksheet
+            records = self._get_records("Inventory")
             
             if not records:
                 self.logger.warning("No inventory data found in the worksheet")
-                return []
+                return _records_to_frame([], INVENTORY_FRAME_DTYPES) if as_dataframe else []
             
             # Validate and process records
             processed_records = []
             required_columns = ['SKU', 'Description', 'OnHand', 'Unit', 'LeadTimeDays', 
                               'MinOrderQty', 'VendorIDs', 'AutoOrderThreshold', 'TrustScore']
+            self._check_required_columns("Inventory", records, required_columns)
+            
+            # Bind converters once instead of resolving them per cell
+            int_conv = self._safe_int_convert
+            float_conv = self._safe_float_convert
             
             for i, record in enumerate(records, start=2):  # Start at 2 (header is row 1)
                 try:
-                    # Check for required columns
-                    missing_columns = [col for col in required_columns if col not in record]
-                    if missing_columns:
-                        self.logger.warning(
-                            f"Row {i}: Missing columns {missing_columns}. Skipping row."
-                        )
+                    # Skip empty SKUs before converting the rest of the row
+                    sku = record['SKU']
+                    sku = sku.strip() if type(sku) is str else str(sku).strip()
+                    if not sku:
                         continue
                     
+                    description = record['Description']
+                    unit = record['Unit']
+                    
                     # Process and validate data
                     processed_record = {
-                        'sku': str(record['SKU']).strip(),
-                        'description': str(record['Description']).strip(),
-                        'on_hand': self._safe_int_convert(record['OnHand'], f"Row {i} OnHand"),
-                        'unit': str(record['Unit']).strip(),
-                        'lead_time_days': self._safe_int_convert(record['LeadTimeDays'], f"Row {i} LeadTimeDays"),
-                        'min_order_qty': self._safe_int_convert(record['MinOrderQty'], f"Row {i} MinOrderQty"),
-                        'vendor_ids': [vid.strip() for vid in str(record['VendorIDs']).split(',') if vid.strip()],
-                        'auto_order_threshold': self._safe_float_convert(record['AutoOrderThreshold'], f"Row {i} AutoOrderThreshold"),
-                        'trust_score': self._safe_float_convert(record['TrustScore'], f"Row {i} TrustScore", 0, 100),
+                        'sku': sku,
+                        'description': description.strip() if type(description) is str else str(description).strip(),
+                        'on_hand': int_conv(record['OnHand'], f"Row {i} OnHand"),
+                        'unit': unit.strip() if type(unit) is str else str(unit).strip(),
+                        'lead_time_days': int_conv(record['LeadTimeDays'], f"Row {i} LeadTimeDays"),
+                        'min_order_qty': int_conv(record['MinOrderQty'], f"Row {i} MinOrderQty"),
+                        'vendor_ids': [vid for vid in map(str.strip, str(record['VendorIDs']).split(',')) if vid],
+                        'auto_order_threshold': float_conv(record['AutoOrderThreshold'], f"Row {i} AutoOrderThreshold"),
+                        'trust_score': float_conv(record['TrustScore'], f"Row {i} TrustScore", 0, 100),
                         'row_number': i
                     }
                     
-                    # Skip empty SKUs
-                    if not processed_record['sku']:
-                        continue
-                        
                     processed_records.append(processed_record)
                     
                 except Exception as e:
@@ -148,13 +530,16 @@ class SheetsConnector:
                     continue
             
             self.logger.info(f"Successfully read {len(processed_records)} inventory records")
+            if as_dataframe:
+                return _records_to_frame(processed_records, INVENTORY_FRAME_DTYPES)
             return processed_records
             
         except Exception as e:
             self.logger.error(f"Failed to read inventory data: {e}")
             raise
     
-    def read_transactions(self, start_date: str, end_date: str) -> List[Dict[str, Any]]:
+    def read_transactions(self, start_date: str, end_date: str,
+                          sku_filter: Optional[Iterable[str]] = None, as_dataframe: bool = False):
         """
         Read transaction data from the 'Transactions' worksheet for a date range.
         
@@ -166,20 +551,17 @@ class SheetsConnector:
         Args:
             start_date: Start date in YYYY-MM-DD format
             end_date: End date in YYYY-MM-DD format
+            sku_filter: Optional SKUs to keep; rows for other SKUs are dropped
+                before their date and quantity are parsed
+            as_dataframe: Return a typed pandas DataFrame instead of a list
             
         Returns:
-            List of dictionaries containing transaction data
+            List of dictionaries containing transaction data, or a DataFrame
+            with the same columns (``date`` as datetime64) when ``as_dataframe`` is True
         """
+        sku_filter = frozenset(sku_filter) if sku_filter is not None else None
+        
         try:
-            # Get the Transactions worksheet
-            try:
-                worksheet = self.spreadsheet.worksheet("Transactions")
-            except gspread.WorksheetNotFound:
-                raise ValueError(
-                    "Worksheet 'Transactions' not found. Please ensure your spreadsheet "
-                    "contains a worksheet named 'Transactions' with the required columns."
-                )
-            
             # Parse date range
             try:
                 start_dt = datetime.strptime(start_date, '%Y-%m-%d').date()
@@ -187,34 +569,56 @@ class SheetsConnector:
             except ValueError as e:
                 raise ValueError(f"Invalid date format. Use YYYY-MM-DD format: {e}")
             
-            # Get all records
-            records = worksheet.get_all_records()
+            # Zero-padded ISO dates order the same as strings, so canonical
+            # values outside the range can be rejected without parsing them
+            start_iso = start_dt.isoformat()
+            end_iso = end_dt.isoformat()
             
-            if not records:
-                self.logger.warning("No transaction data found in the worksheet")
-                return []
+            # Push the date filter down to the API unless the whole worksheet
+            # is already cached; rows served that way carry no row number
+            records = None
+            if not self._is_cached("Transactions"):
+                records = self._query_transactions(start_iso, end_iso)
+            
+            if records is not None:
+                numbered_records = ((None, record) for record in records)
+            else:
+                records = self._get_records("Transactions")
+                if not records:
+                    self.logger.warning("No transaction data found in the worksheet")
+                    return _records_to_frame([], TRANSACTION_FRAME_DTYPES) if as_dataframe else []
+                numbered_records = enumerate(records, start=2)  # Start at 2 (header is row 1)
             
             # Filter and process records
             processed_records = []
             required_columns = ['Date', 'SKU', 'Qty']
+            if records:
+                self._check_required_columns("Transactions", records, required_columns)
+            float_conv = self._safe_float_convert
+            date_match_fn = _DATE_RE.fullmatch
             
-            for i, record in enumerate(records, start=2):  # Start at 2 (header is row 1)
+            for i, record in numbered_records:
                 try:
-                    # Check for required columns
-                    missing_columns = [col for col in required_columns if col not in record]
-                    if missing_columns:
-                        self.logger.warning(
-                            f"Row {i}: Missing columns {missing_columns}. Skipping row."
-                        )
+                    sku = str(record['SKU']).strip()
+                    if not sku or (sku_filter is not None and sku not in sku_filter):
                         continue
                     
                     # Parse and validate date
                     date_str = str(record['Date']).strip()
                     if not date_str:
                         continue
-                        
+                    
+                    # Canonical YYYY-MM-DD dates outside the range are rejected as
+                    # strings; anything else goes on to the parse and its warning
+                    date_match = date_match_fn(date_str)
+                    if date_match is not None and len(date_str) == 10 and not (start_iso <= date_str <= end_iso):
+                        continue
+                    
                     try:
-                        transaction_date = datetime.strptime(date_str, '%Y-%m-%d').date()
+                        if date_match is None:
+                            raise ValueError(date_str)
+                        year, month, day = date_match.groups()
+                        transaction_date = date(int(year), int(month), int(day))
                     except ValueError:
                         self.logger.warning(f"Row {i}: Invalid date format '{date_str}'. Expected YYYY-MM-DD.")
                         continue
@@ -224,11 +628,7 @@ class SheetsConnector:
                         continue
                     
                     # Process record
-                    sku = str(record['SKU']).strip()
-                    if not sku:
-                        continue
-                    
-                    qty = self._safe_float_convert(record['Qty'], f"Row {i} Qty")
+                    qty = float_conv(record['Qty'], f"Row {i} Qty")
                     if qty is None:
                         continue
                     
@@ -249,15 +649,72 @@ class SheetsConnector:
                 f"Successfully read {len(processed_records)} transaction records "
                 f"between {start_date} and {end_date}"
             )
+            if as_dataframe:
+                return _records_to_frame(processed_records, TRANSACTION_FRAME_DTYPES)
             return processed_records
             
         except Exception as e:
             self.logger.error(f"Failed to read transaction data: {e}")
             raise
     
+    @staticmethod
+    def _check_required_columns(title: str, records: List[Dict[str, Any]], required_columns: List[str]):
+        """
+        Validate the worksheet header once instead of per row.
+        
+        Every record is keyed by the same header row, so the first record's
+        keys stand for the whole worksheet.
+        
+        Raises:
+            ValueError: If any required column is missing
+        """
+        header_keys = records[0].keys()
+        missing_columns = [col for col in required_columns if col not in header_keys]
+        if missing_columns:
+            raise ValueError(
+                f"Worksheet '{title}' is missing required columns {missing_columns}. "
+                f"Please add them to the header row."
+            )
+    
+    def read_all(self, start_date: str, end_date: str,
+                 sku_filter: Optional[Iterable[str]] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Read inventory and transactions for a date range together.
+        
+        Transactions are read first: through the date-range query pushdown
+        when it can be served, otherwise by a full scan whose batch request
+        also fetches inventory, so the pair costs a single values round-trip.
+        
+        Args:
+            start_date: Start date in YYYY-MM-DD format
+            end_date: End date in YYYY-MM-DD format
+            sku_filter: Optional SKUs to restrict transactions to
+            
+        Returns:
+            Tuple of (inventory records, transaction records)
+        """
+        transactions = self.read_transactions(start_date, end_date, sku_filter)
+        return self.read_inventory(), transactions
+    
+    async def aread_all(self, start_date: str, end_date: str,
+                        sku_filter: Optional[Iterable[str]] = None) -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+        """
+        Async variant of read_all for event-loop callers.
+        
+        The blocking gspread request runs in a worker thread so other
+        coroutines (e.g. Notion or email calls) proceed while it is in flight.
+        """
+        return await asyncio.to_thread(self.read_all, start_date, end_date, sku_filter)
+    
     def _safe_int_convert(self, value: Any, field_name: str) -> Optional[int]:
         """Safely convert value to integer."""
         try:
+            # Numeric cells arrive typed from the API; skip the str round-trip
+            value_type = type(value)
+            if value_type is int:
+                return value
+            if value_type is float:
+                return int(value)
             if value == '' or value is None:
                 return 0
             return int(float(str(value)))  # Handle cases like "10.0"
@@ -268,10 +725,15 @@ class SheetsConnector:
     def _safe_float_convert(self, value: Any, field_name: str, min_val: float = None, max_val: float = None) -> Optional[float]:
         """Safely convert value to float with optional range validation."""
         try:
-            if value == '' or value is None:
+            value_type = type(value)
+            if value_type is float:
+                float_val = value
+            elif value_type is int:
+                float_val = float(value)
+            elif value == '' or value is None:
                 return 0.0
-            
-            float_val = float(str(value))
+            else:
+                float_val = float(str(value))
             
             # Range validation
             if min_val is not None and float_val < min_val:
@@ -297,34 +759,31 @@ if __name__ == "__main__":
     # Add parent directory to path for imports
     sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(__file__))))
     
-    from src.utils.config import Config
+    from src.utils.config import get_config
     
     try:
         # Initialize config and connector
-        config = Config()
+        config = get_config()
         connector = SheetsConnector(config)
         
-        # Test inventory reading
-        print("Testing inventory data reading...")
-        inventory_data = connector.read_inventory()
-        print(f"Found {len(inventory_data)} inventory items")
-        
-        if inventory_data:
-            print("\nSample inventory item:")
-            print(inventory_data[0])
-        
-        # Test transaction reading (last 30 days)
-        print("\nTesting transaction data reading...")
+        # Test inventory and transaction reading (last 30 days) in one request
+        print("Testing inventory and transaction data reading...")
         from datetime import datetime, timedelta
         
         end_date = datetime.now().date()
         start_date = end_date - timedelta(days=30)
         
-        transactions = connector.read_transactions(
+        inventory_data, transactions = connector.read_all(
             start_date.isoformat(), 
             end_date.isoformat()
         )
-        print(f"Found {len(transactions)} transactions in the last 30 days")
+        print(f"Found {len(inventory_data)} inventory items")
+        
+        if inventory_data:
+            print("\nSample inventory item:")
+            print(inventory_data[0])
+        
+        print(f"\nFound {len(transactions)} transactions in the last 30 days")
         
         if transactions:
             print("\nSample transaction:")
@@ -9,11 +9,17 @@ Version: 1.0.0
 """
 
 import os
+import atexit
 import csv
 import json
 import logging
+import threading
 import time
-from typing import Dict, Optional
+import uuid
+import weakref
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import requests
 from requests.adapters import HTTPAdapter
@@ -23,6 +29,44 @@ from urllib3.util.retry import Retry
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+
+def _uuid7() -> uuid.UUID:
+    """
+    Build a UUIDv7 (RFC 9562): a 48-bit Unix millisecond timestamp followed by
+    74 random bits, so IDs sort by creation millisecond and do not collide
+    within one. Uses ``uuid.uuid7`` where the standard library provides it.
+    """
+    ms = time.time_ns() // 1_000_000
+    rand = int.from_bytes(os.urandom(10), 'big')
+    value = (
+        (ms & 0xFFFF_FFFF_FFFF) << 80
+        | 0x7 << 76                          # version
+        | ((rand >> 62) & 0xFFF) << 64       # rand_a
+        | 0b10 << 62                         # RFC 4122 variant
+        | rand & 0x3FFF_FFFF_FFFF_FFFF       # rand_b
+    )
+    return uuid.UUID(int=value)
+
+
+if hasattr(uuid, 'uuid7'):
+    _uuid7 = uuid.uuid7
+
+
+# Demo-mode connectors still alive at interpreter exit; held weakly so the
+# exit hook does not keep every instance alive for the life of the process
+_live_connectors = weakref.WeakSet()
+
+
+@atexit.register
+def _close_live_connectors():
+    """Flush and close every demo-mode connector that is still alive."""
+    for connector in list(_live_connectors):
+        try:
+            connector.close()
+        except Exception as e:
+            logger.error(f"Failed to close supplier connector at exit: {e}")
+
+
 class SupplierConnector:
     """
     Connector for placing orders with suppliers.
@@ -30,6 +74,21 @@ class SupplierConnector:
     Supports both real API integration and simulation mode.
     """
     
+    # Column layout of the simulated orders CSV
+    ORDER_FIELDNAMES = ('order_id', 'vendor_id', 'sku', 'quantity', 'order_date',
+                        'estimated_delivery_date', 'status', 'lead_time_days')
+    
+    # Within a place_orders() batch, simulated orders are appended to the CSV in
+    # chunks of this size; every place_order()/place_orders() call flushes before returning
+    ORDER_FLUSH_THRESHOLD = 100
+    
+    # Upper bound on concurrent order placements in place_orders()
+    MAX_ORDER_WORKERS = 16
+    
+    # Pooled keep-alive connections per host; kept above MAX_ORDER_WORKERS so
+    # concurrent orders never wait on, or discard, a connection
+    HTTP_POOL_SIZE = 64
+    
     def __init__(self):
         """Initialize the supplier connector with configuration."""
         self.api_key = os.getenv('SUPPLIER_API_KEY')
@@ -52,25 +111,53 @@ class SupplierConnector:
             backoff_factor=1,
             status_forcelist=[429, 500, 502, 503, 504],
         )
-        adapter = HTTPAdapter(max_retries=retry_strategy)
+        adapter = HTTPAdapter(
+            pool_connections=self.HTTP_POOL_SIZE,
+            pool_maxsize=self.HTTP_POOL_SIZE,
+            max_retries=retry_strategy
+        )
         self.session.mount("http://", adapter)
         self.session.mount("https://", adapter)
         
+        # Lazily built {order_id: byte offset} index over the simulated orders CSV
+        self._order_index: Optional[Dict[str, int]] = None
+        self._order_index_stamp = None
+        self._order_columns: List[str] = []
+        
+        # Pending simulated orders and the long-lived append handle they are flushed to
+        self._order_buffer: List[tuple] = []
+        self._orders_fh = None
+        self._orders_writer = None
+        self._order_lock = threading.RLock()
+        
+        # Created on first place_orders() call
+        self._executor: Optional[ThreadPoolExecutor] = None
+        
+        # Resolved by _ensure_demo_directory() in demo mode
+        self._csv_path: Optional[str] = None
+        
         if self.demo_mode:
             logger.info("Supplier connector initialized in DEMO mode - orders will be simulated")
             self._ensure_demo_directory()
+            _live_connectors.add(self)
         else:
             logger.info("Supplier connector initialized in PRODUCTION mode")
     
     def _ensure_demo_directory(self):
-        """Ensure demo directory exists for simulation files."""
+        """Ensure demo directory exists and resolve the simulated orders CSV path once."""
         demo_dir = os.path.join(os.getcwd(), 'demo')
         os.makedirs(demo_dir, exist_ok=True)
+        self._csv_path = os.path.join(demo_dir, 'supplier_orders.csv')
     
     def _generate_order_id(self) -> str:
-        """Generate a unique order ID for simulation."""
-        timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-        return f"ORD_{timestamp}_{int(time.time() * 1000) % 10000:04d}"
+        """Generate a unique, time-ordered order ID for simulation."""
+        return f"ORD_{_uuid7().hex}"
+    
+    @staticmethod
+    @lru_cache(maxsize=1024)
+    def _normalize_vendor_id(vendor_id: str) -> str:
+        """Normalize a vendor ID to the lead-time table's key format (memoized)."""
+        return vendor_id.lower().replace(' ', '_').replace('-', '_')
     
     def _get_vendor_lead_time(self, vendor_id: str) -> int:
         """
@@ -82,11 +169,9 @@ class SupplierConnector:
         Returns:
             int: Lead time in days
         """
-        # Normalize vendor ID for lookup
-        normalized_id = vendor_id.lower().replace(' ', '_').replace('-', '_')
-        return self.vendor_lead_times.get(normalized_id, 7)  # Default 7 days
+        return self.vendor_lead_times.get(self._normalize_vendor_id(vendor_id), 7)  # Default 7 days
     
-    def _simulate_order(self, vendor_id: str, sku: str, qty: int) -> Dict:
+    def _simulate_order(self, vendor_id: str, sku: str, qty: int, flush: bool = True) -> Dict:
         """
         Simulate order placement by writing to CSV file.
         
@@ -94,6 +179,8 @@ class SupplierConnector:
             vendor_id: Vendor identifier
             sku: Product SKU
             qty: Quantity to order
+            flush: Write the order to the CSV before returning; batch callers
+                   pass False and call flush_orders() once at the end
             
         Returns:
             Dict: Simulated order response
@@ -102,45 +189,136 @@ class SupplierConnector:
         lead_time = self._get_vendor_lead_time(vendor_id)
         estimated_delivery = datetime.now() + timedelta(days=lead_time)
         
-        # Prepare order data
-        order_data = {
+        # Prepare order row in ORDER_FIELDNAMES order
+        order_row = (
+            order_id,
+            vendor_id,
+            sku,
+            qty,
+            datetime.now().isoformat(),
+            estimated_delivery.isoformat(),
+            'confirmed',
+            lead_time
+        )
+        
+        # Queue for the CSV; rows are appended by flush_orders()
+        with self._order_lock:
+            self._order_buffer.append(order_row)
+            if flush or len(self._order_buffer) >= self.ORDER_FLUSH_THRESHOLD:
+                self.flush_orders()
+        
+        logger.info(f"Simulated order {order_id} recorded for demo/supplier_orders.csv")
+        
+        return {
             'order_id': order_id,
-            'vendor_id': vendor_id,
-            'sku': sku,
-            'quantity': qty,
-            'order_date': datetime.now().isoformat(),
-            'estimated_delivery_date': estimated_delivery.isoformat(),
-            'status': 'confirmed',
-            'lead_time_days': lead_time
+            'estimated_delivery_date': estimated_delivery.strftime('%Y-%m-%d'),
+            'status': 'confirmed'
         }
+    
+    def flush_orders(self):
+        """
+        Append all buffered simulated orders to the demo CSV.
         
-        # Write to CSV file
-        csv_file = os.path.join('demo', 'supplier_orders.csv')
-        file_exists = os.path.exists(csv_file)
+        Rows go through a single append handle kept open for the connector's
+        lifetime; it is flushed to the OS after each batch but not fsynced.
         
-        try:
-            with open(csv_file, 'a', newline='') as f:
-                fieldnames = ['order_id', 'vendor_id', 'sku', 'quantity', 'order_date', 
-                             'estimated_delivery_date', 'status', 'lead_time_days']
-                writer = csv.DictWriter(f, fieldnames=fieldnames)
+        Raises:
+            Exception: If writing to the CSV fails
+        """
+        with self._order_lock:
+            if not self._order_buffer:
+                return
+            
+            csv_file = self._csv_path
+            
+            try:
+                if self._orders_fh is None:
+                    self._orders_fh = open(csv_file, 'a', newline='', buffering=1 << 16)
+                    self._orders_writer = csv.writer(self._orders_fh)
                 
-                # Write header if file is new
-                if not file_exists:
-                    writer.writeheader()
+                # Write header if file is new; checked on every flush because other
+                # connectors (webhook, agent) may append to the same file
+                write_header = os.fstat(self._orders_fh.fileno()).st_size == 0
+                if write_header:
+                    self._orders_writer.writerow(self.ORDER_FIELDNAMES)
                 
-                writer.writerow(order_data)
-            
-            logger.info(f"Simulated order {order_id} written to {csv_file}")
+                offsets = []
+                tell = self._orders_fh.tell
+                writerow = self._orders_writer.writerow
+                for order_row in self._order_buffer:
+                    offsets.append((order_row[0], tell()))
+                    writerow(order_row)
+                self._orders_fh.flush()
+                
+                self._index_written_orders(csv_file, offsets, write_header=write_header)
+                logger.info(f"Wrote {len(offsets)} simulated orders to {csv_file}")
+                self._order_buffer.clear()
             
-            return {
-                'order_id': order_id,
-                'estimated_delivery_date': estimated_delivery.strftime('%Y-%m-%d'),
-                'status': 'confirmed'
-            }
+            except Exception as e:
+                logger.error(f"Failed to write simulated orders to CSV: {e}")
+                raise
+
+    def close(self):
+        """Flush pending simulated orders and release the CSV handle and worker pool."""
+        with self._order_lock:
+            self.flush_orders()
+            if self._orders_fh is not None:
+                self._orders_fh.close()
+                self._orders_fh = None
+                self._orders_writer = None
+        
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+    
+    def _load_order_index(self, csv_file: str) -> Dict[str, int]:
+        """
+        Return the {order_id: byte offset} index for the simulated orders CSV.
+        
+        The index is built on first use and rebuilt only when the file's
+        size or modification time no longer matches the last indexed state.
+        
+        Args:
+            csv_file: Path to the simulated orders CSV
             
-        except Exception as e:
-            logger.error(f"Failed to write simulated order to CSV: {e}")
-            raise
+        Returns:
+            Dict mapping order IDs to the offset of their row
+        """
+        stat = os.stat(csv_file)
+        stamp = (stat.st_mtime_ns, stat.st_size)
+        if self._order_index is not None and self._order_index_stamp == stamp:
+            return self._order_index
+        
+        index = {}
+        with open(csv_file, 'r', newline='') as f:
+            self._order_columns = next(csv.reader([f.readline()]), [])
+            id_pos = self._order_columns.index('order_id')
+            while True:
+                offset = f.tell()
+                line = f.readline()
+                if not line:
+                    break
+                row = next(csv.reader([line]), None)
+                if row and len(row) > id_pos:
+                    index[row[id_pos]] = offset
+        
+        self._order_index = index
+        self._order_index_stamp = stamp
+        return index
+    
+    def _index_written_orders(self, csv_file: str, offsets: List[tuple], write_header: bool):
+        """Record freshly appended orders in the index so it is not rebuilt from disk."""
+        if self._order_index is None:
+            return
+        
+        if write_header:
+            # A new file starts with the header row; drop the stale index instead
+            self._order_index = None
+            return
+        
+        stat = os.stat(csv_file)
+        self._order_index.update(offsets)
+        self._order_index_stamp = (stat.st_mtime_ns, stat.st_size)
     
     def _place_real_order(self, vendor_id: str, sku: str, qty: int) -> Dict:
         """
@@ -206,6 +384,10 @@ class SupplierConnector:
             ValueError: If input parameters are invalid
             Exception: If order placement fails after retries
         """
+        return self._place_order(vendor_id, sku, qty, flush=True)
+    
+    def _place_order(self, vendor_id: str, sku: str, qty: int, flush: bool) -> Dict:
+        """Validate and place one order; ``flush`` is passed on to _simulate_order."""
         # Input validation
         if not vendor_id or not isinstance(vendor_id, str):
             raise ValueError("vendor_id must be a non-empty string")
@@ -220,7 +402,7 @@ class SupplierConnector:
         
         try:
             if self.demo_mode:
-                return self._simulate_order(vendor_id, sku, qty)
+                return self._simulate_order(vendor_id, sku, qty, flush=flush)
             else:
                 return self._place_real_order(vendor_id, sku, qty)
                 
@@ -228,6 +410,41 @@ class SupplierConnector:
             logger.error(f"Failed to place order after retries: {e}")
             raise
     
+    def place_orders(self, orders: List[Tuple[str, str, int]]) -> List[Dict]:
+        """
+        Place several orders concurrently.
+        
+        Each order is placed through place_order() on a worker pool owned by
+        the connector. The shared requests.Session is safe for concurrent
+        requests of this kind; demo-mode CSV writes are serialized by a lock,
+        and the batch's simulated orders are flushed to the CSV before returning.
+        
+        Args:
+            orders: (vendor_id, sku, qty) tuples
+            
+        Returns:
+            List[Dict]: Order responses, in the same order as ``orders``
+            
+        Raises:
+            ValueError: If any order's parameters are invalid
+            Exception: If any order placement fails after retries
+        """
+        if not orders:
+            return []
+        
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.MAX_ORDER_WORKERS,
+                thread_name_prefix="supplier-order"
+            )
+        
+        try:
+            return list(self._executor.map(lambda order: self._place_order(*order, flush=False), orders))
+        finally:
+            # Persist whatever was placed, even if another order in the batch failed
+            if self.demo_mode:
+                self.flush_orders()
+    
     def get_order_status(self, order_id: str) -> Dict:
         """
         Get status of an existing order.
@@ -239,26 +456,30 @@ class SupplierConnector:
             Dict: Order status information
         """
         if self.demo_mode:
-            # In demo mode, read from CSV
-            csv_file = os.path.join('demo', 'supplier_orders.csv')
+            # In demo mode, read from CSV (including any still-buffered orders)
+            self.flush_orders()
+            csv_file = self._csv_path
             if not os.path.exists(csv_file):
                 raise ValueError(f"Order {order_id} not found")
             
             try:
-                with open(csv_file, 'r') as f:
-                    reader = csv.DictReader(f)
-                    for row in reader:
-                        if row['order_id'] == order_id:
-                            return {
-                                'order_id': row['order_id'],
-                                'status': row['status'],
-                                'estimated_delivery_date': row['estimated_delivery_date'],
-                                'vendor_id': row['vendor_id'],
-                                'sku': row['sku'],
-                                'quantity': int(row['quantity'])
-                            }
-                    
-                raise ValueError(f"Order {order_id} not found")
+                with self._order_lock:
+                    offset = self._load_order_index(csv_file).get(order_id)
+                if offset is None:
+                    raise ValueError(f"Order {order_id} not found")
+                
+                with open(csv_file, 'r', newline='') as f:
+                    f.seek(offset)
+                    row = dict(zip(self._order_columns, next(csv.reader([f.readline()]))))
+                
+                return {
+                    'order_id': row['order_id'],
+                    'status': row['status'],
+                    'estimated_delivery_date': row['estimated_delivery_date'],
+                    'vendor_id': row['vendor_id'],
+                    'sku': row['sku'],
+                    'quantity': int(row['quantity'])
+                }
                 
             except Exception as e:
                 logger.error(f"Failed to read order status from CSV: {e}")
@@ -326,13 +547,14 @@ if __name__ == "__main__":
     if connector.demo_mode:
         print("\n=== Simulation Behavior ===")
         print("- Orders are written to demo/supplier_orders.csv")
-        print("- Order IDs are generated with timestamp and random suffix")
+        print("- Order IDs are time-ordered UUIDv7 values")
         print("- Delivery dates calculated using vendor-specific lead times:")
         for vendor, days in connector.vendor_lead_times.items():
             print(f"  * {vendor}: {days} days")
         print("- All simulated orders have 'confirmed' status")
         
         # Show CSV file if it exists
+        connector.flush_orders()
         csv_file = os.path.join('demo', 'supplier_orders.csv')
         if os.path.exists(csv_file):
             print(f"\nCurrent contents of {csv_file}:")
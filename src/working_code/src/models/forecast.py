@@ -7,24 +7,229 @@ This module provides baseline forecasting capabilities including:
 - Stockout timeline estimation
 """
 
-from datetime import datetime, timedelta
-from typing import List, Dict, Optional, Union
+from datetime import datetime, timezone
+from itertools import islice
+from typing import Iterable, List, Dict, Optional, Union
 import logging
+import math
+
+import numpy as np
+import pandas as pd
+from pandas.api.types import union_categoricals
 
 logger = logging.getLogger(__name__)
 
+# Days until stockout when there is no usage
+_INF = math.inf
+
+# Sentinel for absent keys in validate_transaction_data
+_MISSING = object()
+
+
+class _UsageTable:
+    """
+    Per-SKU cumulative usage stored as flat, SKU-coded arrays.
+    
+    Valid rows are sorted by (SKU code, timestamp) so each SKU owns the
+    contiguous slice offsets[code]:offsets[code + 1]. running holds the
+    cumulative positive usage over that order with a leading zero, so the
+    usage for any SKU and cutoff is one searchsorted and one subtraction.
+    """
+    
+    __slots__ = ('codes', 'offsets', 'dates', 'running', 'invalid_counts')
+    
+    def __init__(self, codes: Dict[str, int], offsets: np.ndarray, dates: np.ndarray,
+                 running: np.ndarray, invalid_counts: Dict[str, int]):
+        self.codes = codes
+        self.offsets = offsets
+        self.dates = dates
+        self.running = running
+        self.invalid_counts = invalid_counts
+    
+    def window_total(self, sku: str, cutoff_s: int) -> Optional[float]:
+        """Return usage at or after cutoff_s, or None if the SKU is unknown."""
+        code = self.codes.get(sku)
+        if code is None:
+            return None
+        lo = int(self.offsets[code])
+        hi = int(self.offsets[code + 1])
+        start = lo + int(self.dates[lo:hi].searchsorted(cutoff_s, side='left'))
+        return float(self.running[hi] - self.running[start])
+
 
-def compute_daily_average(transactions: List[Dict], sku: str, window_days: int = 90) -> float:
+class TransactionStore:
+    """
+    Columnar (struct-of-arrays) view of a transaction history.
+    
+    Each field lives in its own array instead of a dict per row, so filters
+    and sums run as numpy operations over contiguous memory. Rows whose date
+    or quantity cannot be parsed hold NaT/NaN rather than raising.
+    
+    Attributes:
+        sku: Categorical of SKUs (missing SKUs have code -1)
+        qty: Quantities as float64
+        date: Timestamps as timezone-naive UTC datetime64[s]
+    """
+    
+    __slots__ = ('sku', 'qty', 'date', '_usage')
+    
+    # Rows converted per chunk in from_dicts; bounds the temporary per-field
+    # Python lists, so an iterator of transactions is never fully materialized
+    CHUNK_ROWS = 50000
+    
+    def __init__(self, sku: pd.Categorical, qty: np.ndarray, date: np.ndarray):
+        """
+        Initialize the store from already-columnar data.
+        
+        Args:
+            sku: Categorical of SKUs
+            qty: Quantity array
+            date: datetime64 array in UTC
+        """
+        self.sku = sku
+        self.qty = qty
+        self.date = date
+        self._usage: Optional[_UsageTable] = None
+    
+    @classmethod
+    def from_dicts(cls, transactions: Iterable[Dict], chunk_rows: Optional[int] = None) -> 'TransactionStore':
+        """
+        Build a store from transaction dictionaries.
+        
+        The input is consumed in chunks of chunk_rows, each converted to
+        compact arrays before the next is read, so a generator over a large
+        history streams through without a full list of dicts in memory.
+        
+        Args:
+            transactions: Iterable of dictionaries with 'sku', 'quantity' and
+                          'date' (datetime or ISO string; values without a
+                          timezone are treated as UTC)
+            chunk_rows: Rows per chunk (default: CHUNK_ROWS)
+        
+        Returns:
+            TransactionStore over the same rows, in the same order
+        """
+        chunk_rows = chunk_rows or cls.CHUNK_ROWS
+        rows = iter(transactions)
+        
+        parts = []
+        while True:
+            chunk = list(islice(rows, chunk_rows))
+            if chunk or not parts:
+                parts.append(cls._from_chunk(chunk))
+            if len(chunk) < chunk_rows:
+                break
+        
+        if len(parts) == 1:
+            return parts[0]
+        # A chunk's categories take their dtype from its own SKUs (str, int64,
+        # or float64 when all are None), and union_categoricals needs one
+        # dtype; object holds every SKU value unchanged
+        return cls(
+            sku=union_categoricals([
+                pd.Categorical.from_codes(part.sku.codes, categories=part.sku.categories.astype(object))
+                for part in parts
+            ]),
+            qty=np.concatenate([part.qty for part in parts]),
+            date=np.concatenate([part.date for part in parts]),
+        )
+    
+    @classmethod
+    def _from_chunk(cls, transactions: List[Dict]) -> 'TransactionStore':
+        """Convert one in-memory chunk of transaction dictionaries."""
+        dates = pd.to_datetime(
+            pd.Series([t.get('date') for t in transactions], dtype=object),
+            utc=True, format='ISO8601', errors='coerce'
+        )
+        quantities = pd.to_numeric(
+            pd.Series([t.get('quantity', 0) for t in transactions], dtype=object),
+            errors='coerce'
+        )
+        return cls(
+            sku=pd.Categorical([t.get('sku') for t in transactions]),
+            qty=quantities.to_numpy(dtype=np.float64, na_value=np.nan),
+            date=dates.dt.tz_convert(None).to_numpy(dtype='datetime64[s]'),
+        )
+    
+    def __len__(self) -> int:
+        return len(self.qty)
+    
+    def usage_table(self) -> '_UsageTable':
+        """Return the cumulative usage table, building it on first use."""
+        if self._usage is None:
+            self._usage = _build_usage_table(self)
+        return self._usage
+
+
+def _build_usage_table(store: TransactionStore) -> _UsageTable:
+    """
+    Build the cumulative usage table for a transaction store.
+    
+    Args:
+        store: TransactionStore to index
+    
+    Returns:
+        _UsageTable over the store's parseable rows
+    """
+    sku_codes = store.sku.codes.astype(np.int32)
+    categories = store.sku.categories
+    parsed = ~np.isnat(store.date) & ~np.isnan(store.qty)
+    
+    invalid_per_code = np.bincount(sku_codes[~parsed & (sku_codes >= 0)], minlength=len(categories))
+    invalid_counts = {categories[code]: int(invalid_per_code[code])
+                      for code in np.flatnonzero(invalid_per_code)}
+    
+    # Rows without a SKU (code -1) are dropped along with the unparseable ones
+    keep = parsed & (sku_codes >= 0)
+    sku_codes = sku_codes[keep]
+    dates = store.date.view('int64')[keep]
+    usage = np.clip(store.qty[keep], 0.0, None)
+    
+    order = np.lexsort((dates, sku_codes))
+    sku_codes = sku_codes[order]
+    offsets = np.searchsorted(sku_codes, np.arange(len(categories) + 1, dtype=np.int32), side='left')
+    running = np.concatenate(([0.0], np.cumsum(usage[order])))
+    
+    return _UsageTable({sku: code for code, sku in enumerate(categories)},
+                       offsets, dates[order], running, invalid_counts)
+
+
+def _as_store(transactions: Union[Iterable[Dict], TransactionStore]) -> TransactionStore:
+    """
+    Return a TransactionStore for a store, a list or any iterable of dictionaries.
+    
+    Lists and iterables are converted on every call; callers evaluating many
+    SKUs against the same history should build a TransactionStore once and
+    pass it in (as ReorderPolicy.batch_evaluate_reorders does).
+    """
+    if isinstance(transactions, TransactionStore):
+        return transactions
+    return TransactionStore.from_dicts(transactions)
+
+
+def _window_cutoff(window_days: int, now: Optional[datetime] = None) -> int:
+    """Return the start of a look-back window ending at now as UTC epoch seconds."""
+    end = pd.Timestamp(now if now is not None else datetime.now(timezone.utc))
+    if end.tzinfo is None:
+        end = end.tz_localize('UTC')
+    return (end - pd.Timedelta(days=window_days)).value // 1_000_000_000
+
+
+def compute_daily_average(transactions: Union[Iterable[Dict], TransactionStore], sku: str, window_days: int = 90, *,
+                          now: Optional[datetime] = None) -> float:
     """
     Compute average daily usage for a SKU based on transaction history.
     
     Args:
-        transactions: List of transaction dictionaries with keys:
+        transactions: TransactionStore, or list/iterable of transaction dictionaries with keys:
                      - 'sku': Product SKU
                      - 'quantity': Quantity used (positive number)
-                     - 'date': Transaction date (datetime or ISO string)
+                     - 'date': Transaction date (datetime or ISO string;
+                       values without a timezone are treated as UTC)
         sku: SKU to analyze
         window_days: Number of days to look back for analysis (default: 90)
+        now: End of the window (default: current UTC time); naive values
+             are treated as UTC
     
     Returns:
         Average daily usage as a float. Returns 0.0 if no transactions found.
@@ -38,53 +243,61 @@ def compute_daily_average(transactions: List[Dict], sku: str, window_days: int =
         0.83  # (10 + 15) / 30 days
     """
     if not transactions:
-        logger.warning(f"No transactions provided for SKU {sku}")
+        logger.warning("No transactions provided for SKU %s", sku)
         return 0.0
     
-    # Filter transactions for the specific SKU
-    sku_transactions = [t for t in transactions if t.get('sku') == sku]
+    table = _as_store(transactions).usage_table()
+    total_usage = table.window_total(sku, _window_cutoff(window_days, now))
+    invalid = table.invalid_counts.get(sku, 0)
     
-    if not sku_transactions:
-        logger.warning(f"No transactions found for SKU {sku}")
+    if total_usage is None and not invalid:
+        logger.warning("No transactions found for SKU %s", sku)
         return 0.0
     
-    # Calculate cutoff date
-    cutoff_date = datetime.now() - timedelta(days=window_days)
-    
-    # Filter transactions within the window and sum quantities
-    total_usage = 0.0
-    valid_transactions = 0
-    
-    for transaction in sku_transactions:
-        try:
-            # Handle both datetime objects and string dates
-            if isinstance(transaction['date'], str):
-                trans_date = datetime.fromisoformat(transaction['date'].replace('Z', '+00:00'))
-            else:
-                trans_date = transaction['date']
-            
-            # Only include transactions within the window
-            if trans_date >= cutoff_date:
-                quantity = float(transaction.get('quantity', 0))
-                if quantity > 0:  # Only count positive usage
-                    total_usage += quantity
-                    valid_transactions += 1
-                    
-        except (ValueError, TypeError, KeyError) as e:
-            logger.warning(f"Skipping invalid transaction for SKU {sku}: {e}")
-            continue
+    if invalid:
+        logger.warning("Skipping %d invalid transaction(s) for SKU %s", invalid, sku)
     
-    if valid_transactions == 0:
-        logger.info(f"No valid transactions found for SKU {sku} in the last {window_days} days")
+    # Only positive usage is accumulated, so a zero total means nothing valid
+    if not total_usage:
+        logger.info("No valid transactions found for SKU %s in the last %s days", sku, window_days)
         return 0.0
     
     # Calculate average daily usage
     avg_daily = total_usage / window_days
     
-    logger.info(f"SKU {sku}: {total_usage} total usage over {window_days} days = {avg_daily:.2f} avg daily")
+    logger.info("SKU %s: %s total usage over %s days = %.2f avg daily", sku, total_usage, window_days, avg_daily)
     return avg_daily
 
 
+def compute_daily_average_batch(transactions: Union[Iterable[Dict], TransactionStore], skus: Iterable[str],
+                                window_days: int = 90, *,
+                                now: Optional[datetime] = None) -> pd.Series:
+    """
+    Compute average daily usage for many SKUs from one shared usage table.
+    
+    Args:
+        transactions: TransactionStore or list/iterable of transaction
+                      dictionaries (see compute_daily_average)
+        skus: SKUs to analyze
+        window_days: Number of days to look back for analysis (default: 90)
+        now: End of the window (default: current UTC time, read once for
+             all SKUs)
+    
+    Returns:
+        Series of average daily usage indexed by SKU, 0.0 for SKUs with no
+        usage in the window
+    """
+    skus = list(skus)
+    if not transactions:
+        return pd.Series(0.0, index=skus, dtype=float)
+    
+    table = _as_store(transactions).usage_table()
+    cutoff_s = _window_cutoff(window_days, now)
+    
+    totals = [table.window_total(sku, cutoff_s) or 0.0 for sku in skus]
+    return pd.Series(totals, index=skus, dtype=float) / window_days
+
+
 def forecast_weekly_demand(avg_daily_usage: float) -> float:
     """
     Forecast weekly demand based on average daily usage.
@@ -100,11 +313,11 @@ def forecast_weekly_demand(avg_daily_usage: float) -> float:
         17.5
     """
     if avg_daily_usage < 0:
-        logger.warning(f"Negative daily usage provided: {avg_daily_usage}, treating as 0")
+        logger.warning("Negative daily usage provided: %s, treating as 0", avg_daily_usage)
         avg_daily_usage = 0.0
     
     weekly_demand = avg_daily_usage * 7
-    logger.debug(f"Weekly demand forecast: {avg_daily_usage} daily * 7 = {weekly_demand}")
+    logger.debug("Weekly demand forecast: %s daily * 7 = %s", avg_daily_usage, weekly_demand)
     
     return weekly_demand
 
@@ -119,7 +332,7 @@ def estimate_days_until_stockout(on_hand: Union[int, float], avg_daily: float) -
     
     Returns:
         Estimated days until stockout as a float.
-        Returns float('inf') if avg_daily is 0 or negative.
+        Returns math.inf if avg_daily is 0 or negative.
         Returns 0.0 if on_hand is 0 or negative.
     
     Example:
@@ -132,63 +345,120 @@ def estimate_days_until_stockout(on_hand: Union[int, float], avg_daily: float) -
     """
     # Handle edge cases
     if on_hand <= 0:
-        logger.warning(f"On-hand inventory is {on_hand}, stockout imminent")
+        logger.warning("On-hand inventory is %s, stockout imminent", on_hand)
         return 0.0
     
     if avg_daily <= 0:
-        logger.info(f"Average daily usage is {avg_daily}, no stockout expected")
-        return float('inf')
+        logger.info("Average daily usage is %s, no stockout expected", avg_daily)
+        return _INF
     
-    days_until_stockout = float(on_hand) / avg_daily
+    # True division already yields a float for int or float on_hand
+    days_until_stockout = on_hand / avg_daily
     
-    logger.debug(f"Stockout estimate: {on_hand} on hand / {avg_daily} daily = {days_until_stockout:.1f} days")
+    logger.debug("Stockout estimate: %s on hand / %s daily = %.1f days", on_hand, avg_daily, days_until_stockout)
     
     return days_until_stockout
 
 
+def estimate_days_until_stockout_batch(on_hand: np.ndarray, avg_daily: np.ndarray) -> np.ndarray:
+    """
+    Vectorized estimate_days_until_stockout over whole-inventory arrays.
+    
+    Args:
+        on_hand: Current inventory quantities, one per item
+        avg_daily: Average daily usage rates, aligned with on_hand
+    
+    Returns:
+        float64 array of days until stockout with the scalar function's edge
+        cases: 0.0 where on_hand <= 0, otherwise math.inf where avg_daily <= 0.
+    """
+    on_hand = np.asarray(on_hand, dtype=np.float64)
+    avg_daily = np.asarray(avg_daily, dtype=np.float64)
+    with np.errstate(divide='ignore', invalid='ignore'):
+        days = np.where(avg_daily > 0, on_hand / avg_daily, _INF)
+    return np.where(on_hand <= 0, 0.0, days)
+
+
 # Helper function for data validation
-def validate_transaction_data(transactions: List[Dict]) -> List[str]:
+def validate_transaction_data(transactions: Union[List[Dict], TransactionStore], *,
+                              strict: bool = False, max_errors: Optional[int] = None) -> List[str]:
     """
     Validate transaction data format and return list of validation errors.
     
     Args:
-        transactions: List of transaction dictionaries
+        transactions: List of transaction dictionaries, or a TransactionStore
+                      (whose unparseable values are already NaN/NaT)
+        strict: Stop at the first error (for reject-if-malformed checks)
+        max_errors: Stop after this many errors when not strict (default: report all)
     
     Returns:
         List of validation error messages (empty if all valid)
     """
+    limit = 1 if strict else max_errors
     errors = []
     
+    if isinstance(transactions, TransactionStore):
+        missing_sku = transactions.sku.codes < 0
+        bad_qty = np.isnan(transactions.qty)
+        bad_date = np.isnat(transactions.date)
+        for i in np.flatnonzero(missing_sku | bad_qty | bad_date):
+            if limit is not None and len(errors) >= limit:
+                break
+            if missing_sku[i]:
+                errors.append(f"Transaction {i} missing required field: sku")
+            if bad_qty[i]:
+                errors.append(f"Transaction {i} has invalid quantity")
+            if bad_date[i]:
+                errors.append(f"Transaction {i} has invalid date format")
+        return errors[:limit]
+    
     if not isinstance(transactions, list):
         errors.append("Transactions must be a list")
         return errors
     
-    required_fields = ['sku', 'quantity', 'date']
+    # Parse every string date in one vectorized call; failures come back as NaT
+    date_rows = [
+        i for i, transaction in enumerate(transactions)
+        if isinstance(transaction, dict) and isinstance(transaction.get('date'), str)
+    ]
+    parsed_dates = pd.to_datetime(
+        pd.Series([transactions[i]['date'] for i in date_rows], dtype=object),
+        utc=True, format='ISO8601', errors='coerce'
+    )
+    bad_dates = {date_rows[j] for j in np.flatnonzero(parsed_dates.isna().to_numpy())}
     
     for i, transaction in enumerate(transactions):
+        if limit is not None and len(errors) >= limit:
+            break
+        
         if not isinstance(transaction, dict):
             errors.append(f"Transaction {i} must be a dictionary")
             continue
         
-        for field in required_fields:
-            if field not in transaction:
-                errors.append(f"Transaction {i} missing required field: {field}")
+        # One lookup per field; a key present with a None value is not "missing"
+        sku = transaction.get('sku', _MISSING)
+        quantity = transaction.get('quantity', _MISSING)
+        date = transaction.get('date', _MISSING)
+        
+        if sku is _MISSING:
+            errors.append(f"Transaction {i} missing required field: sku")
+        if quantity is _MISSING:
+            errors.append(f"Transaction {i} missing required field: quantity")
+        if date is _MISSING:
+            errors.append(f"Transaction {i} missing required field: date")
         
         # Validate quantity is numeric
-        if 'quantity' in transaction:
+        if quantity is not _MISSING and not isinstance(quantity, (int, float)):
             try:
-                float(transaction['quantity'])
+                float(quantity)
             except (ValueError, TypeError):
-                errors.append(f"Transaction {i} has invalid quantity: {transaction['quantity']}")
+                errors.append(f"Transaction {i} has invalid quantity: {quantity}")
         
         # Validate date format
-        if 'date' in transaction and isinstance(transaction['date'], str):
-            try:
-                datetime.fromisoformat(transaction['date'].replace('Z', '+00:00'))
-            except ValueError:
-                errors.append(f"Transaction {i} has invalid date format: {transaction['date']}")
+        if i in bad_dates:
+            errors.append(f"Transaction {i} has invalid date format: {date}")
     
-    return errors
+    return errors[:limit]
 
 
 if __name__ == "__main__":
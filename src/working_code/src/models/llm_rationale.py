@@ -9,16 +9,86 @@ Version: 1.0.0
 """
 
 import os
+import asyncio
+import hashlib
 import json
 import logging
-from typing import Dict, List, Optional
+import time
+from functools import lru_cache
+from typing import Callable, Dict, List, Optional, Tuple
 from datetime import datetime, timedelta
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+try:
+    import orjson
+except ImportError:  # stdlib json is used when orjson is not installed
+    orjson = None
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Shared keep-alive session so consecutive rationale calls reuse the TLS
+# connection to the provider instead of reconnecting per SKU
+_SESSION = requests.Session()
+_SESSION.mount("https://", HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=16,
+    max_retries=Retry(
+        total=2,
+        backoff_factor=1,
+        status_forcelist=[429, 500, 502, 503, 504],
+        allowed_methods=frozenset({"POST"}),
+        raise_on_status=False,
+    ),
+))
+
+
+# Deterministic fallback text, formatted from the fields built in _deterministic_rationale
+_FALLBACK_PARAGRAPH_TMPL = (
+    "Item {sku} requires immediate reordering due to low stock levels. "
+    "With only {on_hand} units remaining and weekly demand of {weekly_demand} units, "
+    "stockout is predicted for {stockout_date}. "
+    "The recommended vendor offers optimal cost-efficiency for this replenishment."
+)
+_FALLBACK_BULLET_TMPLS = (
+    "Current stock ({on_hand} units) is insufficient for projected demand",
+    "Weekly consumption rate of {weekly_demand} units indicates rapid depletion",
+    "Stockout risk identified for {stockout_date}",
+    "Selected vendor provides best total cost optimization: {vendor_info}",
+)
+_FALLBACK_VENDOR_TMPL = "{vendor_name} (EOQ: {eoq} units, Total Cost: ${total_cost:.2f})"
+
+
+def _json_loads(data):
+    """Parse JSON text or bytes, with orjson when available."""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+def _json_dumps(obj, indent: bool = False) -> str:
+    """Serialize to a JSON string, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2 if indent else 0).decode('utf-8')
+    return json.dumps(obj, indent=2 if indent else None)
+
+
+# Rationale requests in flight at once for generate_rationale_batch when
+# LLM_CONCURRENCY is unset; keep it within the provider's rate limit
+DEFAULT_RATIONALE_CONCURRENCY = 4
+
+
+@lru_cache(maxsize=8)
+def _auth_headers(api_key: str) -> Dict[str, str]:
+    """Return the request headers for an API key, built once per key."""
+    return {
+        'Authorization': f'Bearer {api_key}',
+        'Content-Type': 'application/json'
+    }
+
 # Explicit prompt template for transparency
 RATIONALE_PROMPT_TEMPLATE = """
 You are an inventory management expert analyzing a reorder decision. Based on the provided context, generate a clear rationale explaining why this item needs reordering.
@@ -42,7 +112,105 @@ Format your response as JSON:
 }}
 """
 
-def call_llm(prompt: str) -> str:
+# Bound formatter for the prompt, so each call skips the attribute lookup
+# and the keyword-argument dict that .format(**kwargs) builds
+_format_prompt = RATIONALE_PROMPT_TEMPLATE.format_map
+
+# Seconds a cached rationale stays valid when RATIONALE_CACHE_TTL is unset
+DEFAULT_RATIONALE_CACHE_TTL = 24 * 60 * 60
+
+# Rationales parsed from real LLM responses, keyed by _rationale_cache_key,
+# as (time stored, rationale)
+_RATIONALE_CACHE: Dict[str, Tuple[float, Dict]] = {}
+
+
+def _rationale_cache_ttl() -> float:
+    """Return the rationale cache lifetime in seconds (0 or less disables caching)."""
+    return float(os.getenv('RATIONALE_CACHE_TTL', DEFAULT_RATIONALE_CACHE_TTL))
+
+
+def _rationale_cache_dir() -> str:
+    """Return the directory rationales persist to; unset or empty keeps them in memory only."""
+    return os.getenv('RATIONALE_CACHE_DIR', '')
+
+
+def _active_provider() -> str:
+    """Name the provider _call_providers will try first, from the configured API keys."""
+    if os.getenv('GROQ_API_KEY'):
+        return 'groq'
+    if os.getenv('OPENAI_API_KEY'):
+        return 'openai'
+    return ''
+
+
+def _rationale_cache_key(prompt: str) -> str:
+    """Hash the formatted prompt, provider and model into a stable cache key."""
+    material = "\n".join((
+        os.getenv('LLM_PROVIDER', ''),
+        _active_provider(),
+        os.getenv('LLM_MODEL', ''),
+        prompt
+    )).encode('utf-8')
+    return hashlib.blake2b(material, digest_size=20).hexdigest()
+
+
+def _copy_rationale(rationale: Dict) -> Dict:
+    """Return a copy so callers cannot mutate a cached rationale."""
+    return dict(rationale, bullets=list(rationale['bullets']))
+
+
+def _load_cached_rationale(key: str) -> Optional[Dict]:
+    """Return an unexpired cached rationale from memory or disk, or None on a miss."""
+    ttl = _rationale_cache_ttl()
+    if ttl <= 0:
+        return None
+    now = time.time()
+    
+    entry = _RATIONALE_CACHE.get(key)
+    if entry is not None and now - entry[0] >= ttl:
+        del _RATIONALE_CACHE[key]
+        entry = None
+    if entry is None:
+        cache_dir = _rationale_cache_dir()
+        if not cache_dir:
+            return None
+        try:
+            with open(os.path.join(cache_dir, f"{key}.json"), "rb") as f:
+                # The file's modification time is when it was stored
+                stored_at = os.fstat(f.fileno()).st_mtime
+                if now - stored_at >= ttl:
+                    return None
+                rationale = _json_loads(f.read())
+        except (OSError, ValueError):
+            return None
+        if not isinstance(rationale, dict) or not isinstance(rationale.get('bullets'), list) or 'paragraph' not in rationale:
+            return None
+        entry = _RATIONALE_CACHE[key] = (stored_at, rationale)
+    return _copy_rationale(entry[1])
+
+
+def _store_cached_rationale(key: str, rationale: Dict):
+    """Cache a rationale in memory and, when enabled, on disk for later runs."""
+    if _rationale_cache_ttl() <= 0:
+        return
+    _RATIONALE_CACHE[key] = (time.time(), _copy_rationale(rationale))
+    
+    cache_dir = _rationale_cache_dir()
+    if not cache_dir:
+        return
+    path = os.path.join(cache_dir, f"{key}.json")
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        tmp_path = f"{path}.{os.getpid()}.tmp"
+        with open(tmp_path, "w", encoding="utf-8") as f:
+            f.write(_json_dumps(rationale))
+        os.replace(tmp_path, path)
+    except OSError as e:
+        logger.debug("Could not persist rationale cache entry: %s", e)
+
+
+def call_llm(prompt: str, context: Optional[Dict] = None,
+             on_delta: Optional[Callable[[str], None]] = None) -> str:
     """
     Call LLM service with fallback to deterministic response.
     
@@ -51,18 +219,86 @@ def call_llm(prompt: str) -> str:
     
     Args:
         prompt: The prompt to send to the LLM
+        context: Fields the prompt was formatted from, used by the
+            deterministic fallback
+        on_delta: Called with each streamed chunk of LLM text as it arrives
         
     Returns:
         str: LLM response or deterministic fallback
     """
+    llm_response = _call_providers(prompt, on_delta)
+    if llm_response is not None:
+        return llm_response
+    
+    # Deterministic fallback
+    logger.info("Using deterministic fallback for LLM rationale generation")
+    return _generate_deterministic_rationale(context or {})
+
+def _read_streamed_completion(response: requests.Response,
+                              on_delta: Optional[Callable[[str], None]] = None) -> str:
+    """
+    Concatenate the content deltas of a streamed chat completion.
+    
+    Both providers stream server-sent events of the form ``data: {json}``
+    ending with ``data: [DONE]``. Events that are not valid JSON are skipped.
+    Reading stops early if the text does not open with a JSON object, since
+    generate_rationale would reject it anyway.
+    
+    Args:
+        response: Streaming response from the chat completions endpoint
+        on_delta: Called with each chunk of text as it arrives
+        
+    Returns:
+        str: The (possibly truncated) completion text
+    """
+    parts = []
+    opened = False
+    for line in response.iter_lines(decode_unicode=True):
+        if not line or not line.startswith('data:'):
+            continue
+        data = line[5:].strip()
+        if data == '[DONE]':
+            break
+        
+        try:
+            choices = _json_loads(data).get('choices') or [{}]
+        except (ValueError, AttributeError):
+            logger.debug("Skipping malformed stream event: %s", data)
+            continue
+        delta = (choices[0].get('delta') or {}).get('content')
+        if not delta:
+            continue
+        
+        parts.append(delta)
+        if on_delta is not None:
+            on_delta(delta)
+        
+        if not opened:
+            text = ''.join(parts).lstrip()
+            if text:
+                if text[0] != '{':
+                    logger.warning("LLM response is not a JSON object, stopping stream early")
+                    break
+                opened = True
+    
+    return ''.join(parts).strip()
+
+def _call_providers(prompt: str, on_delta: Optional[Callable[[str], None]] = None) -> Optional[str]:
+    """
+    Send the prompt to the first configured LLM provider that answers.
+    
+    Args:
+        prompt: The prompt to send to the LLM
+        on_delta: Called with each streamed chunk of LLM text as it arrives
+        
+    Returns:
+        str: Raw LLM response, or None if no provider produced one
+    """
     # Try Groq first
     groq_key = os.getenv('GROQ_API_KEY')
     if groq_key:
         try:
-            headers = {
-                'Authorization': f'Bearer {groq_key}',
-                'Content-Type': 'application/json'
-            }
+            headers = _auth_headers(groq_key)
             
             model = os.getenv('LLM_MODEL', 'llama-3.3-70b-versatile')
             
@@ -73,33 +309,30 @@ def call_llm(prompt: str) -> str:
                     {'role': 'user', 'content': prompt}
                 ],
                 'max_tokens': 500,
-                'temperature': 0.3
+                'temperature': 0.3,
+                'stream': True
             }
             
-            response = requests.post(
+            with _SESSION.post(
                 'https://api.groq.com/openai/v1/chat/completions',
                 headers=headers,
                 json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result['choices'][0]['message']['content'].strip()
-            else:
-                logger.warning(f"Groq API error: {response.status_code}")
+                timeout=30,
+                stream=True
+            ) as response:
+                if response.status_code == 200:
+                    return _read_streamed_completion(response, on_delta)
+                else:
+                    logger.warning("Groq API error: %s", response.status_code)
                 
         except Exception as e:
-            logger.warning(f"Groq API call failed: {e}")
+            logger.warning("Groq API call failed: %s", e)
     
     # Try OpenAI as fallback
     openai_key = os.getenv('OPENAI_API_KEY')
     if openai_key:
         try:
-            headers = {
-                'Authorization': f'Bearer {openai_key}',
-                'Content-Type': 'application/json'
-            }
+            headers = _auth_headers(openai_key)
             
             payload = {
                 'model': 'gpt-3.5-turbo',
@@ -108,24 +341,24 @@ def call_llm(prompt: str) -> str:
                     {'role': 'user', 'content': prompt}
                 ],
                 'max_tokens': 500,
-                'temperature': 0.3
+                'temperature': 0.3,
+                'stream': True
             }
             
-            response = requests.post(
+            with _SESSION.post(
                 'https://api.openai.com/v1/chat/completions',
                 headers=headers,
                 json=payload,
-                timeout=30
-            )
-            
-            if response.status_code == 200:
-                result = response.json()
-                return result['choices'][0]['message']['content'].strip()
-            else:
-                logger.warning(f"OpenAI API error: {response.status_code}")
+                timeout=30,
+                stream=True
+            ) as response:
+                if response.status_code == 200:
+                    return _read_streamed_completion(response, on_delta)
+                else:
+                    logger.warning("OpenAI API error: %s", response.status_code)
                 
         except Exception as e:
-            logger.warning(f"OpenAI API call failed: {e}")
+            logger.warning("OpenAI API call failed: %s", e)
     
     # Try Composio
     composio_key = os.getenv('COMPOSIO_API_KEY')
@@ -135,59 +368,54 @@ def call_llm(prompt: str) -> str:
             # For now, fall through to deterministic fallback
             logger.info("Composio integration not yet implemented, using fallback")
         except Exception as e:
-            logger.warning(f"Composio API call failed: {e}")
+            logger.warning("Composio API call failed: %s", e)
     
-    # Deterministic fallback
-    logger.info("Using deterministic fallback for LLM rationale generation")
-    return _generate_deterministic_rationale(prompt)
+    return None
 
-def _generate_deterministic_rationale(prompt: str) -> str:
+def _generate_deterministic_rationale(context: Dict) -> str:
     """
-    Generate deterministic rationale based on prompt context.
+    Generate deterministic rationale from the structured prompt context.
     
     Args:
-        prompt: The original prompt containing context
+        context: The fields used to format the prompt (sku, on_hand,
+            weekly_demand, stockout_date, vendor_name, eoq, total_cost)
         
     Returns:
         str: JSON-formatted deterministic response
     """
-    # Extract key information from prompt for template
-    lines = prompt.split('\n')
-    context = {}
-    
-    for line in lines:
-        if 'SKU:' in line:
-            context['sku'] = line.split('SKU:')[1].strip()
-        elif 'Current Stock:' in line:
-            context['on_hand'] = line.split('Current Stock:')[1].split('units')[0].strip()
-        elif 'Weekly Demand:' in line:
-            context['weekly_demand'] = line.split('Weekly Demand:')[1].split('units')[0].strip()
-        elif 'Predicted Stockout Date:' in line:
-            context['stockout_date'] = line.split('Predicted Stockout Date:')[1].strip()
-        elif 'Best Vendor:' in line:
-            vendor_info = line.split('Best Vendor:')[1].strip()
-            context['vendor_info'] = vendor_info
-    
-    # Generate deterministic response
-    sku = context.get('sku', 'UNKNOWN')
-    on_hand = context.get('on_hand', '0')
-    weekly_demand = context.get('weekly_demand', '0')
-    stockout_date = context.get('stockout_date', 'Unknown')
-    vendor_info = context.get('vendor_info', 'Unknown vendor')
+    return _json_dumps(_deterministic_rationale(context), indent=True)
+
+def _deterministic_rationale(context: Dict) -> Dict:
+    """
+    Build the deterministic rationale dict from the structured prompt context.
     
-    paragraph = f"Item {sku} requires immediate reordering due to low stock levels. With only {on_hand} units remaining and weekly demand of {weekly_demand} units, stockout is predicted for {stockout_date}. The recommended vendor offers optimal cost-efficiency for this replenishment."
+    Args:
+        context: See _generate_deterministic_rationale
+        
+    Returns:
+        Dict with 'paragraph' and 'bullets'
+    """
+    if 'vendor_name' in context:
+        vendor_info = _FALLBACK_VENDOR_TMPL.format(
+            vendor_name=context['vendor_name'],
+            eoq=context.get('eoq', 0),
+            total_cost=context.get('total_cost', 0)
+        )
+    else:
+        vendor_info = 'Unknown vendor'
     
-    bullets = [
-        f"Current stock ({on_hand} units) is insufficient for projected demand",
-        f"Weekly consumption rate of {weekly_demand} units indicates rapid depletion",
-        f"Stockout risk identified for {stockout_date}",
-        f"Selected vendor provides best total cost optimization: {vendor_info}"
-    ]
+    fields = {
+        'sku': context.get('sku', 'UNKNOWN'),
+        'on_hand': context.get('on_hand', '0'),
+        'weekly_demand': context.get('weekly_demand', '0'),
+        'stockout_date': context.get('stockout_date', 'Unknown'),
+        'vendor_info': vendor_info,
+    }
     
-    return json.dumps({
-        "paragraph": paragraph,
-        "bullets": bullets
-    }, indent=2)
+    return {
+        "paragraph": _FALLBACK_PARAGRAPH_TMPL.format_map(fields),
+        "bullets": [template.format_map(fields) for template in _FALLBACK_BULLET_TMPLS]
+    }
 
 def generate_rationale(context: Dict) -> Dict:
     """
@@ -229,27 +457,38 @@ def generate_rationale(context: Dict) -> Dict:
         avg_daily = stats.get('avg_daily', 0)
         stddev = stats.get('stddev', 0)
         
-        # Format the prompt
-        prompt = RATIONALE_PROMPT_TEMPLATE.format(
-            sku=sku,
-            on_hand=on_hand,
-            weekly_demand=weekly_demand,
-            stockout_date=stockout_date,
-            vendor_name=vendor_name,
-            eoq=eoq,
-            total_cost=total_cost,
-            avg_daily=avg_daily,
-            stddev=stddev
-        )
+        # Format the prompt; the same fields feed the deterministic fallback
+        prompt_context = {
+            'sku': sku,
+            'on_hand': on_hand,
+            'weekly_demand': weekly_demand,
+            'stockout_date': stockout_date,
+            'vendor_name': vendor_name,
+            'eoq': eoq,
+            'total_cost': total_cost,
+            'avg_daily': avg_daily,
+            'stddev': stddev
+        }
+        prompt = _format_prompt(prompt_context)
+        
+        # Identical prompts reuse an earlier LLM answer instead of another round trip
+        cache_key = _rationale_cache_key(prompt)
+        cached = _load_cached_rationale(cache_key)
+        if cached is not None:
+            logger.info("Using cached rationale for SKU: %s", sku)
+            return cached
         
-        logger.info(f"Generating rationale for SKU: {sku}")
+        logger.info("Generating rationale for SKU: %s", sku)
         
-        # Call LLM
-        llm_response = call_llm(prompt)
+        # Call LLM; the deterministic fallback is built directly and never cached
+        llm_response = _call_providers(prompt)
+        if llm_response is None:
+            logger.info("Using deterministic fallback for LLM rationale generation")
+            return _deterministic_rationale(prompt_context)
         
         # Parse JSON response
         try:
-            rationale = json.loads(llm_response)
+            rationale = _json_loads(llm_response)
             
             # Validate response structure
             if 'paragraph' not in rationale or 'bullets' not in rationale:
@@ -258,19 +497,20 @@ def generate_rationale(context: Dict) -> Dict:
             if not isinstance(rationale['bullets'], list):
                 raise ValueError("Bullets must be a list")
             
-            logger.info(f"Successfully generated rationale for SKU: {sku}")
+            _store_cached_rationale(cache_key, rationale)
+            
+            logger.info("Successfully generated rationale for SKU: %s", sku)
             return rationale
             
         except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse LLM response as JSON: {e}")
-            logger.error(f"Raw response: {llm_response}")
+            logger.error("Failed to parse LLM response as JSON: %s", e)
+            logger.error("Raw response: %s", llm_response)
             
             # Fallback to deterministic response
-            fallback_response = _generate_deterministic_rationale(prompt)
-            return json.loads(fallback_response)
+            return _deterministic_rationale(prompt_context)
             
     except Exception as e:
-        logger.error(f"Error generating rationale for SKU {context.get('sku', 'unknown')}: {e}")
+        logger.error("Error generating rationale for SKU %s: %s", context.get('sku', 'unknown'), e)
         
         # Emergency fallback
         return {
@@ -283,6 +523,32 @@ def generate_rationale(context: Dict) -> Dict:
             ]
         }
 
+async def generate_rationale_batch(contexts: List[Dict], concurrency: Optional[int] = None) -> List[Dict]:
+    """
+    Generate rationales for many SKUs concurrently.
+    
+    Each context goes through generate_rationale on a worker thread, so the
+    blocking HTTP calls overlap instead of running back to back. A semaphore
+    caps the number of requests in flight.
+    
+    Args:
+        contexts: Context dictionaries as accepted by generate_rationale
+        concurrency: Maximum concurrent requests (default: LLM_CONCURRENCY
+            environment variable or DEFAULT_RATIONALE_CONCURRENCY)
+            
+    Returns:
+        List of rationale dicts in the same order as contexts
+    """
+    if concurrency is None:
+        concurrency = int(os.getenv('LLM_CONCURRENCY', DEFAULT_RATIONALE_CONCURRENCY))
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+    
+    async def _generate(context: Dict) -> Dict:
+        async with semaphore:
+            return await asyncio.to_thread(generate_rationale, context)
+    
+    return list(await asyncio.gather(*(_generate(context) for context in contexts)))
+
 if __name__ == "__main__":
     """
     Example usage and testing of the LLM rationale generator.
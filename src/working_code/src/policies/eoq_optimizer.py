@@ -7,12 +7,21 @@ This module provides:
 - Vendor selection optimization based on total cost
 """
 
+import heapq
 import math
-from typing import List, Dict, Optional, Union
+from functools import lru_cache
+from operator import itemgetter
+from typing import Callable, List, Dict, Optional, Tuple, Union
 import logging
 
+import numpy as np
+
 logger = logging.getLogger(__name__)
 
+# Size of the memo caches for the EOQ math; vendor loops call it with
+# repeated (demand, cost) tuples, so a few thousand entries cover a catalog
+EOQ_CACHE_SIZE = 4096
+
 
 def calculate_eoq(annual_demand: Union[int, float], order_cost: Union[int, float], 
                   holding_cost_per_unit: Union[int, float]) -> int:
@@ -40,33 +49,108 @@ def calculate_eoq(annual_demand: Union[int, float], order_cost: Union[int, float
     """
     # Validate inputs
     if annual_demand <= 0:
-        logger.warning(f"Invalid annual demand: {annual_demand}")
+        logger.warning("Invalid annual demand: %s", annual_demand)
         return 0
     
     if order_cost <= 0:
-        logger.warning(f"Invalid order cost: {order_cost}")
+        logger.warning("Invalid order cost: %s", order_cost)
         return 0
     
     if holding_cost_per_unit <= 0:
-        logger.warning(f"Invalid holding cost: {holding_cost_per_unit}")
+        logger.warning("Invalid holding cost: %s", holding_cost_per_unit)
         return 0
     
     try:
-        # Wilson EOQ formula
-        eoq_float = math.sqrt((2 * annual_demand * order_cost) / holding_cost_per_unit)
+        eoq = _wilson_eoq(annual_demand, order_cost, holding_cost_per_unit)
         
-        # Round up to ensure we don't under-order
-        eoq = math.ceil(eoq_float)
-        
-        logger.debug(f"EOQ calculation: sqrt((2*{annual_demand}*{order_cost})/{holding_cost_per_unit}) = {eoq}")
+        logger.debug("EOQ calculation: sqrt((2*%s*%s)/%s) = %s",
+                     annual_demand, order_cost, holding_cost_per_unit, eoq)
         
         return eoq
         
     except (ValueError, ZeroDivisionError) as e:
-        logger.error(f"Error calculating EOQ: {e}")
+        logger.error("Error calculating EOQ: %s", e)
         return 0
 
 
+def calculate_eoq_batch(annual_demands: Union[List[float], np.ndarray],
+                        order_cost: Union[float, np.ndarray],
+                        holding_cost_per_unit: Union[float, np.ndarray]) -> np.ndarray:
+    """
+    Calculate EOQ for many demand values at once.
+    
+    Order and holding costs may be scalars or arrays that broadcast against
+    the demands, so one call covers a whole catalog with shared costs.
+    
+    Args:
+        annual_demands: Annual demand quantities
+        order_cost: Cost to place one order (scalar or per-item array)
+        holding_cost_per_unit: Annual holding cost per unit (scalar or per-item array)
+    
+    Returns:
+        Integer array of EOQs, matching calculate_eoq element-wise
+        Entries with invalid or zero inputs are 0
+    
+    Example:
+        >>> calculate_eoq_batch([1000, 250], 50, 2.5)
+        array([200, 100])
+    """
+    demands = np.asarray(annual_demands, dtype=np.float64)
+    order_costs = np.asarray(order_cost, dtype=np.float64)
+    holding_costs = np.asarray(holding_cost_per_unit, dtype=np.float64)
+    
+    valid = (demands > 0) & (order_costs > 0) & (holding_costs > 0)
+    
+    # Same operation order as calculate_eoq so the ceil lands identically
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        eoqs = _wilson_eoq_array(demands, order_costs, holding_costs)
+    
+    return np.where(valid, eoqs, 0).astype(np.int64)
+
+
+@lru_cache(maxsize=EOQ_CACHE_SIZE)
+def _wilson_eoq(annual_demand: float, order_cost: float, holding_cost_per_unit: float) -> int:
+    """Wilson EOQ rounded up so we don't under-order; memoized on exact inputs."""
+    eoq_float = math.sqrt((2 * annual_demand * order_cost) / holding_cost_per_unit)
+    if eoq_float == math.inf:
+        # 2*D*S overflowed float64; split the root so the intermediates stay finite
+        eoq_float = math.sqrt(2.0 * annual_demand) * math.sqrt(order_cost / holding_cost_per_unit)
+    return math.ceil(eoq_float)
+
+
+def _wilson_eoq_array(annual_demand: Union[float, np.ndarray], order_cost: Union[float, np.ndarray],
+                      holding_cost_per_unit: Union[float, np.ndarray]) -> np.ndarray:
+    """Array version of _wilson_eoq (as floats); callers set np.errstate for invalid entries."""
+    eoq_float = np.sqrt((2 * annual_demand * order_cost) / holding_cost_per_unit)
+    overflowed = np.isposinf(eoq_float)
+    if overflowed.any():
+        rescaled = np.sqrt(2.0 * annual_demand) * np.sqrt(order_cost / holding_cost_per_unit)
+        eoq_float = np.where(overflowed, rescaled, eoq_float)
+    return np.ceil(eoq_float)
+
+
+@lru_cache(maxsize=EOQ_CACHE_SIZE)
+def _eoq_and_cost(annual_demand: float, price_per_unit: float, order_cost: float,
+                  holding_cost_percentage: float) -> Tuple[int, float, float, float, float]:
+    """
+    Numeric core shared by the vendor cost functions.
+    
+    Takes already-validated positive floats and does no logging or dict
+    access, so it is cheap enough to call per vendor in a loop. Results are
+    memoized on the exact inputs, so looking up the breakdown of a vendor
+    that was just costed is a dict hit rather than a second sqrt.
+    
+    Returns:
+        Tuple of (eoq, total_cost, purchase_cost, ordering_cost, holding_cost)
+    """
+    holding_cost_per_unit = price_per_unit * holding_cost_percentage
+    eoq = _wilson_eoq(annual_demand, order_cost, holding_cost_per_unit)
+    purchase_cost = annual_demand * price_per_unit
+    ordering_cost = (annual_demand / eoq) * order_cost
+    holding_cost = (eoq / 2) * holding_cost_per_unit
+    return eoq, purchase_cost + ordering_cost + holding_cost, purchase_cost, ordering_cost, holding_cost
+
+
 def calculate_total_cost_for_vendor(annual_demand: Union[int, float], vendor: Dict) -> float:
     """
     Calculate total annual cost for a specific vendor including purchase, ordering, and holding costs.
@@ -102,20 +186,33 @@ def calculate_total_cost_for_vendor(annual_demand: Union[int, float], vendor: Di
         >>> calculate_total_cost_for_vendor(1000, vendor)
         10125.0
     """
+    costs = _vendor_cost(annual_demand, vendor)
+    return costs[0] if costs is not None else math.inf
+
+
+def _vendor_cost(annual_demand: Union[int, float],
+                 vendor: Dict) -> Optional[Tuple[float, int, float, float, float]]:
+    """
+    Validate a vendor and compute its EOQ and full cost breakdown in one pass.
+    
+    Returns:
+        Tuple of (total_cost, eoq, purchase_cost, ordering_cost, holding_cost),
+        or None if the demand or vendor data is invalid
+    """
     # Validate inputs
     if annual_demand <= 0:
-        logger.warning(f"Invalid annual demand: {annual_demand}")
-        return float('inf')
+        logger.warning("Invalid annual demand: %s", annual_demand)
+        return None
     
     required_fields = ['price_per_unit', 'order_cost']
     for field in required_fields:
         if field not in vendor:
-            logger.error(f"Vendor missing required field: {field}")
-            return float('inf')
+            logger.error("Vendor missing required field: %s", field)
+            return None
         
         if vendor[field] <= 0:
-            logger.warning(f"Invalid vendor {field}: {vendor[field]}")
-            return float('inf')
+            logger.warning("Invalid vendor %s: %s", field, vendor[field])
+            return None
     
     try:
         # Extract vendor parameters
@@ -123,34 +220,78 @@ def calculate_total_cost_for_vendor(annual_demand: Union[int, float], vendor: Di
         order_cost = float(vendor['order_cost'])
         holding_cost_percentage = float(vendor.get('holding_cost_percentage', 0.25))
         
-        # Calculate holding cost per unit per year
-        holding_cost_per_unit = price_per_unit * holding_cost_percentage
-        
-        # Calculate EOQ for this vendor
-        eoq = calculate_eoq(annual_demand, order_cost, holding_cost_per_unit)
+        # EOQ needs a positive holding cost per unit per year
+        if price_per_unit * holding_cost_percentage <= 0:
+            logger.warning("Invalid holding cost: %s", price_per_unit * holding_cost_percentage)
+            logger.error("Could not calculate EOQ for vendor %s", vendor.get('vendor_id', 'unknown'))
+            return None
         
-        if eoq == 0:
-            logger.error(f"Could not calculate EOQ for vendor {vendor.get('vendor_id', 'unknown')}")
-            return float('inf')
+        # Calculate EOQ and total cost components
+        eoq, total_cost, purchase_cost, ordering_cost, holding_cost = _eoq_and_cost(
+            annual_demand, price_per_unit, order_cost, holding_cost_percentage
+        )
         
-        # Calculate total cost components
-        purchase_cost = annual_demand * price_per_unit
-        ordering_cost = (annual_demand / eoq) * order_cost
-        holding_cost = (eoq / 2) * holding_cost_per_unit
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "Vendor %s total cost breakdown: purchase=$%.2f ordering=$%.2f holding=$%.2f total=$%.2f",
+                vendor.get('vendor_name', 'unknown'), purchase_cost, ordering_cost, holding_cost, total_cost
+            )
         
-        total_cost = purchase_cost + ordering_cost + holding_cost
-        
-        logger.debug(f"Vendor {vendor.get('vendor_name', 'unknown')} total cost breakdown:")
-        logger.debug(f"  Purchase: ${purchase_cost:.2f}")
-        logger.debug(f"  Ordering: ${ordering_cost:.2f}")
-        logger.debug(f"  Holding: ${holding_cost:.2f}")
-        logger.debug(f"  Total: ${total_cost:.2f}")
-        
-        return total_cost
+        return total_cost, eoq, purchase_cost, ordering_cost, holding_cost
         
     except (ValueError, TypeError, ZeroDivisionError) as e:
-        logger.error(f"Error calculating total cost for vendor: {e}")
-        return float('inf')
+        logger.error("Error calculating total cost for vendor: %s", e)
+        return None
+
+
+def _normalize_vendors(vendors_list: List[Dict]) -> Tuple[List[int], List[Dict], np.ndarray]:
+    """
+    Filter vendors down to those with usable pricing and cast their parameters once.
+    
+    Non-dict entries, missing or non-numeric fields, and non-positive or
+    non-finite values are dropped here, so the cost math that follows needs
+    no per-vendor checks.
+    
+    Returns:
+        Tuple of (positions, vendors, params): the index of each kept vendor in
+        vendors_list, the vendor dicts themselves, and an (N, 3) float array of
+        price_per_unit, order_cost and holding_cost_percentage
+    """
+    positions = []
+    vendors = []
+    params = []
+    for i, vendor in enumerate(vendors_list):
+        if not isinstance(vendor, dict):
+            continue
+        try:
+            row = (
+                float(vendor['price_per_unit']),
+                float(vendor['order_cost']),
+                float(vendor.get('holding_cost_percentage', 0.25))
+            )
+        except (KeyError, TypeError, ValueError):
+            continue
+        if all(0 < value < math.inf for value in row):
+            positions.append(i)
+            vendors.append(vendor)
+            params.append(row)
+    
+    return positions, vendors, np.array(params, dtype=np.float64).reshape(-1, 3)
+
+
+def _augment_vendor(vendor: Dict, total_cost: float, eoq: int, purchase_cost: float,
+                    ordering_cost: float, holding_cost: float) -> Dict:
+    """Return a new vendor dict with EOQ and cost fields; the original is left untouched."""
+    return {
+        **vendor,
+        'eoq': eoq,
+        'total_annual_cost': total_cost,
+        'cost_breakdown': {
+            'purchase_cost': purchase_cost,
+            'ordering_cost': ordering_cost,
+            'holding_cost': holding_cost
+        }
+    }
 
 
 def select_best_vendor(vendors_list: List[Dict], annual_demand: Union[int, float]) -> Optional[Dict]:
@@ -179,7 +320,7 @@ def select_best_vendor(vendors_list: List[Dict], annual_demand: Union[int, float
     """
     # Validate inputs
     if annual_demand <= 0:
-        logger.warning(f"Invalid annual demand for vendor selection: {annual_demand}")
+        logger.warning("Invalid annual demand for vendor selection: %s", annual_demand)
         return None
     
     if not vendors_list:
@@ -190,73 +331,182 @@ def select_best_vendor(vendors_list: List[Dict], annual_demand: Union[int, float
         logger.error("Vendors must be provided as a list")
         return None
     
-    best_vendor = None
-    best_cost = float('inf')
+    evaluated = []
     
-    logger.info(f"Evaluating {len(vendors_list)} vendors for annual demand of {annual_demand}")
+    logger.info("Evaluating %d vendors for annual demand of %s", len(vendors_list), annual_demand)
     
-    for i, vendor in enumerate(vendors_list):
-        if not isinstance(vendor, dict):
-            logger.warning(f"Vendor {i} is not a dictionary, skipping")
-            continue
-        
+    positions, vendors, params = _normalize_vendors(vendors_list)
+    if len(vendors) < len(vendors_list):
+        logger.warning("Skipping %d vendors with missing or invalid pricing data",
+                       len(vendors_list) - len(vendors))
+    
+    for i, vendor, (price_per_unit, order_cost, holding_cost_percentage) in zip(
+            positions, vendors, params.tolist()):
         vendor_id = vendor.get('vendor_id', f'vendor_{i}')
         vendor_name = vendor.get('vendor_name', f'Vendor {i}')
         
-        # Calculate total cost for this vendor
-        total_cost = calculate_total_cost_for_vendor(annual_demand, vendor)
-        
-        if total_cost == float('inf'):
-            logger.warning(f"Could not calculate cost for vendor {vendor_name} ({vendor_id})")
+        # Calculate total cost and breakdown for this vendor
+        try:
+            eoq, total_cost, purchase_cost, ordering_cost, holding_cost = _eoq_and_cost(
+                annual_demand, price_per_unit, order_cost, holding_cost_percentage
+            )
+        except (ValueError, ZeroDivisionError, OverflowError):
+            logger.warning("Could not calculate cost for vendor %s (%s)", vendor_name, vendor_id)
             continue
         
-        logger.info(f"Vendor {vendor_name} ({vendor_id}): Total cost = ${total_cost:.2f}")
+        costs = (total_cost, eoq, purchase_cost, ordering_cost, holding_cost)
         
-        # Check if this is the best vendor so far
-        if total_cost < best_cost:
-            best_cost = total_cost
-            best_vendor = vendor.copy()  # Make a copy to avoid modifying original
-            
-            # Calculate additional details for the best vendor
-            price_per_unit = float(vendor['price_per_unit'])
-            order_cost = float(vendor['order_cost'])
-            holding_cost_percentage = float(vendor.get('holding_cost_percentage', 0.25))
-            holding_cost_per_unit = price_per_unit * holding_cost_percentage
-            
-            eoq = calculate_eoq(annual_demand, order_cost, holding_cost_per_unit)
-            
-            # Calculate cost breakdown
-            purchase_cost = annual_demand * price_per_unit
-            ordering_cost = (annual_demand / eoq) * order_cost if eoq > 0 else 0
-            holding_cost = (eoq / 2) * holding_cost_per_unit if eoq > 0 else 0
-            
-            # Augment vendor with calculated values
-            best_vendor.update({
-                'eoq': eoq,
-                'total_annual_cost': total_cost,
-                'cost_breakdown': {
-                    'purchase_cost': purchase_cost,
-                    'ordering_cost': ordering_cost,
-                    'holding_cost': holding_cost
-                }
-            })
-    
-    if best_vendor is None:
+        logger.info("Vendor %s (%s): Total cost = $%.2f", vendor_name, vendor_id, total_cost)
+        
+        evaluated.append((total_cost, vendor, costs))
+    
+    if not evaluated:
         logger.error("No valid vendors found")
         return None
     
-    logger.info(f"Selected best vendor: {best_vendor.get('vendor_name')} with total cost ${best_cost:.2f}")
+    # min() keeps the first vendor among equal totals; the result dict is only built for the winner
+    best_cost, best_vendor, best_costs = min(evaluated, key=itemgetter(0))
+    
+    logger.info("Selected best vendor: %s with total cost $%.2f", best_vendor.get('vendor_name'), best_cost)
+    
+    return _augment_vendor(best_vendor, *best_costs)
+
+
+def make_vendor_ranker(vendors_list: List[Dict]) -> Callable[[Union[int, float]], Optional[Dict]]:
+    """
+    Build a best-vendor selector specialized for a fixed vendor pool.
+    
+    The pool is validated and its per-vendor constants (price, order cost,
+    holding cost per unit) are computed once, so each call only runs the
+    numeric comparison. Useful when the same vendors are ranked for many SKUs.
+    
+    Args:
+        vendors_list: List of vendor dictionaries (see calculate_total_cost_for_vendor for format)
+    
+    Returns:
+        Function taking an annual demand and returning the same result as
+        select_best_vendor(vendors_list, annual_demand), without per-vendor logging
+    
+    Example:
+        >>> best_for = make_vendor_ranker(vendors)
+        >>> best = best_for(1000)
+    """
+    if not isinstance(vendors_list, list):
+        logger.error("Vendors must be provided as a list")
+        vendors_list = []
+    
+    _, vendors, params = _normalize_vendors(vendors_list)
+    
+    # (vendor, price, 2*S, S, H); doubling is exact, so D*2S/H rounds like 2*D*S/H
+    pool = [
+        (vendor, price, 2.0 * order_cost, order_cost, price * holding_pct)
+        for vendor, (price, order_cost, holding_pct) in zip(vendors, params.tolist())
+    ]
+    sqrt = math.sqrt
+    ceil = math.ceil
+    
+    def rank(annual_demand: Union[int, float]) -> Optional[Dict]:
+        if not 0 < annual_demand < math.inf:
+            return None
+        
+        best = None
+        best_cost = math.inf
+        for vendor, price, two_order_cost, order_cost, holding_cost_per_unit in pool:
+            eoq_float = sqrt((annual_demand * two_order_cost) / holding_cost_per_unit)
+            if eoq_float == math.inf:
+                # Rare overflow path; vendors whose EOQ is still unbounded are skipped
+                try:
+                    eoq = _wilson_eoq(annual_demand, order_cost, holding_cost_per_unit)
+                except OverflowError:
+                    continue
+            else:
+                eoq = ceil(eoq_float)
+            if eoq == 0:
+                continue
+            
+            purchase_cost = annual_demand * price
+            ordering_cost = (annual_demand / eoq) * order_cost
+            holding_cost = (eoq / 2) * holding_cost_per_unit
+            total_cost = purchase_cost + ordering_cost + holding_cost
+            
+            if best is None or total_cost < best_cost:
+                best_cost = total_cost
+                best = (vendor, total_cost, eoq, purchase_cost, ordering_cost, holding_cost)
+        
+        return _augment_vendor(*best) if best is not None else None
+    
+    return rank
+
+
+def select_best_vendor_batch(vendors_list: List[Dict],
+                             annual_demands: Union[List[float], np.ndarray]) -> Tuple[np.ndarray, np.ndarray]:
+    """
+    Select the cheapest vendor for many annual demands (e.g. one per SKU) at once.
+    
+    The vendor pool is validated once and every (demand, vendor) total cost is
+    computed in one broadcast (M, N) array, using the same formula as
+    select_best_vendor.
+    
+    Args:
+        vendors_list: List of vendor dictionaries shared by all demands
+        annual_demands: Annual demand quantities, shape (M,)
+    
+    Returns:
+        Tuple of (best_vendor_index, best_total_cost), both of shape (M,).
+        Indices point into vendors_list; entries with non-positive demand or
+        no valid vendor get index -1 and cost inf.
+    
+    Example:
+        >>> idx, cost = select_best_vendor_batch(vendors, [1000, 50])
+        >>> best_for_first_sku = vendors[idx[0]]
+    """
+    demands = np.asarray(annual_demands, dtype=np.float64).reshape(-1)
+    best_idx = np.full(demands.shape, -1, dtype=np.intp)
+    best_cost = np.full(demands.shape, np.inf)
+    
+    if not isinstance(vendors_list, list):
+        logger.error("Vendors must be provided as a list")
+        return best_idx, best_cost
+    
+    positions, _, params = _normalize_vendors(vendors_list)
+    if not positions:
+        return best_idx, best_cost
+    
+    prices, order_costs, holding_pcts = params.T
+    holding_costs_per_unit = prices * holding_pcts
+    D = demands[:, None]
+    
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        eoqs = _wilson_eoq_array(D, order_costs, holding_costs_per_unit)
+        total_costs = D * prices + (D / eoqs) * order_costs + (eoqs / 2) * holding_costs_per_unit
     
-    return best_vendor
+    # NaN totals (e.g. zero or negative demand) must never win the argmin
+    total_costs = np.where(np.isnan(total_costs), np.inf, total_costs)
+    
+    # argmin returns the first vendor among equal totals, like select_best_vendor
+    winners = total_costs.argmin(axis=1)
+    costs = total_costs[np.arange(len(demands)), winners]
+    ok = (demands > 0) & np.isfinite(costs)
+    
+    best_idx[ok] = np.asarray(positions, dtype=np.intp)[winners[ok]]
+    best_cost[ok] = costs[ok]
+    
+    return best_idx, best_cost
 
 
-def compare_vendors(vendors_list: List[Dict], annual_demand: Union[int, float]) -> List[Dict]:
+def compare_vendors(vendors_list: List[Dict], annual_demand: Union[int, float],
+                    top_k: Optional[int] = None) -> List[Dict]:
     """
     Compare all vendors and return them sorted by total cost (lowest first).
     
+    Vendor parameters are gathered into arrays once and EOQ and every cost
+    component are computed for all vendors in a single vectorized pass; only
+    the surviving vendors are turned back into dictionaries.
+    
     Args:
         vendors_list: List of vendor dictionaries
         annual_demand: Annual demand quantity
+        top_k: If given, only the top_k cheapest vendors are ranked and returned
     
     Returns:
         List of vendor dictionaries augmented with cost information, sorted by total cost
@@ -265,47 +515,40 @@ def compare_vendors(vendors_list: List[Dict], annual_demand: Union[int, float])
     if annual_demand <= 0 or not vendors_list:
         return []
     
-    vendor_comparisons = []
-    
-    for vendor in vendors_list:
-        if not isinstance(vendor, dict):
-            continue
-        
-        total_cost = calculate_total_cost_for_vendor(annual_demand, vendor)
-        
-        if total_cost == float('inf'):
-            continue
-        
-        # Calculate EOQ and cost breakdown
-        price_per_unit = float(vendor['price_per_unit'])
-        order_cost = float(vendor['order_cost'])
-        holding_cost_percentage = float(vendor.get('holding_cost_percentage', 0.25))
-        holding_cost_per_unit = price_per_unit * holding_cost_percentage
-        
-        eoq = calculate_eoq(annual_demand, order_cost, holding_cost_per_unit)
-        
-        purchase_cost = annual_demand * price_per_unit
-        ordering_cost = (annual_demand / eoq) * order_cost if eoq > 0 else 0
-        holding_cost = (eoq / 2) * holding_cost_per_unit if eoq > 0 else 0
-        
-        # Create augmented vendor record
-        vendor_comparison = vendor.copy()
-        vendor_comparison.update({
-            'eoq': eoq,
-            'total_annual_cost': total_cost,
-            'cost_breakdown': {
-                'purchase_cost': purchase_cost,
-                'ordering_cost': ordering_cost,
-                'holding_cost': holding_cost
-            }
-        })
-        
-        vendor_comparisons.append(vendor_comparison)
-    
-    # Sort by total cost (lowest first)
-    vendor_comparisons.sort(key=lambda v: v['total_annual_cost'])
+    _, vendors, params = _normalize_vendors(vendors_list)
+    if not vendors:
+        return []
     
-    return vendor_comparisons
+    prices, order_costs, holding_pcts = params.T
+    
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        holding_costs_per_unit = prices * holding_pcts
+        eoqs = _wilson_eoq_array(annual_demand, order_costs, holding_costs_per_unit)
+        purchase_costs = annual_demand * prices
+        ordering_costs = (annual_demand / eoqs) * order_costs
+        holding_costs = (eoqs / 2) * holding_costs_per_unit
+        total_costs = purchase_costs + ordering_costs + holding_costs
+    
+    # Stable sort keeps input order among equal totals, as list.sort did
+    candidates = np.arange(len(vendors))
+    if top_k is not None and top_k < len(candidates):
+        # Partial selection is O(N log K); (cost, index) pairs keep ties in input order
+        cheapest = heapq.nsmallest(max(top_k, 0), zip(total_costs[candidates].tolist(), candidates.tolist()))
+        ranked = np.array([i for _, i in cheapest], dtype=np.intp)
+    else:
+        ranked = candidates[np.argsort(total_costs[candidates], kind='stable')]
+    
+    # Convert the winning rows to Python scalars in one go, not per element
+    rows = zip(
+        ranked.tolist(),
+        total_costs[ranked].tolist(),
+        map(int, eoqs[ranked].tolist()),
+        purchase_costs[ranked].tolist(),
+        ordering_costs[ranked].tolist(),
+        holding_costs[ranked].tolist()
+    )
+    
+    return [_augment_vendor(vendors[i], *costs) for i, *costs in rows]
 
 
 if __name__ == "__main__":
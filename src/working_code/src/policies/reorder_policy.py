@@ -10,21 +10,54 @@ Version: 1.0.0
 """
 
 import logging
-from typing import Dict, List, Optional, Tuple
+from bisect import bisect_left
+from typing import Dict, List, Optional, Tuple, Union
 from datetime import datetime, timedelta
-import sys
-import os
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
+import numpy as np
 
-from models.forecast import compute_daily_average, estimate_days_until_stockout
-from policies.eoq_optimizer import select_best_vendor
+from ..models.forecast import (
+    TransactionStore, compute_daily_average, compute_daily_average_batch, estimate_days_until_stockout
+)
+from .eoq_optimizer import compare_vendors, select_best_vendor
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Urgency label and reason template per bucket: stockout within the safety
+# margin, within lead time + safety margin, or later
+_URGENCY_LEVELS = (
+    ("URGENT", "stockout predicted in {:.1f} days"),
+    ("HIGH", "stockout within lead time + safety margin ({:.1f} days)"),
+    ("MEDIUM", "below reorder point threshold"),
+)
+
+# Reorder-policy vendor fields and the eoq_optimizer fields they stand for
+_VENDOR_FIELD_ALIASES = (
+    ('name', 'vendor_name'),
+    ('unit_cost', 'price_per_unit'),
+    ('holding_cost_rate', 'holding_cost_percentage'),
+)
+
+
+def _optimizer_vendors(vendors: List[Dict]) -> List[Dict]:
+    """
+    Copy vendor dicts into the field names eoq_optimizer expects.
+    
+    Fields the optimizer already understands are kept as given; other
+    fields such as lead_time pass through unchanged.
+    """
+    converted = []
+    for vendor in vendors:
+        if isinstance(vendor, dict):
+            vendor = {
+                **{target: vendor[source] for source, target in _VENDOR_FIELD_ALIASES if source in vendor},
+                **vendor
+            }
+        converted.append(vendor)
+    return converted
+
 class ReorderPolicy:
     """
     Intelligent reorder policy that combines forecasting, EOQ optimization,
@@ -46,7 +79,7 @@ class ReorderPolicy:
     def evaluate_reorder_need(
         self,
         inventory_item: Dict,
-        transactions: List[Dict],
+        transactions: Union[List[Dict], TransactionStore],
         vendors: List[Dict],
         target_stock_days: int = 30
     ) -> Dict:
@@ -55,7 +88,8 @@ class ReorderPolicy:
         
         Args:
             inventory_item: Dict with fields: sku, on_hand, reorder_point
-            transactions: List of transaction dicts with date, sku, quantity
+            transactions: List of transaction dicts with date, sku, quantity,
+                          or a TransactionStore (may hold other SKUs too)
             vendors: List of vendor dicts with name, unit_cost, holding_cost_rate, order_cost, lead_time
             target_stock_days: Target days of stock to maintain
             
@@ -75,9 +109,6 @@ class ReorderPolicy:
         try:
             sku = inventory_item['sku']
             on_hand = inventory_item['on_hand']
-            reorder_point = inventory_item.get('reorder_point', 0)
-            
-            logger.info(f"Evaluating reorder need for SKU: {sku}")
             
             # Step 1: Compute average daily usage using forecast module
             avg_daily = compute_daily_average(transactions, sku)
@@ -85,98 +116,143 @@ class ReorderPolicy:
                 logger.warning(f"No historical usage found for {sku}, using minimal demand assumption")
                 avg_daily = 0.1  # Minimal assumption for new items
             
-            # Step 2: Calculate annual demand
-            annual_demand = avg_daily * 365
-            
-            # Step 3: Select best vendor using EOQ optimizer
-            if not vendors:
-                raise ValueError("No vendors provided for evaluation")
-            
-            best_vendor_result = select_best_vendor(annual_demand, vendors)
-            best_vendor = best_vendor_result['best_vendor']
+            # Step 2: Compute expected days until stockout
+            days_until_stockout = estimate_days_until_stockout(on_hand, avg_daily)
             
-            # Step 4: Compute expected days until stockout and stockout date
-            days_until_stockout = estimate_days_until_stockout(transactions, sku, on_hand)
-            stockout_date = datetime.now() + timedelta(days=days_until_stockout)
-            
-            # Step 5: Determine if reorder is needed
-            lead_time = best_vendor.get('lead_time', 7)  # Default 7 days
-            reorder_threshold_days = lead_time + self.safety_margin_days
-            
-            needs_reorder = (
-                days_until_stockout <= reorder_threshold_days or
-                on_hand <= reorder_point
-            )
-            
-            # Step 6: Calculate recommended quantity
-            target_stock = avg_daily * target_stock_days
-            eoq = best_vendor_result['eoq']
-            
-            if needs_reorder:
-                # Recommend quantity to reach target stock level
-                qty_to_target = max(0, target_stock - on_hand)
-                recommended_qty = max(eoq, self.min_order_qty, qty_to_target)
-            else:
-                recommended_qty = 0
-            
-            # Step 7: Calculate cost savings vs other vendors
-            cost_savings = self._calculate_cost_savings(best_vendor_result, annual_demand)
-            
-            # Step 8: Generate evidence summary
-            evidence_summary = self._generate_evidence_summary(
-                sku, on_hand, avg_daily, days_until_stockout, 
-                best_vendor, needs_reorder, recommended_qty
-            )
-            
-            # Detailed decision factors
-            decision_factors = {
-                'current_stock': on_hand,
-                'avg_daily_usage': round(avg_daily, 2),
-                'annual_demand': round(annual_demand, 2),
-                'days_until_stockout': round(days_until_stockout, 1),
-                'lead_time_days': lead_time,
-                'safety_margin_days': self.safety_margin_days,
-                'reorder_threshold_days': reorder_threshold_days,
-                'reorder_point': reorder_point,
-                'target_stock_level': round(target_stock, 1),
-                'eoq': eoq,
-                'stockout_risk': days_until_stockout <= reorder_threshold_days,
-                'below_reorder_point': on_hand <= reorder_point
-            }
-            
-            result = {
-                'sku': sku,
-                'needs_reorder': needs_reorder,
-                'vendor': best_vendor['name'],
-                'qty': recommended_qty,
-                'eoq': eoq,
-                'total_cost': best_vendor_result['total_cost'],
-                'stockout_date': stockout_date.strftime('%Y-%m-%d'),
-                'evidence_summary': evidence_summary,
-                'cost_savings': cost_savings,
-                'decision_factors': decision_factors
-            }
-            
-            logger.info(f"Reorder evaluation complete for {sku}: needs_reorder={needs_reorder}")
-            return result
+            return self._recommend(inventory_item, avg_daily, days_until_stockout, vendors, target_stock_days)
             
         except Exception as e:
             logger.error(f"Error evaluating reorder need for {inventory_item.get('sku', 'unknown')}: {e}")
             raise
     
-    def _calculate_cost_savings(self, best_vendor_result: Dict, annual_demand: float) -> Dict:
+    def _recommend(
+        self,
+        inventory_item: Dict,
+        avg_daily: float,
+        days_until_stockout: float,
+        vendors: List[Dict],
+        target_stock_days: int,
+        vendor_cache: Optional[Dict[float, Tuple[Dict, Dict]]] = None,
+        now: Optional[datetime] = None
+    ) -> Dict:
+        """
+        Build the reorder recommendation once usage and stockout horizon are known.
+        
+        Args:
+            inventory_item: Dict with fields: sku, on_hand, reorder_point
+            avg_daily: Average daily usage (already floored for new items)
+            days_until_stockout: Days until predicted stockout
+            vendors: List of vendor dicts
+            target_stock_days: Target days of stock to maintain
+            vendor_cache: Optional dict of (best vendor, cost savings) by annual
+                          demand, shared by items evaluated against the same vendors;
+                          its entries are read only, never placed in a result
+            now: Reference time for the stockout date (default: current time)
+            
+        Returns:
+            Dict: Reorder recommendation (see evaluate_reorder_need)
+        """
+        sku = inventory_item['sku']
+        on_hand = inventory_item['on_hand']
+        reorder_point = inventory_item.get('reorder_point', 0)
+        
+        logger.info(f"Evaluating reorder need for SKU: {sku}")
+        
+        # Step 3: Calculate annual demand
+        annual_demand = avg_daily * 365
+        
+        # Step 4: Select best vendor using EOQ optimizer
+        if not vendors:
+            raise ValueError("No vendors provided for evaluation")
+        
+        cached = vendor_cache.get(annual_demand) if vendor_cache is not None else None
+        if cached is None:
+            candidates = _optimizer_vendors(vendors)
+            best_vendor = select_best_vendor(candidates, annual_demand)
+            if best_vendor is None:
+                raise ValueError("No vendor with valid pricing for evaluation")
+            # Step 7: Calculate cost savings vs other vendors
+            cost_savings = self._calculate_cost_savings(candidates, annual_demand)
+            if vendor_cache is not None:
+                vendor_cache[annual_demand] = (best_vendor, cost_savings)
+        else:
+            best_vendor, cost_savings = cached
+        
+        # Predicted stockout date
+        stockout_date = (now or datetime.now()) + timedelta(days=days_until_stockout)
+        
+        # Step 5: Determine if reorder is needed
+        lead_time = best_vendor.get('lead_time', 7)  # Default 7 days
+        reorder_threshold_days = lead_time + self.safety_margin_days
+        
+        needs_reorder = (
+            days_until_stockout <= reorder_threshold_days or
+            on_hand <= reorder_point
+        )
+        
+        # Step 6: Calculate recommended quantity
+        target_stock = avg_daily * target_stock_days
+        eoq = best_vendor['eoq']
+        
+        if needs_reorder:
+            # Recommend quantity to reach target stock level
+            qty_to_target = max(0, target_stock - on_hand)
+            recommended_qty = max(eoq, self.min_order_qty, qty_to_target)
+        else:
+            recommended_qty = 0
+        
+        # Step 8: Generate evidence summary
+        evidence_summary = self._generate_evidence_summary(
+            sku, on_hand, avg_daily, days_until_stockout, 
+            best_vendor, needs_reorder, recommended_qty
+        )
+        
+        # Detailed decision factors
+        decision_factors = {
+            'current_stock': on_hand,
+            'avg_daily_usage': round(avg_daily, 2),
+            'annual_demand': round(annual_demand, 2),
+            'days_until_stockout': round(days_until_stockout, 1),
+            'lead_time_days': lead_time,
+            'safety_margin_days': self.safety_margin_days,
+            'reorder_threshold_days': reorder_threshold_days,
+            'reorder_point': reorder_point,
+            'target_stock_level': round(target_stock, 1),
+            'eoq': eoq,
+            'stockout_risk': days_until_stockout <= reorder_threshold_days,
+            'below_reorder_point': on_hand <= reorder_point
+        }
+        
+        result = {
+            'sku': sku,
+            'needs_reorder': needs_reorder,
+            'vendor': best_vendor.get('vendor_name'),
+            'qty': recommended_qty,
+            'eoq': eoq,
+            'total_cost': best_vendor['total_annual_cost'],
+            'stockout_date': stockout_date.date().isoformat(),
+            'evidence_summary': evidence_summary,
+            'cost_savings': dict(cost_savings),  # Own copy; the cached one is shared across items
+            'decision_factors': decision_factors
+        }
+        
+        logger.info(f"Reorder evaluation complete for {sku}: needs_reorder={needs_reorder}")
+        return result
+    
+    def _calculate_cost_savings(self, vendors: List[Dict], annual_demand: float) -> Dict:
         """
         Calculate cost savings compared to other vendors.
         
         Args:
-            best_vendor_result: Result from select_best_vendor
+            vendors: Vendor dicts in eoq_optimizer format
             annual_demand: Annual demand quantity
             
         Returns:
             Dict: Cost savings information
         """
         try:
-            comparisons = best_vendor_result.get('comparisons', [])
+            # Only the two cheapest vendors are needed, not a full ranking
+            comparisons = compare_vendors(vendors, annual_demand, top_k=2)
             if len(comparisons) <= 1:
                 return {
                     'savings_amount': 0,
@@ -184,18 +260,16 @@ class ReorderPolicy:
                     'vs_vendor': None
                 }
             
-            # Find the second-best vendor
-            sorted_comparisons = sorted(comparisons, key=lambda x: x['total_cost'])
-            best_cost = sorted_comparisons[0]['total_cost']
-            second_best = sorted_comparisons[1]
+            best, second_best = comparisons
+            best_cost = best['total_annual_cost']
             
-            savings_amount = second_best['total_cost'] - best_cost
-            savings_percentage = (savings_amount / second_best['total_cost']) * 100
+            savings_amount = second_best['total_annual_cost'] - best_cost
+            savings_percentage = (savings_amount / second_best['total_annual_cost']) * 100
             
             return {
                 'savings_amount': round(savings_amount, 2),
                 'savings_percentage': round(savings_percentage, 1),
-                'vs_vendor': second_best['name']
+                'vs_vendor': second_best.get('vendor_name')
             }
             
         except Exception as e:
@@ -224,7 +298,7 @@ class ReorderPolicy:
             on_hand: Current stock level
             avg_daily: Average daily usage
             days_until_stockout: Days until predicted stockout
-            best_vendor: Selected vendor information
+            best_vendor: Selected vendor from select_best_vendor
             needs_reorder: Whether reorder is needed
             recommended_qty: Recommended order quantity
             
@@ -232,21 +306,15 @@ class ReorderPolicy:
             str: Evidence summary
         """
         if needs_reorder:
-            if days_until_stockout <= self.safety_margin_days:
-                urgency = "URGENT"
-                reason = f"stockout predicted in {days_until_stockout:.1f} days"
-            elif days_until_stockout <= (best_vendor.get('lead_time', 7) + self.safety_margin_days):
-                urgency = "HIGH"
-                reason = f"stockout within lead time + safety margin ({days_until_stockout:.1f} days)"
-            else:
-                urgency = "MEDIUM"
-                reason = "below reorder point threshold"
+            thresholds = (self.safety_margin_days, best_vendor.get('lead_time', 7) + self.safety_margin_days)
+            urgency, reason = _URGENCY_LEVELS[bisect_left(thresholds, days_until_stockout)]
+            reason = reason.format(days_until_stockout)
             
             summary = (
                 f"{urgency} PRIORITY: {sku} needs reordering ({reason}). "
                 f"Current stock: {on_hand} units, daily usage: {avg_daily:.1f} units. "
-                f"Recommend ordering {recommended_qty} units from {best_vendor['name']} "
-                f"(EOQ: {best_vendor.get('eoq', 'N/A')}, cost: ${best_vendor.get('total_cost', 0):.2f})."
+                f"Recommend ordering {recommended_qty} units from {best_vendor.get('vendor_name')} "
+                f"(EOQ: {best_vendor['eoq']}, cost: ${best_vendor['total_annual_cost']:.2f})."
             )
         else:
             summary = (
@@ -260,43 +328,66 @@ class ReorderPolicy:
     def batch_evaluate_reorders(
         self,
         inventory_items: List[Dict],
-        transactions: List[Dict],
+        transactions: Union[List[Dict], TransactionStore],
         vendors: List[Dict],
         target_stock_days: int = 30
     ) -> List[Dict]:
         """
         Evaluate reorder needs for multiple inventory items.
         
+        The transaction history is converted to a columnar TransactionStore
+        once; each item's forecast is then an indexed lookup by SKU instead
+        of a scan over every transaction.
+        
         Args:
             inventory_items: List of inventory item dicts
-            transactions: List of transaction dicts
+            transactions: List of transaction dicts, or a TransactionStore
             vendors: List of vendor dicts
             target_stock_days: Target days of stock to maintain
             
         Returns:
             List[Dict]: List of reorder recommendations
         """
-        results = []
+        results: List[Optional[Dict]] = [None] * len(inventory_items)
         
-        for item in inventory_items:
+        # Build the per-SKU usage index once for the whole batch
+        history = transactions if isinstance(transactions, TransactionStore) else TransactionStore.from_dicts(transactions)
+        
+        # Gather per-item inputs into parallel lists; malformed items get an error result
+        positions, skus, on_hand = [], [], []
+        for i, item in enumerate(inventory_items):
             try:
-                # Filter transactions for this SKU
-                item_transactions = [t for t in transactions if t.get('sku') == item['sku']]
-                
-                result = self.evaluate_reorder_need(
-                    item, item_transactions, vendors, target_stock_days
-                )
-                results.append(result)
-                
+                sku, stock = item['sku'], float(item['on_hand'])
             except Exception as e:
-                logger.error(f"Failed to evaluate {item.get('sku', 'unknown')}: {e}")
-                # Add error result
-                results.append({
-                    'sku': item.get('sku', 'unknown'),
-                    'needs_reorder': False,
-                    'error': str(e),
-                    'evidence_summary': f"Error evaluating {item.get('sku', 'unknown')}: {e}"
-                })
+                results[i] = self._error_result(item, e)
+                continue
+            positions.append(i)
+            skus.append(sku)
+            on_hand.append(stock)
+        
+        # Usage and stockout horizon for every item as array operations
+        avg_daily = compute_daily_average_batch(history, skus).to_numpy()
+        no_history = avg_daily <= 0
+        avg_daily = np.where(no_history, 0.1, avg_daily)  # Minimal assumption for new items
+        on_hand_arr = np.asarray(on_hand, dtype=np.float64)
+        days_until_stockout = np.where(on_hand_arr <= 0, 0.0, on_hand_arr / avg_daily)
+        
+        # Vendor selection depends only on annual demand for a fixed vendor list,
+        # so items with the same demand (e.g. all new items) share one result
+        vendor_cache: Dict[float, Tuple[Dict, Dict]] = {}
+        
+        # One reference time for the whole batch rather than a clock read per item
+        now = datetime.now()
+        
+        for i, sku, avg, days, missing in zip(positions, skus, avg_daily.tolist(),
+                                              days_until_stockout.tolist(), no_history.tolist()):
+            item = inventory_items[i]
+            if missing:
+                logger.warning(f"No historical usage found for {sku}, using minimal demand assumption")
+            try:
+                results[i] = self._recommend(item, avg, days, vendors, target_stock_days, vendor_cache, now)
+            except Exception as e:
+                results[i] = self._error_result(item, e)
         
         # Sort by priority (urgent reorders first)
         results.sort(key=lambda x: (
@@ -306,6 +397,26 @@ class ReorderPolicy:
         
         logger.info(f"Batch evaluation complete: {len(results)} items processed")
         return results
+    
+    def _error_result(self, item: Dict, error: Exception) -> Dict:
+        """
+        Log a failed item evaluation and build its placeholder result.
+        
+        Args:
+            item: Inventory item that could not be evaluated
+            error: Exception raised during evaluation
+            
+        Returns:
+            Dict: Error result with sku, needs_reorder, error and evidence_summary
+        """
+        sku = item.get('sku', 'unknown')
+        logger.error(f"Failed to evaluate {sku}: {error}")
+        return {
+            'sku': sku,
+            'needs_reorder': False,
+            'error': str(error),
+            'evidence_summary': f"Error evaluating {sku}: {error}"
+        }
 
 if __name__ == "__main__":
     """
@@ -335,7 +446,7 @@ if __name__ == "__main__":
         transactions.append({
             'date': date.strftime('%Y-%m-%d'),
             'sku': 'WIDGET-001',
-            'quantity': -daily_usage,  # Negative for outbound
+            'quantity': daily_usage,  # Units used
             'type': 'sale'
         })
     
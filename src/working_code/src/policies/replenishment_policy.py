@@ -5,12 +5,54 @@ Contains business logic and decision-making algorithms for inventory replenishme
 """
 
 import logging
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 from datetime import datetime, timedelta
 import math
 
+import numpy as np
+
 from ..utils.config import Config
 
+
+# Field values the array kernels accept; anything else takes the per-item path
+_NUMERIC_TYPES = (int, float, np.integer, np.floating)
+
+
+def _eoq_kernel(annual_demand: np.ndarray, unit_cost: np.ndarray,
+                holding_cost_rate: float, order_cost: float) -> np.ndarray:
+    """
+    Vectorized form of ReplenishmentPolicy._calculate_eoq over item arrays.
+    
+    Returns:
+        int64 array of EOQs truncated like int(); 0 where demand or unit cost
+        is not positive or the formula has no finite result
+    """
+    holding_cost = holding_cost_rate * unit_cost
+    with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+        eoq = np.sqrt((2 * annual_demand * order_cost) / holding_cost)
+    valid = (annual_demand > 0) & (unit_cost > 0) & np.isfinite(eoq)
+    return np.where(valid, eoq, 0.0).astype(np.int64)
+
+
+def _safety_kernel(average_daily_demand: np.ndarray, demand_std_dev: np.ndarray, lead_time_days: np.ndarray,
+                   z_score: float, multiplier: float) -> np.ndarray:
+    """
+    Vectorized form of ReplenishmentPolicy._calculate_safety_stock over item arrays.
+    
+    Returns:
+        int64 array of safety stock quantities; 0 where average demand is not
+        positive or the formula has no finite result
+    """
+    with np.errstate(invalid='ignore', over='ignore'):
+        safety_stock = np.where(
+            demand_std_dev > 0,
+            z_score * np.sqrt(lead_time_days) * demand_std_dev,
+            average_daily_demand * lead_time_days * 0.2  # 20% buffer
+        ) * multiplier
+    valid = (average_daily_demand > 0) & np.isfinite(safety_stock)
+    return np.where(valid, safety_stock, 0.0).astype(np.int64)
+
+
 class ReplenishmentPolicy:
     """
     Policy engine for making inventory replenishment decisions.
@@ -26,6 +68,11 @@ class ReplenishmentPolicy:
         self.safety_stock_multiplier = getattr(config, 'safety_stock_multiplier', 1.2)
         self.lead_time_days = getattr(config, 'default_lead_time_days', 7)
         
+        # Statuses that are never reordered (inactive or already being reordered)
+        self._skip_status = frozenset({'inactive', 'reorder_pending', 'discontinued'})
+        # Priorities that always expedite an order
+        self._expedite_priority = frozenset({'high', 'critical', 'urgent'})
+        
         self.logger.info("Replenishment policy initialized")
     
     def identify_low_stock(self, inventory_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
@@ -43,9 +90,9 @@ class ReplenishmentPolicy:
         for item in inventory_data:
             if self._is_low_stock(item):
                 low_stock_items.append(item)
-                self.logger.info(f"Low stock identified: {item.get('name', 'Unknown')} "
-                               f"(Current: {item.get('current_stock', 0)}, "
-                               f"Minimum: {item.get('minimum_stock', 0)})")
+                self.logger.info("Low stock identified: %s (Current: %s, Minimum: %s)",
+                                 item.get('name', 'Unknown'), item.get('current_stock', 0),
+                                 item.get('minimum_stock', 0))
         
         return low_stock_items
     
@@ -59,14 +106,13 @@ class ReplenishmentPolicy:
         Returns:
             True if item needs replenishment
         """
-        current_stock = item.get('current_stock', 0)
-        minimum_stock = item.get('minimum_stock', 0)
-        
         # Skip if item is inactive or already being reordered
-        status = item.get('status', 'active').lower()
-        if status in ['inactive', 'reorder_pending', 'discontinued']:
+        if item.get('status', 'active').lower() in self._skip_status:
             return False
         
+        current_stock = item.get('current_stock', 0)
+        minimum_stock = item.get('minimum_stock', 0)
+        
         # Check if current stock is below minimum threshold
         if current_stock <= minimum_stock:
             return True
@@ -87,6 +133,20 @@ class ReplenishmentPolicy:
         Args:
             item: Inventory item data
             
+        Returns:
+            Recommended order quantity
+        """
+        return self._order_quantity(item, self._calculate_eoq(item), self._calculate_safety_stock(item))
+    
+    def _order_quantity(self, item: Dict[str, Any], eoq_quantity: int, safety_quantity: int) -> int:
+        """
+        Combine the stock-level, EOQ and safety-stock quantities for an item.
+        
+        Args:
+            item: Inventory item data
+            eoq_quantity: EOQ-based order quantity
+            safety_quantity: Safety stock quantity
+            
         Returns:
             Recommended order quantity
         """
@@ -101,13 +161,8 @@ class ReplenishmentPolicy:
             # Fallback: order enough to reach 3x minimum stock
             basic_quantity = (minimum_stock * 3) - current_stock
         
-        # Method 2: Economic Order Quantity (EOQ) consideration
-        eoq_quantity = self._calculate_eoq(item)
-        
-        # Method 3: Safety stock consideration
-        safety_quantity = self._calculate_safety_stock(item)
-        
-        # Choose the maximum of the three methods to ensure adequate stock
+        # Choose the maximum of the three methods (EOQ and safety stock come
+        # from the caller) to ensure adequate stock
         recommended_quantity = max(basic_quantity, eoq_quantity, safety_quantity)
         
         # Ensure minimum order quantity
@@ -117,9 +172,10 @@ class ReplenishmentPolicy:
         # Round up to nearest order unit if specified
         order_unit = item.get('order_unit', 1)
         if order_unit > 1:
-            recommended_quantity = math.ceil(recommended_quantity / order_unit) * order_unit
+            # Ceiling division; stays in integer arithmetic for integer quantities
+            recommended_quantity = -(-recommended_quantity // order_unit) * order_unit
         
-        self.logger.info(f"Calculated order quantity for {item.get('name', 'Unknown')}: {recommended_quantity}")
+        self.logger.info("Calculated order quantity for %s: %s", item.get('name', 'Unknown'), recommended_quantity)
         
         return int(recommended_quantity)
     
@@ -175,8 +231,7 @@ class ReplenishmentPolicy:
             if average_daily_demand <= 0:
                 return 0
             
-            # Z-score for service level (95% = 1.645, 99% = 2.33)
-            z_score = 1.645 if service_level >= 0.95 else 1.28
+            z_score = self._z_score(service_level)
             
             # Safety stock = Z * sqrt(lead_time) * demand_std_dev
             if demand_std_dev > 0:
@@ -191,6 +246,62 @@ class ReplenishmentPolicy:
             self.logger.warning(f"Could not calculate safety stock for {item.get('name', 'Unknown')}: {str(e)}")
             return 0
     
+    @staticmethod
+    def _z_score(service_level: float) -> float:
+        """Z-score for a service level (95% = 1.645, 99% = 2.33)."""
+        return 1.645 if service_level >= 0.95 else 1.28
+    
+    def _batch_eoq_and_safety(self, items: List[Dict[str, Any]]) -> Tuple[List[int], List[int]]:
+        """
+        Compute EOQ and safety stock for many items with the array kernels.
+        
+        Items with any field that is not a plain int/float use the per-item
+        methods, so both paths agree on what counts as invalid.
+        
+        Args:
+            items: Inventory items
+            
+        Returns:
+            Tuple of (eoq quantities, safety stock quantities), one per item
+        """
+        lead_time_default = self.lead_time_days
+        eoq_quantities = [0] * len(items)
+        safety_quantities = [0] * len(items)
+        
+        try:
+            holding_cost_rate = float(getattr(self.config, 'holding_cost_rate', 0.25))
+            order_cost = float(getattr(self.config, 'order_cost', 50.0))
+            z_score = self._z_score(getattr(self.config, 'service_level', 0.95))
+        except (TypeError, ValueError):
+            return ([self._calculate_eoq(item) for item in items],
+                    [self._calculate_safety_stock(item) for item in items])
+        
+        # One pass over the items pulls every kernel field; only rows of plain
+        # numbers go through the kernels, since NumPy would coerce strings
+        # and None that the per-item methods treat as invalid
+        positions, rows = [], []
+        for i, item in enumerate(items):
+            row = (item.get('annual_demand', 0), item.get('unit_cost', 0.0), item.get('average_daily_demand', 0),
+                   item.get('demand_std_deviation', 0), item.get('lead_time_days', lead_time_default))
+            if all(isinstance(value, _NUMERIC_TYPES) for value in row):
+                positions.append(i)
+                rows.append(row)
+            else:
+                eoq_quantities[i] = self._calculate_eoq(item)
+                safety_quantities[i] = self._calculate_safety_stock(item)
+        
+        if rows:
+            fields = np.array(rows, dtype=np.float64)
+            annual_demand, unit_cost, average_daily_demand, demand_std_dev, lead_time_days = fields.T
+            eoq = _eoq_kernel(annual_demand, unit_cost, holding_cost_rate, order_cost)
+            safety = _safety_kernel(average_daily_demand, demand_std_dev, lead_time_days,
+                                    z_score, self.safety_stock_multiplier)
+            for i, eoq_qty, safety_qty in zip(positions, eoq.tolist(), safety.tolist()):
+                eoq_quantities[i] = eoq_qty
+                safety_quantities[i] = safety_qty
+        
+        return eoq_quantities, safety_quantities
+    
     def should_expedite_order(self, item: Dict[str, Any]) -> bool:
         """
         Determine if an order should be expedited based on criticality.
@@ -215,8 +326,7 @@ class ReplenishmentPolicy:
             return True
         
         # Expedite if item has high priority
-        priority = item.get('priority', 'normal').lower()
-        if priority in ['high', 'critical', 'urgent']:
+        if item.get('priority', 'normal').lower() in self._expedite_priority:
             return True
         
         return False
@@ -242,8 +352,11 @@ class ReplenishmentPolicy:
             'total_estimated_cost': 0.0
         }
         
-        for item in low_stock_items:
-            order_qty = self.calculate_order_quantity(item)
+        eoq_quantities, safety_quantities = self._batch_eoq_and_safety(low_stock_items)
+        estimated_costs = []
+        
+        for item, eoq_qty, safety_qty in zip(low_stock_items, eoq_quantities, safety_quantities):
+            order_qty = self._order_quantity(item, eoq_qty, safety_qty)
             is_expedited = self.should_expedite_order(item)
             estimated_cost = order_qty * item.get('unit_cost', 0.0)
             
@@ -256,9 +369,12 @@ class ReplenishmentPolicy:
             }
             
             recommendations['reorder_items'].append(reorder_item)
-            recommendations['total_estimated_cost'] += estimated_cost
+            estimated_costs.append(estimated_cost)
             
             if is_expedited:
                 recommendations['expedited_items'].append(reorder_item)
         
+        # Summed once with fsum: exact rounding and no running float accumulator
+        recommendations['total_estimated_cost'] = math.fsum(estimated_costs)
+        
         return recommendations
\ No newline at end of file
@@ -5,7 +5,7 @@ This package contains utility modules and helper functions for the
 Inventory Replenishment Copilot.
 """
 
-from .config import Config
+from .config import Config, get_config
 from .logger import setup_logger
 
-__all__ = ["Config", "setup_logger"]
\ No newline at end of file
+__all__ = ["Config", "get_config", "setup_logger"]
\ No newline at end of file
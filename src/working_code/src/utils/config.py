@@ -5,100 +5,202 @@ Handles all configuration settings and environment variables for the application
 """
 
 import os
-from typing import Optional
-from pydantic import Field
-from pydantic_settings import BaseSettings
-from dotenv import load_dotenv
+from dataclasses import MISSING, asdict, dataclass, field, fields
+from functools import cached_property, lru_cache
+from types import MappingProxyType
+from typing import Any, Mapping, Optional, Union, get_args, get_origin
 
-# Load environment variables
-load_dotenv()
+# Accepted spellings for boolean environment variables
+_TRUE_VALUES = frozenset({'1', 'true', 'yes', 'on'})
+_FALSE_VALUES = frozenset({'0', 'false', 'no', 'off'})
 
-class Config(BaseSettings):
+# Fields replaced with a placeholder by Config.to_dict
+_SENSITIVE_KEYS = frozenset({
+    'composio_api_key',
+    'notion_api_key',
+    'sender_password',
+    'supplier_api_key',
+    'secret_key',
+    'encryption_key',
+    'groq_api_key',
+    'openai_api_key'
+})
+
+# Supported values for EMAIL_PROVIDER
+_EMAIL_PROVIDERS = frozenset({'gmail', 'smtp'})
+
+
+def _env_field(name: str, default: Any = None, required: bool = False) -> Any:
+    """
+    Declare a config field read from an environment variable.
+    
+    Args:
+        name: Environment variable name
+        default: Value used when the variable is unset
+        required: Whether the variable must be set
+        
+    Returns:
+        Dataclass field carrying the variable name in its metadata
+    """
+    if required:
+        return field(metadata={'env': name})
+    return field(default=default, metadata={'env': name})
+
+
+def _parse_env_value(raw: str, annotation: Any) -> Any:
+    """
+    Convert a raw environment string to the field's annotated type.
+    
+    Args:
+        raw: Environment variable value
+        annotation: Field type (str, int, float, bool or Optional of one)
+        
+    Returns:
+        Typed value
+    """
+    if get_origin(annotation) is Union:
+        annotation = next(arg for arg in get_args(annotation) if arg is not type(None))
+    if annotation is bool:
+        value = raw.strip().lower()
+        if value in _TRUE_VALUES:
+            return True
+        if value in _FALSE_VALUES:
+            return False
+        raise ValueError(f"Invalid boolean value: {raw!r}")
+    return annotation(raw)
+
+
+# Paths already seen to exist; a missing path is checked again on every call
+_EXISTING_PATHS: set = set()
+
+
+def _path_exists(path: str) -> bool:
+    """
+    os.path.exists that remembers only positive results.
+    
+    A file created after a failed check (e.g. credentials written once the
+    process has started) is picked up by the next call.
+    """
+    if path in _EXISTING_PATHS:
+        return True
+    if os.path.exists(path):
+        _EXISTING_PATHS.add(path)
+        return True
+    return False
+
+
+@dataclass(frozen=True, kw_only=True)
+class Config:
     """Configuration settings for the Inventory Replenishment Copilot."""
     
     # Application settings
-    app_name: str = Field(default="Inventory Replenishment Copilot", env="APP_NAME")
-    app_version: str = Field(default="1.0.0", env="APP_VERSION")
-    debug_mode: bool = Field(default=False, env="DEBUG_MODE")
-    log_level: str = Field(default="INFO", env="LOG_LEVEL")
+    app_name: str = _env_field("APP_NAME", "Inventory Replenishment Copilot")
+    app_version: str = _env_field("APP_VERSION", "1.0.0")
+    debug_mode: bool = _env_field("DEBUG_MODE", False)
+    log_level: str = _env_field("LOG_LEVEL", "INFO")
     
     # Composio configuration
-    composio_api_key: str = Field(..., env="COMPOSIO_API_KEY")
-    composio_base_url: str = Field(default="https://backend.composio.dev", env="COMPOSIO_BASE_URL")
+    composio_api_key: str = _env_field("COMPOSIO_API_KEY", required=True)
+    composio_base_url: str = _env_field("COMPOSIO_BASE_URL", "https://backend.composio.dev")
     
     # LLM configuration
-    llm_provider: str = Field(default="groq", env="LLM_PROVIDER")
-    llm_model: str = Field(default="llama-3.3-70b-versatile", env="LLM_MODEL")
-    groq_api_key: Optional[str] = Field(default=None, env="GROQ_API_KEY")
-    openai_api_key: Optional[str] = Field(default=None, env="OPENAI_API_KEY")
+    llm_provider: str = _env_field("LLM_PROVIDER", "groq")
+    llm_model: str = _env_field("LLM_MODEL", "llama-3.3-70b-versatile")
+    groq_api_key: Optional[str] = _env_field("GROQ_API_KEY")
+    openai_api_key: Optional[str] = _env_field("OPENAI_API_KEY")
     
     # Google Sheets configuration
-    google_sheets_credentials_json: str = Field(..., env="GOOGLE_SHEETS_CREDENTIALS_JSON")
-    google_sheets_spreadsheet_id: str = Field(..., env="GOOGLE_SHEETS_SPREADSHEET_ID")
-    google_sheets_worksheet_name: str = Field(default="Inventory", env="GOOGLE_SHEETS_WORKSHEET_NAME")
+    google_sheets_credentials_json: str = _env_field("GOOGLE_SHEETS_CREDENTIALS_JSON", required=True)
+    google_sheets_spreadsheet_id: str = _env_field("GOOGLE_SHEETS_SPREADSHEET_ID", required=True)
+    google_sheets_worksheet_name: str = _env_field("GOOGLE_SHEETS_WORKSHEET_NAME", "Inventory")
     
     # Notion configuration
-    notion_api_key: str = Field(..., env="NOTION_TOKEN")
-    notion_database_id: str = Field(..., env="NOTION_DB_ID")
+    notion_api_key: str = _env_field("NOTION_TOKEN", required=True)
+    notion_database_id: str = _env_field("NOTION_DB_ID", required=True)
     
     # Email configuration
-    email_provider: str = Field(default="gmail", env="EMAIL_PROVIDER")
-    sender_email: str = Field(..., env="GMAIL_EMAIL")
-    sender_password: str = Field(..., env="GMAIL_APP_PASSWORD")
+    email_provider: str = _env_field("EMAIL_PROVIDER", "gmail")
+    sender_email: str = _env_field("GMAIL_EMAIL", required=True)
+    sender_password: str = _env_field("GMAIL_APP_PASSWORD", required=True)
     
     # SMTP configuration (alternative to Gmail)
-    smtp_server: Optional[str] = Field(default=None, env="SMTP_SERVER")
-    smtp_port: int = Field(default=587, env="SMTP_PORT")
-    smtp_use_tls: bool = Field(default=True, env="SMTP_USE_TLS")
+    smtp_server: Optional[str] = _env_field("SMTP_SERVER")
+    smtp_port: int = _env_field("SMTP_PORT", 587)
+    smtp_use_tls: bool = _env_field("SMTP_USE_TLS", True)
     
     # Supplier API configuration (optional)
-    supplier_api_base_url: Optional[str] = Field(default=None, env="SUPPLIER_API_BASE_URL")
-    supplier_api_key: Optional[str] = Field(default=None, env="SUPPLIER_API_KEY")
-    supplier_api_version: str = Field(default="v1", env="SUPPLIER_API_VERSION")
+    supplier_api_base_url: Optional[str] = _env_field("SUPPLIER_API_BASE_URL")
+    supplier_api_key: Optional[str] = _env_field("SUPPLIER_API_KEY")
+    supplier_api_version: str = _env_field("SUPPLIER_API_VERSION", "v1")
     
     # Agent configuration
-    check_interval: int = Field(default=3600, env="AGENT_CHECK_INTERVAL")  # seconds
-    inventory_threshold_percentage: float = Field(default=20.0, env="INVENTORY_THRESHOLD_PERCENTAGE")
-    max_retry_attempts: int = Field(default=3, env="MAX_RETRY_ATTEMPTS")
+    check_interval: int = _env_field("AGENT_CHECK_INTERVAL", 3600)  # seconds
+    inventory_threshold_percentage: float = _env_field("INVENTORY_THRESHOLD_PERCENTAGE", 20.0)
+    max_retry_attempts: int = _env_field("MAX_RETRY_ATTEMPTS", 3)
     
     # Database configuration
-    database_url: str = Field(default="sqlite:///inventory.db", env="DATABASE_URL")
+    database_url: str = _env_field("DATABASE_URL", "sqlite:///inventory.db")
     
     # Security
-    secret_key: str = Field(..., env="SECRET_KEY")
-    encryption_key: Optional[str] = Field(default=None, env="ENCRYPTION_KEY")
+    secret_key: str = _env_field("SECRET_KEY", required=True)
+    encryption_key: Optional[str] = _env_field("ENCRYPTION_KEY")
     
     # Business logic parameters
-    safety_stock_multiplier: float = Field(default=1.2, env="SAFETY_STOCK_MULTIPLIER")
-    default_lead_time_days: int = Field(default=7, env="DEFAULT_LEAD_TIME_DAYS")
-    holding_cost_rate: float = Field(default=0.25, env="HOLDING_COST_RATE")
-    order_cost: float = Field(default=50.0, env="ORDER_COST")
-    service_level: float = Field(default=0.95, env="SERVICE_LEVEL")
+    safety_stock_multiplier: float = _env_field("SAFETY_STOCK_MULTIPLIER", 1.2)
+    default_lead_time_days: int = _env_field("DEFAULT_LEAD_TIME_DAYS", 7)
+    holding_cost_rate: float = _env_field("HOLDING_COST_RATE", 0.25)
+    order_cost: float = _env_field("ORDER_COST", 50.0)
+    service_level: float = _env_field("SERVICE_LEVEL", 0.95)
     
     # Company information
-    company_name: str = Field(default="Your Company", env="COMPANY_NAME")
-    company_email: Optional[str] = Field(default=None, env="COMPANY_EMAIL")
-    company_phone: Optional[str] = Field(default=None, env="COMPANY_PHONE")
-    
-    class Config:
-        """Pydantic configuration."""
-        env_file = ".env"
-        env_file_encoding = "utf-8"
-        case_sensitive = False
-    
-    def __init__(self, **kwargs):
-        """Initialize configuration with validation."""
-        super().__init__(**kwargs)
+    company_name: str = _env_field("COMPANY_NAME", "Your Company")
+    company_email: Optional[str] = _env_field("COMPANY_EMAIL")
+    company_phone: Optional[str] = _env_field("COMPANY_PHONE")
+    
+    @classmethod
+    def from_env(cls) -> "Config":
+        """
+        Build the configuration from environment variables.
+        
+        Returns:
+            Config instance
+            
+        Raises:
+            ValueError: If required variables are missing or a value cannot be parsed
+        """
+        # One snapshot gives a consistent view and plain dict lookups per field
+        environ = dict(os.environ)
+        values = {}
+        missing = []
+        for f in fields(cls):
+            name = f.metadata['env']
+            raw = environ.get(name)
+            if raw is None:
+                if f.default is MISSING:
+                    missing.append(name)
+                continue
+            try:
+                values[f.name] = _parse_env_value(raw, f.type)
+            except ValueError as e:
+                raise ValueError(f"Invalid value for {name}: {e}") from e
+        
+        if missing:
+            raise ValueError(f"Missing required environment variables: {', '.join(missing)}")
+        
+        return cls(**values)
+    
+    def __post_init__(self):
+        """Validate configuration on construction."""
         self._validate_config()
     
     def _validate_config(self):
         """Validate configuration settings."""
         # Validate file paths
-        if not os.path.exists(self.google_credentials_file):
-            raise ValueError(f"Google credentials file not found: {self.google_credentials_file}")
+        if not _path_exists(self.google_sheets_credentials_json):
+            raise ValueError(f"Google credentials file not found: {self.google_sheets_credentials_json}")
         
         # Validate email provider
-        if self.email_provider not in ['gmail', 'smtp']:
+        if self.email_provider not in _EMAIL_PROVIDERS:
             raise ValueError(f"Invalid email provider: {self.email_provider}")
         
         # Validate SMTP configuration if using SMTP
@@ -122,10 +224,11 @@ class Config(BaseSettings):
         """Check if running in production mode."""
         return not self.debug_mode
     
-    def get_smtp_config(self) -> dict:
-        """Get SMTP configuration as dictionary."""
+    @cached_property
+    def smtp_config(self) -> Mapping[str, Any]:
+        """Read-only SMTP configuration for the selected email provider, built once."""
         if self.email_provider == 'gmail':
-            return {
+            smtp_config = {
                 'server': 'smtp.gmail.com',
                 'port': 587,
                 'use_tls': True,
@@ -133,13 +236,18 @@ class Config(BaseSettings):
                 'password': self.sender_password
             }
         else:
-            return {
+            smtp_config = {
                 'server': self.smtp_server,
                 'port': self.smtp_port,
                 'use_tls': self.smtp_use_tls,
                 'username': self.sender_email,
                 'password': self.sender_password
             }
+        return MappingProxyType(smtp_config)
+    
+    def get_smtp_config(self) -> dict:
+        """Get SMTP configuration as dictionary."""
+        return dict(self.smtp_config)
     
     def get_database_config(self) -> dict:
         """Get database configuration as dictionary."""
@@ -148,24 +256,29 @@ class Config(BaseSettings):
             'echo': self.debug_mode
         }
     
+    @cached_property
+    def _redacted(self) -> dict:
+        """Field values with sensitive entries hidden, built once per instance."""
+        return {key: ("***HIDDEN***" if key in _SENSITIVE_KEYS else value)
+                for key, value in asdict(self).items()}
+    
     def to_dict(self) -> dict:
         """Convert configuration to dictionary (excluding sensitive data)."""
-        config_dict = self.dict()
-        
-        # Remove sensitive information
-        sensitive_keys = [
-            'composio_api_key',
-            'notion_api_key', 
-            'sender_password',
-            'supplier_api_key',
-            'secret_key',
-            'encryption_key',
-            'groq_api_key',
-            'openai_api_key'
-        ]
-        
-        for key in sensitive_keys:
-            if key in config_dict:
-                config_dict[key] = "***HIDDEN***"
-        
-        return config_dict
\ No newline at end of file
+        return dict(self._redacted)
+
+
+@lru_cache(maxsize=1)
+def get_config() -> Config:
+    """
+    Get the process-wide configuration, built and validated on first use.
+    
+    Loads .env into the environment first; dotenv is only imported here so
+    modules that never read the config don't pay for it. Call
+    get_config.cache_clear() to re-read the environment (e.g. in tests).
+    
+    Returns:
+        Shared Config instance
+    """
+    from dotenv import load_dotenv
+    load_dotenv()
+    return Config.from_env()
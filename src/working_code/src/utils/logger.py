@@ -7,29 +7,59 @@ Provides consistent logging configuration and utilities for the application.
 import logging
 import sys
 from typing import Optional
-from loguru import logger
 import os
-from datetime import datetime
+from functools import cached_property, wraps
+from time import perf_counter
 
-def setup_logger(
-    name: Optional[str] = None,
-    level: str = "INFO",
-    log_file: Optional[str] = None,
-    rotation: str = "1 day",
-    retention: str = "30 days"
-) -> logging.Logger:
+# Settings the current loguru sinks were built with (None until the first setup_logger call)
+_sink_settings = None
+
+class InterceptHandler(logging.Handler):
+    """
+    Standard library logging handler that forwards records to loguru.
     """
-    Set up a logger with consistent formatting and configuration.
+    
+    def __init__(self, sink_logger):
+        """
+        Initialize the handler.
+        
+        Args:
+            sink_logger: loguru logger that receives the records
+        """
+        super().__init__()
+        self.sink_logger = sink_logger
+    
+    def emit(self, record):
+        # Get corresponding Loguru level if it exists
+        try:
+            level = self.sink_logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+
+        # Find caller from where originated the logged message
+        frame, depth = logging.currentframe(), 2
+        while frame.f_code.co_filename == logging.__file__:
+            frame = frame.f_back
+            depth += 1
+
+        self.sink_logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+
+def _configure_sinks(
+    logger,
+    level: str,
+    log_file: Optional[str],
+    rotation: str,
+    retention: str
+) -> None:
+    """
+    Replace loguru's sinks with the console sink and optional file sink.
     
     Args:
-        name: Logger name (defaults to calling module)
-        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        logger: loguru logger
+        level: Logging level for all sinks
         log_file: Optional log file path
         rotation: Log rotation policy
         retention: Log retention policy
-        
-    Returns:
-        Configured logger instance
     """
     # Remove default loguru handler
     logger.remove()
@@ -49,8 +79,8 @@ def setup_logger(
     if log_file:
         # Ensure log directory exists
         log_dir = os.path.dirname(log_file)
-        if log_dir and not os.path.exists(log_dir):
-            os.makedirs(log_dir)
+        if log_dir:
+            os.makedirs(log_dir, exist_ok=True)
         
         logger.add(
             log_file,
@@ -60,27 +90,40 @@ def setup_logger(
             retention=retention,
             compression="zip"
         )
-    
-    # Create standard library logger that forwards to loguru
-    class InterceptHandler(logging.Handler):
-        def emit(self, record):
-            # Get corresponding Loguru level if it exists
-            try:
-                level = logger.level(record.levelname).name
-            except ValueError:
-                level = record.levelno
-
-            # Find caller from where originated the logged message
-            frame, depth = logging.currentframe(), 2
-            while frame.f_code.co_filename == logging.__file__:
-                frame = frame.f_back
-                depth += 1
 
-            logger.opt(depth=depth, exception=record.exc_info).log(level, record.getMessage())
+def setup_logger(
+    name: Optional[str] = None,
+    level: str = "INFO",
+    log_file: Optional[str] = None,
+    rotation: str = "1 day",
+    retention: str = "30 days"
+) -> logging.Logger:
+    """
+    Set up a logger with consistent formatting and configuration.
+    
+    Args:
+        name: Logger name (defaults to calling module)
+        level: Logging level (DEBUG, INFO, WARNING, ERROR, CRITICAL)
+        log_file: Optional log file path
+        rotation: Log rotation policy
+        retention: Log retention policy
+        
+    Returns:
+        Configured logger instance
+    """
+    # Imported on first use: loguru is only needed once logging is set up
+    from loguru import logger
+    
+    # Sinks are global to loguru; only rebuild them when the settings change
+    global _sink_settings
+    sink_settings = (level, log_file, rotation, retention)
+    if sink_settings != _sink_settings:
+        _configure_sinks(logger, *sink_settings)
+        _sink_settings = sink_settings
     
-    # Set up standard library logger
+    # Set up standard library logger that forwards to loguru
     stdlib_logger = logging.getLogger(name)
-    stdlib_logger.handlers = [InterceptHandler()]
+    stdlib_logger.handlers = [InterceptHandler(logger)]
     stdlib_logger.setLevel(getattr(logging, level.upper()))
     
     return stdlib_logger
@@ -107,20 +150,25 @@ def log_function_call(func):
     Returns:
         Decorated function
     """
+    func_logger = get_logger(func.__module__)
+    
+    @wraps(func)
     def wrapper(*args, **kwargs):
-        func_logger = get_logger(func.__module__)
-        start_time = datetime.now()
+        # Skip building entry/exit messages (and repr of the arguments) unless DEBUG is on
+        debug = func_logger.isEnabledFor(logging.DEBUG)
+        start_time = perf_counter()
         
         # Log function entry
-        func_logger.debug(f"Entering {func.__name__} with args={args}, kwargs={kwargs}")
+        if debug:
+            func_logger.debug("Entering %s with args=%s, kwargs=%s", func.__name__, args, kwargs)
         
         try:
             result = func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            func_logger.debug(f"Exiting {func.__name__} successfully (took {execution_time:.3f}s)")
+            if debug:
+                func_logger.debug("Exiting %s successfully (took %.3fs)", func.__name__, perf_counter() - start_time)
             return result
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = perf_counter() - start_time
             func_logger.error(f"Error in {func.__name__} after {execution_time:.3f}s: {str(e)}")
             raise
     
@@ -136,20 +184,25 @@ def log_async_function_call(func):
     Returns:
         Decorated async function
     """
+    func_logger = get_logger(func.__module__)
+    
+    @wraps(func)
     async def wrapper(*args, **kwargs):
-        func_logger = get_logger(func.__module__)
-        start_time = datetime.now()
+        # Skip building entry/exit messages (and repr of the arguments) unless DEBUG is on
+        debug = func_logger.isEnabledFor(logging.DEBUG)
+        start_time = perf_counter()
         
         # Log function entry
-        func_logger.debug(f"Entering async {func.__name__} with args={args}, kwargs={kwargs}")
+        if debug:
+            func_logger.debug("Entering async %s with args=%s, kwargs=%s", func.__name__, args, kwargs)
         
         try:
             result = await func(*args, **kwargs)
-            execution_time = (datetime.now() - start_time).total_seconds()
-            func_logger.debug(f"Exiting async {func.__name__} successfully (took {execution_time:.3f}s)")
+            if debug:
+                func_logger.debug("Exiting async %s successfully (took %.3fs)", func.__name__, perf_counter() - start_time)
             return result
         except Exception as e:
-            execution_time = (datetime.now() - start_time).total_seconds()
+            execution_time = perf_counter() - start_time
             func_logger.error(f"Error in async {func.__name__} after {execution_time:.3f}s: {str(e)}")
             raise
     
@@ -160,9 +213,9 @@ class LoggerMixin:
     Mixin class to add logging capabilities to any class.
     """
     
-    @property
+    @cached_property
     def logger(self) -> logging.Logger:
-        """Get logger for this class."""
+        """Get logger for this class (looked up once per instance)."""
         return get_logger(self.__class__.__module__)
     
     def log_info(self, message: str, **kwargs):
@@ -185,6 +238,16 @@ class LoggerMixin:
         """Log critical message."""
         self.logger.critical(message, **kwargs)
 
+# Noisy third-party loggers quieted by configure_third_party_loggers
+_NOISY_LOGGERS = (
+    'urllib3.connectionpool',
+    'requests.packages.urllib3.connectionpool',
+    'googleapiclient.discovery',
+    'googleapiclient.discovery_cache',
+    'google.auth.transport.requests',
+    'notion_client.client'
+)
+
 def configure_third_party_loggers(level: str = "WARNING"):
     """
     Configure third-party library loggers to reduce noise.
@@ -192,18 +255,9 @@ def configure_third_party_loggers(level: str = "WARNING"):
     Args:
         level: Logging level for third-party loggers
     """
-    # List of noisy third-party loggers
-    noisy_loggers = [
-        'urllib3.connectionpool',
-        'requests.packages.urllib3.connectionpool',
-        'googleapiclient.discovery',
-        'googleapiclient.discovery_cache',
-        'google.auth.transport.requests',
-        'notion_client.client'
-    ]
-    
-    for logger_name in noisy_loggers:
-        logging.getLogger(logger_name).setLevel(getattr(logging, level.upper()))
+    log_level = getattr(logging, level.upper())
+    for logger_name in _NOISY_LOGGERS:
+        logging.getLogger(logger_name).setLevel(log_level)
 
 # Configure third-party loggers by default
 configure_third_party_loggers()
\ No newline at end of file
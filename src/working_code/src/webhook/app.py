@@ -19,6 +19,7 @@ from pathlib import Path
 from fastapi import FastAPI, Request, HTTPException, Query
 from fastapi.responses import HTMLResponse
 import uvicorn
+from dotenv import load_dotenv
 import sys
 sys.path.append(os.path.dirname(os.path.abspath(os.path.dirname(__file__))))
 # Import our modules
@@ -28,6 +29,9 @@ from connectors.sheets_connector import SheetsConnector
 from utils.logger import setup_logger
 from src.utils.config import Config
 
+# Load environment variables
+load_dotenv()
+
 # Setup logging
 logger = setup_logger(__name__)
 
@@ -5,6 +5,12 @@ import unittest
 from unittest.mock import Mock, patch, MagicMock
 import sys
 import os
+import gc
+import itertools
+import logging
+import tempfile
+import weakref
+import gspread
 
 # Add the project root to the Python path
 sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
@@ -12,6 +18,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')
 from src.connectors.sheets_connector import SheetsConnector
 from src.connectors.notion_connector import NotionConnector
 from src.connectors.email_connector import EmailConnector
+from src.connectors.supplier_connector import SupplierConnector
 
 
 class TestSheetsConnector(unittest.TestCase):
@@ -44,6 +51,294 @@ class TestSheetsConnector(unittest.TestCase):
             pass
 
 
+class TestSheetsConnectorReads(unittest.TestCase):
+    """Test cases for SheetsConnector worksheet reads."""
+    
+    def setUp(self):
+        """Set up a connector backed by a mocked spreadsheet."""
+        with patch.object(SheetsConnector, '_initialize_client'):
+            self.connector = SheetsConnector(Mock())
+        self.connector.spreadsheet = Mock()
+        worksheet_values = {
+            'Transactions': [['Date', '2024-01-10', '2024-02-10'],
+                             ['SKU', 'WIDGET-001', 'WIDGET-001'],
+                             ['Qty', -5, -3]],
+            'Inventory': [['SKU', 'WIDGET-001'], ['Description', 'Widget'], ['OnHand', 15],
+                          ['Unit', 'pcs'], ['LeadTimeDays', 7], ['MinOrderQty', 10],
+                          ['VendorIDs', 'acme, quick_ship'], ['AutoOrderThreshold', 500],
+                          ['TrustScore', 85]],
+        }
+        self.connector.spreadsheet.values_batch_get.side_effect = lambda ranges, params=None: {
+            'valueRanges': [{'values': worksheet_values[r.split('!')[0].strip("'")]} for r in ranges]
+        }
+    
+    def test_records_cached_within_ttl(self):
+        """Test repeated reads reuse the fetched worksheet records."""
+        self.connector.read_transactions('2024-01-01', '2024-01-31')
+        self.connector.read_transactions('2024-01-01', '2024-03-31')
+        self.assertEqual(self.connector.spreadsheet.values_batch_get.call_count, 1)
+    
+    def test_clear_cache_forces_refetch(self):
+        """Test clear_cache drops cached records."""
+        self.connector.read_transactions('2024-01-01', '2024-01-31')
+        self.connector.clear_cache()
+        self.connector.read_transactions('2024-01-01', '2024-01-31')
+        self.assertEqual(self.connector.spreadsheet.values_batch_get.call_count, 2)
+    
+    def test_read_transactions_filters_date_range(self):
+        """Test transactions outside the date range are dropped."""
+        transactions = self.connector.read_transactions('2024-01-01', '2024-01-31')
+        self.assertEqual(len(transactions), 1)
+        self.assertEqual(transactions[0]['date'], '2024-01-10')
+        self.assertEqual(transactions[0]['qty'], -5.0)
+    
+    def test_read_transactions_warns_on_malformed_ten_character_dates(self):
+        """Test a malformed date of ISO length is reported, not dropped silently."""
+        self.connector.spreadsheet.values_batch_get.side_effect = lambda ranges, params=None: {'valueRanges': [
+            {'values': [['Date', '01/15/2024', '2024-01-10'], ['SKU', 'A', 'B'], ['Qty', 1, 2]]},
+            {'values': [['SKU']]},
+        ]}
+        
+        with self.assertLogs('src.connectors.sheets_connector', level='WARNING') as logs:
+            transactions = self.connector.read_transactions('2024-01-01', '2024-01-31')
+        
+        self.assertEqual([t['sku'] for t in transactions], ['B'])
+        self.assertTrue(any("Row 2: Invalid date format '01/15/2024'" in line for line in logs.output))
+    
+    def test_read_transactions_sku_filter(self):
+        """Test transactions for SKUs outside the filter are dropped."""
+        self.assertEqual(
+            self.connector.read_transactions('2024-01-01', '2024-12-31', sku_filter={'GADGET-002'}), []
+        )
+        self.assertEqual(
+            len(self.connector.read_transactions('2024-01-01', '2024-12-31', sku_filter=['WIDGET-001'])), 2
+        )
+    
+    def test_large_worksheet_read_in_pages(self):
+        """Test worksheets longer than one page are read page by page."""
+        self.connector.PAGE_ROWS = 2
+        spreadsheet = self.connector.spreadsheet
+        spreadsheet.values_batch_get.side_effect = None
+        spreadsheet.values_batch_get.return_value = {'valueRanges': [
+            {'range': "'Transactions'!A1:C2",
+             'values': [['Date', '2024-01-01'], ['SKU', 'A'], ['Qty', 1]]},
+            {'range': "'Inventory'!A1:I1", 'values': [['SKU']]},
+        ]}
+        spreadsheet.values_get.side_effect = [
+            {'range': "'Transactions'!A3:C4",
+             'values': [['2024-01-02', '2024-01-03'], ['B', 'C'], [2, 3]]},
+            {'range': "'Transactions'!A5:C5", 'values': [['2024-01-04'], ['D']]},
+        ]
+        
+        records = self.connector._get_records('Transactions')
+        
+        self.assertEqual([r['SKU'] for r in records], ['A', 'B', 'C', 'D'])
+        self.assertEqual(records[-1]['Qty'], '')
+        self.assertEqual(spreadsheet.values_get.call_count, 2)
+    
+    def test_worksheet_with_exactly_one_full_page(self):
+        """Test a grid ending on a page boundary stops at the API's grid-limit error."""
+        self.connector.PAGE_ROWS = 3
+        spreadsheet = self.connector.spreadsheet
+        spreadsheet.values_batch_get.side_effect = None
+        spreadsheet.values_batch_get.return_value = {'valueRanges': [
+            {'range': "'Transactions'!A1:C3",
+             'values': [['Date', '2024-01-02', '2024-01-03'], ['SKU', 'A', 'B'], ['Qty', 1, 2]]},
+        ]}
+        spreadsheet.values_get.side_effect = gspread.exceptions.APIError(Mock(json=Mock(return_value={
+            'error': {'code': 400, 'status': 'INVALID_ARGUMENT',
+                      'message': "Range ('Transactions'!4:6) exceeds grid limits. Max rows: 3, max columns: 3"}
+        })))
+        
+        records = self.connector._get_records('Transactions')
+        
+        self.assertEqual([r['SKU'] for r in records], ['A', 'B'])
+        spreadsheet.values_get.assert_called_once()
+    
+    def test_page_row_numbers_survive_trailing_empty_rows(self):
+        """Test full pages whose last rows are empty keep later row numbers aligned."""
+        self.connector.PAGE_ROWS = 3
+        spreadsheet = self.connector.spreadsheet
+        spreadsheet.values_batch_get.side_effect = None
+        spreadsheet.values_batch_get.return_value = {'valueRanges': [
+            # Row 3 is empty, so the API returns only the header and row 2
+            {'range': "'Transactions'!A1:C3",
+             'values': [['Date', '2024-01-02'], ['SKU', 'A'], ['Qty', 1]]},
+            {'range': "'Inventory'!A1:I1", 'values': [['SKU']]},
+        ]}
+        spreadsheet.values_get.side_effect = [
+            # Rows 5 and 6 are empty
+            {'range': "'Transactions'!A4:C6", 'values': [['2024-01-04'], ['B'], [2]]},
+            {'range': "'Transactions'!A7:C7", 'values': [['2024-01-07'], ['C'], [3]]},
+        ]
+        
+        transactions = self.connector.read_transactions('2024-01-01', '2024-01-31')
+        
+        self.assertEqual([(t['sku'], t['row_number']) for t in transactions], [('A', 2), ('B', 4), ('C', 7)])
+    
+    def test_values_params_not_shared_between_requests(self):
+        """Test gspread's in-place ``ranges`` update does not leak into later requests."""
+        http_client = gspread.http_client.HTTPClient(auth=Mock(), session=Mock())
+        sent_params = []
+        
+        def request(method, url, params=None, **kwargs):
+            sent_params.append(dict(params))
+            response = Mock(ok=True)
+            if 'ranges' in params:
+                response.json.return_value = {'valueRanges': [
+                    {'range': f"'{t}'!A1:A2", 'values': [['SKU', 'A', 'B']]} for t in params['ranges']
+                ]}
+            else:
+                response.json.return_value = {'range': "'Inventory'!A3:A3", 'values': [['C']]}
+            return response
+        
+        http_client.session.request.side_effect = request
+        spreadsheet = gspread.Spreadsheet.__new__(gspread.Spreadsheet)
+        spreadsheet.client = http_client
+        spreadsheet._properties = {'id': 'sheet-id'}
+        self.connector.spreadsheet = spreadsheet
+        self.connector.PAGE_ROWS = 2
+        
+        self.connector._get_records('Inventory')
+        self.connector.clear_cache()
+        self.connector._get_records('Transactions')
+        
+        self.assertEqual([p.get('ranges') for p in sent_params], [
+            ["'Inventory'!1:2"],
+            None,
+            ["'Transactions'!1:2", "'Inventory'!1:2"],
+            None,
+            None,
+        ])
+        self.assertEqual(SheetsConnector.VALUES_PARAMS.keys(),
+                         {'majorDimension', 'valueRenderOption', 'dateTimeRenderOption'})
+    
+    def test_read_inventory_without_transactions_worksheet(self):
+        """Test a missing Transactions worksheet only fails reads that ask for it."""
+        spreadsheet = self.connector.spreadsheet
+        batch_get = spreadsheet.values_batch_get.side_effect
+        missing_range = gspread.exceptions.APIError(Mock(json=Mock(return_value={
+            'error': {'code': 400, 'message': 'Unable to parse range', 'status': 'INVALID_ARGUMENT'}
+        })))
+        
+        def values_batch_get(ranges, params=None):
+            if any(r.startswith("'Transactions'") for r in ranges):
+                raise missing_range
+            return batch_get(ranges, params)
+        
+        def worksheet(title):
+            if title == 'Transactions':
+                raise gspread.WorksheetNotFound(title)
+            return Mock()
+        
+        spreadsheet.values_batch_get.side_effect = values_batch_get
+        spreadsheet.worksheet.side_effect = worksheet
+        
+        inventory = self.connector.read_inventory()
+        
+        self.assertEqual([item['sku'] for item in inventory], ['WIDGET-001'])
+        with self.assertRaisesRegex(ValueError, "Worksheet 'Transactions' not found"):
+            self.connector._get_records('Transactions')
+    
+    def test_read_as_dataframe(self):
+        """Test the DataFrame forms carry the same rows with typed columns."""
+        inventory = self.connector.read_inventory(as_dataframe=True)
+        self.assertEqual(list(inventory['sku']), ['WIDGET-001'])
+        self.assertEqual(str(inventory['on_hand'].dtype), 'int32')
+        
+        transactions = self.connector.read_transactions('2024-01-01', '2024-12-31', as_dataframe=True)
+        self.assertEqual(len(transactions), 2)
+        self.assertEqual(transactions['qty'].sum(), -8.0)
+        self.assertTrue(str(transactions['date'].dtype).startswith('datetime64'))
+    
+    def test_read_transactions_uses_query_pushdown(self):
+        """Test the date filter is pushed to the query API when not cached."""
+        self.connector.client = Mock()
+        self.connector.client.http_client.request.return_value.text = (
+            '/*O_o*/\ngoogle.visualization.Query.setResponse({"status":"ok","table":{'
+            '"cols":[{"id":"A","label":"Date","type":"date"},'
+            '{"id":"B","label":"SKU","type":"string"},'
+            '{"id":"C","label":"Qty","type":"number"}],'
+            '"rows":[{"c":[{"v":"Date(2024,0,10)"},{"v":"WIDGET-001"},{"v":-5.0}]}]}});'
+        )
+        transactions = self.connector.read_transactions('2024-01-01', '2024-01-31')
+        self.assertEqual(transactions, [
+            {'date': '2024-01-10', 'sku': 'WIDGET-001', 'qty': -5.0, 'row_number': None}
+        ])
+        self.connector.spreadsheet.values_batch_get.assert_not_called()
+    
+    def test_query_pushdown_falls_back_on_mixed_type_skus(self):
+        """Test null cells from a mixed-type SKU column send the read to the full scan."""
+        self.connector.client = Mock()
+        self.connector.client.http_client.request.return_value.text = (
+            'google.visualization.Query.setResponse({"status":"ok","table":{'
+            '"cols":[{"id":"A","label":"Date","type":"date"},'
+            '{"id":"B","label":"SKU","type":"number"},'
+            '{"id":"C","label":"Qty","type":"number"}],'
+            '"rows":[{"c":[{"v":"Date(2024,0,10)"},{"v":123.0},{"v":-5.0}]},'
+            '{"c":[{"v":"Date(2024,0,11)"},null,{"v":-2.0}]}]}});'
+        )
+        self.connector.spreadsheet.values_batch_get.side_effect = lambda ranges, params=None: {'valueRanges': [
+            {'values': [['Date', '2024-01-10', '2024-01-11'], ['SKU', 123, 'WIDGET-001'], ['Qty', -5, -2]]},
+            {'values': [['SKU']]},
+        ]}
+        
+        transactions = self.connector.read_transactions('2024-01-01', '2024-01-31')
+        
+        self.assertEqual([(t['sku'], t['row_number']) for t in transactions], [('123', 2), ('WIDGET-001', 3)])
+    
+    def test_query_pushdown_numeric_skus_match_full_scan(self):
+        """Test whole-number SKUs from the query API read as "123", not "123.0"."""
+        self.connector.client = Mock()
+        self.connector.client.http_client.request.return_value.text = (
+            'google.visualization.Query.setResponse({"status":"ok","table":{'
+            '"cols":[{"id":"A","label":"Date","type":"date"},'
+            '{"id":"B","label":"SKU","type":"number"},'
+            '{"id":"C","label":"Qty","type":"number"}],'
+            '"rows":[{"c":[{"v":"Date(2024,0,10)"},{"v":123.0},{"v":-5.0}]},'
+            '{"c":[null,null,null]}]}});'
+        )
+        
+        transactions = self.connector.read_transactions('2024-01-01', '2024-01-31')
+        
+        self.assertEqual(transactions, [{'date': '2024-01-10', 'sku': '123', 'qty': -5.0, 'row_number': None}])
+        self.connector.spreadsheet.values_batch_get.assert_not_called()
+    
+    def test_read_inventory_keeps_transactions_query_pushdown(self):
+        """Test reading inventory does not prefetch transactions past the query pushdown."""
+        self.connector.client = Mock()
+        self.connector.client.http_client.request.return_value.text = (
+            'google.visualization.Query.setResponse({"status":"ok","table":{'
+            '"cols":[{"id":"A","label":"Date","type":"date"},'
+            '{"id":"B","label":"SKU","type":"string"},'
+            '{"id":"C","label":"Qty","type":"number"}],'
+            '"rows":[{"c":[{"v":"Date(2024,0,10)"},{"v":"WIDGET-001"},{"v":-5.0}]}]}});'
+        )
+        
+        self.connector.read_inventory()
+        transactions = self.connector.read_transactions('2024-01-01', '2024-01-31')
+        
+        self.connector.client.http_client.request.assert_called_once()
+        self.assertEqual(self.connector.spreadsheet.values_batch_get.call_args.args[0], ["'Inventory'!1:10000"])
+        self.assertEqual([t['sku'] for t in transactions], ['WIDGET-001'])
+    
+    def test_read_all_uses_one_request(self):
+        """Test read_all returns both worksheets from a single batch request."""
+        inventory, transactions = self.connector.read_all('2024-01-01', '2024-12-31')
+        self.assertEqual(len(inventory), 1)
+        self.assertEqual(len(transactions), 2)
+        self.assertEqual(self.connector.spreadsheet.values_batch_get.call_count, 1)
+    
+    def test_single_batch_request_serves_both_worksheets(self):
+        """Test reading transactions also warms the inventory cache."""
+        self.connector.read_transactions('2024-01-01', '2024-01-31')
+        inventory = self.connector.read_inventory()
+        self.assertEqual(self.connector.spreadsheet.values_batch_get.call_count, 1)
+        self.assertEqual(inventory[0]['sku'], 'WIDGET-001')
+        self.assertEqual(inventory[0]['on_hand'], 15)
+        self.assertEqual(inventory[0]['vendor_ids'], ['acme', 'quick_ship'])
+
+
 class TestNotionConnector(unittest.TestCase):
     """Test cases for NotionConnector."""
     
@@ -107,6 +402,115 @@ class TestEmailConnector(unittest.TestCase):
         )
         
         self.assertIsNotNone(message_id)
+    
+    def test_info_logging_enabled_after_initialization(self):
+        """Test INFO logs follow the logger level at send time, not at construction."""
+        logger_name = 'src.connectors.email_connector'
+        logger = logging.getLogger(logger_name)
+        original_level = logger.level
+        logger.setLevel(logging.WARNING)
+        try:
+            connector = EmailConnector(demo_mode=True)
+        finally:
+            logger.setLevel(original_level)
+        
+        with self.assertLogs(logger_name, level='INFO') as logs:
+            connector.send_approval_email(
+                to='manager@example.com',
+                subject='Test Approval',
+                html_body='<p>Test body</p>',
+                approve_link='http://example.com/approve',
+                reject_link='http://example.com/reject'
+            )
+        
+        self.assertTrue(any('Demo email written' in line for line in logs.output))
+
+
+
+class TestSupplierConnector(unittest.TestCase):
+    """Test cases for SupplierConnector in demo mode."""
+    
+    def setUp(self):
+        """Run each test in a scratch directory so demo files stay isolated."""
+        self._cwd = os.getcwd()
+        self._tmpdir = tempfile.TemporaryDirectory()
+        os.chdir(self._tmpdir.name)
+        with patch.dict(os.environ, {}, clear=True):
+            self.connector = SupplierConnector()
+    
+    def tearDown(self):
+        """Restore the working directory."""
+        self.connector.close()
+        os.chdir(self._cwd)
+        self._tmpdir.cleanup()
+    
+    def test_get_order_status_after_several_orders(self):
+        """Test simulated orders can be looked up by ID."""
+        self.connector._generate_order_id = Mock(side_effect=['ORD_TEST_1', 'ORD_TEST_2'])
+        first = self.connector.place_order('acme_supplies', 'WIDGET-001', 10)
+        self.connector.get_order_status(first['order_id'])
+        second = self.connector.place_order('quick_ship', 'GADGET-002', 5)
+        
+        status = self.connector.get_order_status(second['order_id'])
+        self.assertEqual(status['sku'], 'GADGET-002')
+        self.assertEqual(status['quantity'], 5)
+        self.assertEqual(self.connector.get_order_status(first['order_id'])['vendor_id'], 'acme_supplies')
+    
+    def test_get_order_status_unknown_order(self):
+        """Test looking up an unknown order raises ValueError."""
+        self.connector.place_order('acme_supplies', 'WIDGET-001', 10)
+        with self.assertRaises(ValueError):
+            self.connector.get_order_status('ORD_UNKNOWN')
+    
+    def test_place_orders_returns_results_in_input_order(self):
+        """Test place_orders fans out and preserves order of results."""
+        self.connector._generate_order_id = Mock(side_effect=map('ORD_TEST_{}'.format, itertools.count()))
+        orders = [('acme_supplies', f'SKU-{i}', i + 1) for i in range(20)]
+        
+        results = self.connector.place_orders(orders)
+        
+        self.assertEqual(len(results), 20)
+        for (vendor_id, sku, qty), result in zip(orders, results):
+            status = self.connector.get_order_status(result['order_id'])
+            self.assertEqual((status['sku'], status['quantity']), (sku, qty))
+    
+    def test_place_order_writes_through(self):
+        """Test a single simulated order is in the CSV as soon as place_order returns."""
+        self.connector.place_order('acme_supplies', 'WIDGET-001', 10)
+        with open(os.path.join('demo', 'supplier_orders.csv')) as f:
+            self.assertEqual(len(f.readlines()), 2)
+    
+    def test_place_orders_flushes_batch(self):
+        """Test a place_orders batch below the flush threshold is on disk when it returns."""
+        orders = [('acme_supplies', f'SKU-{i}', 1) for i in range(5)]
+        self.connector.place_orders(orders)
+        with open(os.path.join('demo', 'supplier_orders.csv')) as f:
+            self.assertEqual(len(f.readlines()), 6)
+    
+    def test_connectors_sharing_csv_write_one_header(self):
+        """Test two connectors created before the CSV exists share it cleanly."""
+        with patch.dict(os.environ, {}, clear=True):
+            other = SupplierConnector()
+        try:
+            first = self.connector.place_order('acme_supplies', 'WIDGET-001', 10)
+            other.place_order('quick_ship', 'GADGET-002', 5)
+            
+            with open(os.path.join('demo', 'supplier_orders.csv')) as f:
+                lines = f.readlines()
+            self.assertEqual(len(lines), 3)
+            self.assertTrue(lines[0].startswith('order_id,'))
+            self.assertEqual(other.get_order_status(first['order_id'])['sku'], 'WIDGET-001')
+        finally:
+            other.close()
+    
+    def test_exit_hook_does_not_keep_connector_alive(self):
+        """Test demo connectors can be garbage collected."""
+        with patch.dict(os.environ, {}, clear=True):
+            connector = SupplierConnector()
+        ref = weakref.ref(connector)
+        del connector
+        gc.collect()
+        self.assertIsNone(ref())
 
 
 if __name__ == '__main__':
@@ -12,8 +12,11 @@ import unittest
 import math
 from src.policies.eoq_optimizer import (
     calculate_eoq,
+    calculate_eoq_batch,
     calculate_total_cost_for_vendor,
     select_best_vendor,
+    select_best_vendor_batch,
+    make_vendor_ranker,
     compare_vendors
 )
 
@@ -91,6 +94,20 @@ class TestEOQOptimizer(unittest.TestCase):
         self.assertEqual(calculate_eoq(1000, -50, 2.5), 0)
         self.assertEqual(calculate_eoq(1000, 50, -2.5), 0)
 
+    def test_calculate_eoq_batch_matches_scalar(self):
+        """Test batch EOQ agrees with calculate_eoq, including invalid entries."""
+        demands = [1000, 500, 1, 12345.6, 0, -10]
+        
+        result = calculate_eoq_batch(demands, self.order_cost, self.holding_cost_per_unit)
+        expected = [calculate_eoq(d, self.order_cost, self.holding_cost_per_unit) for d in demands]
+        self.assertEqual(result.tolist(), expected)
+        
+        # Per-item holding costs broadcast against the demands
+        holding_costs = [2.5, 0, 1.25, 3.0, 2.5, 2.5]
+        result = calculate_eoq_batch(demands, self.order_cost, holding_costs)
+        expected = [calculate_eoq(d, self.order_cost, h) for d, h in zip(demands, holding_costs)]
+        self.assertEqual(result.tolist(), expected)
+    
     def test_calculate_total_cost_vendor_a(self):
         """Test total cost calculation for Vendor A with known expected result."""
         total_cost = calculate_total_cost_for_vendor(self.annual_demand, self.vendor_a)
@@ -210,6 +227,34 @@ class TestEOQOptimizer(unittest.TestCase):
         result = select_best_vendor(invalid_vendors, self.annual_demand)
         self.assertIsNone(result)
 
+    def test_select_best_vendor_batch_matches_single(self):
+        """Test batch selection agrees with select_best_vendor for each demand."""
+        vendors = ["not a vendor", self.vendor_a, self.vendor_b, self.vendor_c]
+        demands = [1000, 100, 10, 50000, 0, -5]
+        
+        best_idx, best_cost = select_best_vendor_batch(vendors, demands)
+        
+        for demand, idx, cost in zip(demands, best_idx, best_cost):
+            with self.subTest(demand=demand):
+                best = select_best_vendor(vendors, demand)
+                if best is None:
+                    self.assertEqual(idx, -1)
+                    self.assertEqual(cost, float('inf'))
+                else:
+                    self.assertEqual(vendors[idx]['vendor_id'], best['vendor_id'])
+                    self.assertEqual(cost, best['total_annual_cost'])
+    
+    def test_make_vendor_ranker_matches_select_best_vendor(self):
+        """Test the pool-specialized ranker returns what select_best_vendor returns."""
+        vendors = [self.vendor_a, self.vendor_b, {'vendor_id': 'BAD'}, self.vendor_c]
+        rank = make_vendor_ranker(vendors)
+        
+        for demand in (1000, 100, 10, 50000, 1, 0, -5):
+            with self.subTest(demand=demand):
+                self.assertEqual(rank(demand), select_best_vendor(vendors, demand))
+        
+        self.assertIsNone(make_vendor_ranker([])(1000))
+    
     def test_compare_vendors_sorting(self):
         """Test that vendor comparison returns vendors sorted by cost."""
         comparison = compare_vendors(self.vendors_list, self.annual_demand)
@@ -254,6 +299,16 @@ class TestEOQOptimizer(unittest.TestCase):
                               breakdown['holding_cost'])
             self.assertAlmostEqual(vendor['total_annual_cost'], total_calculated, places=2)
 
+    def test_compare_vendors_top_k(self):
+        """Test top_k returns the same leading vendors as the full ranking."""
+        vendors = [self.vendor_a, self.vendor_b, self.vendor_c]
+        full = compare_vendors(vendors, self.annual_demand)
+        
+        for k in (0, 1, 2, 3, 10):
+            with self.subTest(k=k):
+                top = compare_vendors(vendors, self.annual_demand, top_k=k)
+                self.assertEqual(top, full[:k])
+    
     def test_realistic_scenario_high_demand(self):
         """Test with realistic high-demand scenario."""
         high_demand = 10000  # 10,000 units per year
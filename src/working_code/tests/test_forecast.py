@@ -12,9 +12,12 @@ import unittest
 from datetime import datetime, timedelta
 from src.models.forecast import (
     compute_daily_average,
+    compute_daily_average_batch,
     forecast_weekly_demand,
     estimate_days_until_stockout,
-    validate_transaction_data
+    estimate_days_until_stockout_batch,
+    validate_transaction_data,
+    TransactionStore
 )
 
 
@@ -189,6 +192,30 @@ class TestForecast(unittest.TestCase):
         self.assertTrue(any("invalid quantity" in error for error in errors))
         self.assertTrue(any("invalid date format" in error for error in errors))
 
+    def test_validate_transaction_data_error_limits(self):
+        """Test strict mode and max_errors stop validation early."""
+        invalid_transactions = [{'sku': 'ABC123'} for _ in range(10)]
+        
+        errors = validate_transaction_data(invalid_transactions)
+        self.assertEqual(len(errors), 20)
+        
+        errors = validate_transaction_data(invalid_transactions, max_errors=3)
+        self.assertEqual(errors, [
+            "Transaction 0 missing required field: quantity",
+            "Transaction 0 missing required field: date",
+            "Transaction 1 missing required field: quantity",
+        ])
+        
+        errors = validate_transaction_data(invalid_transactions, strict=True)
+        self.assertEqual(errors, ["Transaction 0 missing required field: quantity"])
+        
+        errors = validate_transaction_data(invalid_transactions, max_errors=None)
+        self.assertEqual(len(errors), 20)
+        
+        # No cap by default, even past a hundred errors
+        errors = validate_transaction_data([{'sku': 'ABC123'} for _ in range(60)])
+        self.assertEqual(len(errors), 120)
+
     def test_integration_realistic_scenario(self):
         """Test integration with realistic inventory scenario."""
         # Create realistic transaction history for a product
@@ -244,6 +271,144 @@ class TestForecast(unittest.TestCase):
         self.assertAlmostEqual(avg, expected, places=2)
 
 
+    def test_compute_daily_average_batch_matches_single(self):
+        """Test batch averages agree with per-SKU computation."""
+        recent = datetime.now() - timedelta(days=5)
+        transactions = [
+            {'sku': 'A', 'quantity': 10, 'date': recent.isoformat()},
+            {'sku': 'A', 'quantity': 'invalid', 'date': recent.isoformat()},
+            {'sku': 'B', 'quantity': 4, 'date': recent},
+            {'sku': 'B', 'quantity': -3, 'date': recent.isoformat()},
+            {'sku': 'B', 'quantity': 50, 'date': (recent - timedelta(days=200)).isoformat()},
+        ]
+        
+        batch = compute_daily_average_batch(transactions, ['A', 'B', 'MISSING'], window_days=30)
+        
+        self.assertEqual(list(batch.index), ['A', 'B', 'MISSING'])
+        for sku in ('A', 'B', 'MISSING'):
+            self.assertAlmostEqual(batch[sku], compute_daily_average(transactions, sku, window_days=30))
+        self.assertAlmostEqual(batch['A'], 10.0 / 30.0)
+        self.assertAlmostEqual(batch['B'], 4.0 / 30.0)
+        self.assertEqual(batch['MISSING'], 0.0)
+
+    def test_estimate_days_until_stockout_batch_matches_single(self):
+        """Test vectorized stockout estimates agree with the scalar function."""
+        on_hand = [100, 0, -5, 100, 100, 7.5]
+        avg_daily = [2.5, 2.5, 2.5, 0, -1, 0.5]
+        
+        batch = estimate_days_until_stockout_batch(on_hand, avg_daily)
+        
+        self.assertEqual(batch.tolist(),
+                         [estimate_days_until_stockout(q, a) for q, a in zip(on_hand, avg_daily)])
+
+    def test_compute_daily_average_reuses_history_across_windows(self):
+        """Test different windows over the same history each see only their own rows."""
+        now = datetime.now()
+        transactions = [
+            {'sku': 'WIN', 'quantity': 7, 'date': (now - timedelta(days=2)).isoformat()},
+            {'sku': 'WIN', 'quantity': 20, 'date': (now - timedelta(days=20)).isoformat()},
+            {'sku': 'WIN', 'quantity': 60, 'date': (now - timedelta(days=60)).isoformat()},
+        ]
+        
+        self.assertAlmostEqual(compute_daily_average(transactions, 'WIN', window_days=7), 7.0 / 7.0)
+        self.assertAlmostEqual(compute_daily_average(transactions, 'WIN', window_days=30), 27.0 / 30.0)
+        self.assertAlmostEqual(compute_daily_average(transactions, 'WIN', window_days=90), 87.0 / 90.0)
+        
+        # Appending a transaction must not serve the stale cached history
+        transactions.append({'sku': 'WIN', 'quantity': 3, 'date': now.isoformat()})
+        self.assertAlmostEqual(compute_daily_average(transactions, 'WIN', window_days=7), 10.0 / 7.0)
+        
+        # Nor may editing a transaction in place
+        transactions[0]['quantity'] = 97
+        self.assertAlmostEqual(compute_daily_average(transactions, 'WIN', window_days=7), 100.0 / 7.0)
+
+
+    def test_compute_daily_average_with_fixed_now(self):
+        """Test the window can be anchored to a caller-supplied time."""
+        now = datetime(2024, 1, 10)
+        
+        avg = compute_daily_average(self.sample_transactions, 'ABC123', window_days=30, now=now)
+        self.assertAlmostEqual(avg, 65.0 / 30.0)
+        
+        # Only 2024-01-04 and 2024-01-05 fall within the last 6 days
+        avg = compute_daily_average(self.sample_transactions, 'ABC123', window_days=6, now=now)
+        self.assertAlmostEqual(avg, 32.0 / 6.0)
+        
+        batch = compute_daily_average_batch(self.sample_transactions, ['ABC123', 'XYZ789'],
+                                            window_days=30, now=now)
+        self.assertAlmostEqual(batch['ABC123'], 65.0 / 30.0)
+        self.assertAlmostEqual(batch['XYZ789'], 15.0 / 30.0)
+
+
+    def test_transaction_store_matches_dict_input(self):
+        """Test a TransactionStore gives the same answers as the dict list."""
+        now = datetime(2024, 1, 10)
+        store = TransactionStore.from_dicts(self.mixed_transactions)
+        
+        self.assertEqual(len(store), len(self.mixed_transactions))
+        self.assertAlmostEqual(
+            compute_daily_average(store, 'ABC123', window_days=30, now=now),
+            compute_daily_average(self.mixed_transactions, 'ABC123', window_days=30, now=now)
+        )
+        
+        errors = validate_transaction_data(store)
+        self.assertEqual(errors, [
+            "Transaction 1 has invalid quantity",
+            "Transaction 2 has invalid date format",
+        ])
+
+
+    def test_transaction_store_streams_iterators_in_chunks(self):
+        """Test building a store from a generator in chunks keeps every row."""
+        now = datetime(2024, 1, 10)
+        store = TransactionStore.from_dicts((t for t in self.sample_transactions), chunk_rows=3)
+        
+        self.assertEqual(len(store), len(self.sample_transactions))
+        self.assertEqual(list(store.sku), [t['sku'] for t in self.sample_transactions])
+        self.assertAlmostEqual(compute_daily_average(store, 'ABC123', window_days=30, now=now), 65.0 / 30.0)
+        self.assertAlmostEqual(
+            compute_daily_average(iter(self.sample_transactions), 'XYZ789', window_days=30, now=now),
+            15.0 / 30.0
+        )
+
+    def test_transaction_store_chunks_with_differently_typed_skus(self):
+        """Test chunk boundaries between None, int and str SKUs match the unchunked store."""
+        now = datetime(2024, 1, 10)
+        day = '2024-01-05'
+        transactions = [
+            {'sku': None, 'quantity': 1, 'date': day},
+            {'sku': None, 'quantity': 2, 'date': day},
+            {'sku': 101, 'quantity': 4, 'date': day},
+            {'sku': 202, 'quantity': 8, 'date': day},
+            {'sku': 'ABC', 'quantity': 16, 'date': day},
+            {'sku': 101, 'quantity': 32, 'date': day},
+        ]
+        
+        chunked = TransactionStore.from_dicts(transactions, chunk_rows=2)
+        whole = TransactionStore.from_dicts(transactions)
+        
+        self.assertEqual(list(chunked.sku), list(whole.sku))
+        skus = [101, 202, 'ABC']
+        self.assertEqual(list(compute_daily_average_batch(chunked, skus, window_days=30, now=now)),
+                         list(compute_daily_average_batch(whole, skus, window_days=30, now=now)))
+        self.assertAlmostEqual(compute_daily_average(chunked, 101, window_days=30, now=now), 36.0 / 30.0)
+
+    def test_transaction_store_keeps_float64_quantities(self):
+        """Test store quantities are not rounded (float32 would lose 0.1 and 2**24 + 1)."""
+        now = datetime(2024, 1, 10)
+        transactions = [
+            {'sku': 'ABC123', 'quantity': 0.1, 'date': '2024-01-05'},
+            {'sku': 'ABC123', 'quantity': 2 ** 24 + 1, 'date': '2024-01-06'},
+        ]
+        
+        store = TransactionStore.from_dicts(transactions)
+        
+        self.assertEqual(str(store.qty.dtype), 'float64')
+        self.assertEqual(store.qty.tolist(), [0.1, 2 ** 24 + 1])
+        self.assertEqual(compute_daily_average(store, 'ABC123', window_days=30, now=now),
+                         (0.1 + 2 ** 24 + 1) / 30)
+
+
 class TestForecastPerformance(unittest.TestCase):
     """Performance tests for forecast functions."""
     
@@ -0,0 +1,217 @@
+"""
+Unit tests for the LLM rationale generator.
+"""
+import unittest
+from unittest.mock import patch
+import sys
+import os
+import json
+import asyncio
+import tempfile
+import threading
+import time
+
+# Add the project root to the Python path
+sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..')))
+
+from src.models import llm_rationale
+from src.models.llm_rationale import generate_rationale
+
+
+def _context(sku='WIDGET-001'):
+    """Build a complete rationale context for a SKU."""
+    return {
+        'sku': sku,
+        'on_hand': 25,
+        'weekly_demand': 15,
+        'stockout_date': '2024-02-15',
+        'best_vendor': {'name': 'Acme Supplies', 'EOQ': 100, 'TotalCost': 1250.0},
+        'last_90d_stats': {'avg_daily': 2.1, 'stddev': 0.8}
+    }
+
+
+LLM_ANSWER = json.dumps({'paragraph': 'Reorder now.', 'bullets': ['Low stock']})
+
+
+class TestRationaleCache(unittest.TestCase):
+    """Test cases for the rationale cache."""
+    
+    def setUp(self):
+        """Start each test with an empty memory cache and a clean environment."""
+        llm_rationale._RATIONALE_CACHE.clear()
+        self.addCleanup(llm_rationale._RATIONALE_CACHE.clear)
+        env = patch.dict(os.environ, {'GROQ_API_KEY': 'test-key', 'LLM_PROVIDER': 'groq'}, clear=True)
+        env.start()
+        self.addCleanup(env.stop)
+        providers = patch.object(llm_rationale, '_call_providers', return_value=LLM_ANSWER)
+        self.call_providers = providers.start()
+        self.addCleanup(providers.stop)
+    
+    def test_memory_hit(self):
+        """Test a repeated prompt is answered from memory."""
+        first = generate_rationale(_context())
+        second = generate_rationale(_context())
+        
+        self.assertEqual(first, second)
+        self.assertEqual(self.call_providers.call_count, 1)
+    
+    def test_cached_rationale_is_a_copy(self):
+        """Test mutating a returned rationale does not change the cached one."""
+        generate_rationale(_context())['bullets'].append('edited')
+        self.assertEqual(generate_rationale(_context())['bullets'], ['Low stock'])
+    
+    def test_disk_hit(self):
+        """Test a rationale persisted by an earlier run is read back from disk."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.environ['RATIONALE_CACHE_DIR'] = cache_dir
+            generate_rationale(_context())
+            self.assertEqual(len(os.listdir(cache_dir)), 1)
+            
+            llm_rationale._RATIONALE_CACHE.clear()
+            rationale = generate_rationale(_context())
+        
+        self.assertEqual(rationale['paragraph'], 'Reorder now.')
+        self.assertEqual(self.call_providers.call_count, 1)
+    
+    def test_disk_cache_off_by_default(self):
+        """Test nothing is written to disk unless RATIONALE_CACHE_DIR is set."""
+        with patch.object(llm_rationale, 'open', create=True) as mock_open:
+            generate_rationale(_context())
+        mock_open.assert_not_called()
+    
+    def test_cache_disabled_with_zero_ttl(self):
+        """Test RATIONALE_CACHE_TTL=0 sends every request to the provider."""
+        os.environ['RATIONALE_CACHE_TTL'] = '0'
+        generate_rationale(_context())
+        generate_rationale(_context())
+        self.assertEqual(self.call_providers.call_count, 2)
+        self.assertEqual(llm_rationale._RATIONALE_CACHE, {})
+    
+    def test_entries_expire(self):
+        """Test entries older than the TTL are regenerated, in memory and on disk."""
+        with tempfile.TemporaryDirectory() as cache_dir:
+            os.environ['RATIONALE_CACHE_DIR'] = cache_dir
+            os.environ['RATIONALE_CACHE_TTL'] = '60'
+            generate_rationale(_context())
+            
+            now = llm_rationale.time.time()
+            with patch.object(llm_rationale.time, 'time', return_value=now + 61):
+                generate_rationale(_context())
+        
+        self.assertEqual(self.call_providers.call_count, 2)
+    
+    def test_provider_change_misses_cache(self):
+        """Test a rationale from one provider is not served for another."""
+        generate_rationale(_context())
+        
+        os.environ['LLM_PROVIDER'] = 'openai'
+        del os.environ['GROQ_API_KEY']
+        os.environ['OPENAI_API_KEY'] = 'test-key'
+        generate_rationale(_context())
+        
+        self.assertEqual(self.call_providers.call_count, 2)
+
+
+
+class _StreamedResponse:
+    """Stand-in for a streaming requests.Response yielding server-sent event lines."""
+    
+    def __init__(self, lines):
+        self.lines = lines
+    
+    def iter_lines(self, decode_unicode=False):
+        return iter(self.lines)
+
+
+def _event(content):
+    """Format one chat-completion delta as a server-sent event line."""
+    return 'data: ' + json.dumps({'choices': [{'delta': {'content': content}}]})
+
+
+class TestReadStreamedCompletion(unittest.TestCase):
+    """Test cases for assembling streamed completions."""
+    
+    def test_assembles_deltas_until_done(self):
+        """Test deltas are joined in order, malformed events skipped and reading stops at [DONE]."""
+        response = _StreamedResponse([
+            ': keep-alive',
+            _event('{"paragraph": '),
+            '',
+            'data: {not json',
+            'data: {"choices": [{"delta": {}}]}',
+            _event('"Reorder now.", '),
+            _event('"bullets": []}'),
+            'data: [DONE]',
+            _event('ignored after done'),
+        ])
+        deltas = []
+        
+        text = llm_rationale._read_streamed_completion(response, deltas.append)
+        
+        self.assertEqual(text, '{"paragraph": "Reorder now.", "bullets": []}')
+        self.assertEqual(deltas, ['{"paragraph": ', '"Reorder now.", ', '"bullets": []}'])
+        self.assertEqual(json.loads(text)['paragraph'], 'Reorder now.')
+    
+    def test_stops_early_on_non_json_text(self):
+        """Test a completion that does not open with a JSON object is cut short."""
+        response = _StreamedResponse([_event('Sure! '), _event('Here is the rationale')])
+        deltas = []
+        
+        text = llm_rationale._read_streamed_completion(response, deltas.append)
+        
+        self.assertEqual(text, 'Sure!')
+        self.assertEqual(deltas, ['Sure! '])
+
+
+
+class TestGenerateRationaleBatch(unittest.TestCase):
+    """Test cases for generate_rationale_batch."""
+    
+    def setUp(self):
+        """Run without provider keys or caching."""
+        env = patch.dict(os.environ, {'RATIONALE_CACHE_TTL': '0'}, clear=True)
+        env.start()
+        self.addCleanup(env.stop)
+    
+    def test_results_in_input_order_within_concurrency_cap(self):
+        """Test results follow the input order and at most ``concurrency`` calls overlap."""
+        lock = threading.Lock()
+        active = []
+        peak = []
+        
+        def generate(context):
+            with lock:
+                active.append(context['sku'])
+                peak.append(len(active))
+            # Later SKUs finish first, so completion order differs from input order
+            time.sleep(0.01 * (6 - int(context['sku'][-1])))
+            with lock:
+                active.remove(context['sku'])
+            return {'paragraph': context['sku'], 'bullets': []}
+        
+        contexts = [_context(f'SKU-{i}') for i in range(6)]
+        with patch.object(llm_rationale, 'generate_rationale', side_effect=generate):
+            results = asyncio.run(llm_rationale.generate_rationale_batch(contexts, concurrency=2))
+        
+        self.assertEqual([r['paragraph'] for r in results], [c['sku'] for c in contexts])
+        self.assertEqual(max(peak), 2)
+    
+    def test_failing_sku_falls_back_alone(self):
+        """Test a provider error for one SKU yields its fallback without affecting the others."""
+        def call_providers(prompt, on_delta=None):
+            if 'SKU: BAD-001' in prompt:
+                raise RuntimeError('provider down')
+            return LLM_ANSWER
+        
+        contexts = [_context('GOOD-001'), _context('BAD-001'), _context('GOOD-002')]
+        with patch.object(llm_rationale, '_call_providers', side_effect=call_providers):
+            results = asyncio.run(llm_rationale.generate_rationale_batch(contexts))
+        
+        self.assertEqual(results[0]['paragraph'], 'Reorder now.')
+        self.assertEqual(results[2]['paragraph'], 'Reorder now.')
+        self.assertIn('BAD-001', results[1]['paragraph'])
+        self.assertEqual(len(results[1]['bullets']), 4)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -9,15 +9,10 @@ Version: 1.0.0
 """
 
 import unittest
-import sys
-import os
 from datetime import datetime, timedelta
 from unittest.mock import patch, MagicMock
 
-# Add src to path for imports
-sys.path.append(os.path.join(os.path.dirname(__file__), '..', 'src'))
-
-from policies.reorder_policy import ReorderPolicy
+from src.policies.reorder_policy import ReorderPolicy
 
 class TestReorderPolicy(unittest.TestCase):
     """Test cases for ReorderPolicy class."""
@@ -77,7 +72,7 @@ class TestReorderPolicy(unittest.TestCase):
             transactions.append({
                 'date': date.strftime('%Y-%m-%d'),
                 'sku': sku,
-                'quantity': -usage,  # Negative for outbound
+                'quantity': usage,  # Units used, as compute_daily_average expects
                 'type': 'sale'
             })
         
@@ -277,6 +272,19 @@ class TestReorderPolicy(unittest.TestCase):
             self.assertIn('needs_reorder', result)
             self.assertIn('evidence_summary', result)
     
+    def test_batch_results_do_not_share_cost_savings(self):
+        """Test items with equal demand get independent cost_savings dicts."""
+        inventory_items = [
+            {'sku': 'NEW-001', 'on_hand': 5, 'reorder_point': 20},
+            {'sku': 'NEW-002', 'on_hand': 5, 'reorder_point': 20}
+        ]
+        
+        results = self.policy.batch_evaluate_reorders(inventory_items, [], self.vendors)
+        results[0]['cost_savings']['note'] = 'reviewed'
+        
+        self.assertEqual(results[0]['cost_savings']['vs_vendor'], results[1]['cost_savings']['vs_vendor'])
+        self.assertNotIn('note', results[1]['cost_savings'])
+    
     def test_error_handling_invalid_input(self):
         """Test error handling with invalid input data."""
         # Test with missing required fields
@@ -414,27 +422,26 @@ class TestReorderPolicyIntegration(unittest.TestCase):
         """Set up integration test fixtures."""
         self.policy = ReorderPolicy()
     
-    @patch('policies.reorder_policy.compute_daily_average')
-    @patch('policies.reorder_policy.estimate_days_until_stockout')
-    @patch('policies.reorder_policy.select_best_vendor')
+    @patch('src.policies.reorder_policy.compute_daily_average')
+    @patch('src.policies.reorder_policy.estimate_days_until_stockout')
+    @patch('src.policies.reorder_policy.select_best_vendor')
     def test_integration_with_mocked_dependencies(self, mock_select_vendor, mock_stockout, mock_daily_avg):
         """Test integration with mocked forecast and EOQ modules."""
         # Setup mocks
         mock_daily_avg.return_value = 2.5
         mock_stockout.return_value = 8.0
         mock_select_vendor.return_value = {
-            'best_vendor': {
-                'name': 'Test Vendor',
-                'unit_cost': 10.0,
-                'lead_time': 5,
-                'eoq': 100
-            },
+            'vendor_name': 'Test Vendor',
+            'price_per_unit': 10.0,
+            'order_cost': 50.0,
+            'lead_time': 5,
             'eoq': 100,
-            'total_cost': 1000.0,
-            'comparisons': [
-                {'name': 'Test Vendor', 'total_cost': 1000.0},
-                {'name': 'Other Vendor', 'total_cost': 1200.0}
-            ]
+            'total_annual_cost': 1000.0,
+            'cost_breakdown': {
+                'purchase_cost': 912.5,
+                'ordering_cost': 45.0,
+                'holding_cost': 42.5
+            }
         }
         
         inventory_item = {
@@ -454,10 +461,17 @@ class TestReorderPolicyIntegration(unittest.TestCase):
         mock_daily_avg.assert_called_once()
         mock_stockout.assert_called_once()
         mock_select_vendor.assert_called_once()
+        candidates, annual_demand = mock_select_vendor.call_args.args
+        self.assertEqual(candidates[0]['vendor_name'], 'Test Vendor')
+        self.assertEqual(candidates[0]['price_per_unit'], 10.0)
+        self.assertAlmostEqual(annual_demand, 2.5 * 365)
         
         # Verify result structure
         self.assertEqual(result['sku'], 'MOCK-001')
         self.assertEqual(result['vendor'], 'Test Vendor')
+        self.assertEqual(result['eoq'], 100)
+        self.assertEqual(result['total_cost'], 1000.0)
+        self.assertEqual(result['decision_factors']['lead_time_days'], 5)
         self.assertIn('needs_reorder', result)
 
 if __name__ == '__main__':
@@ -483,9 +497,11 @@ if __name__ == '__main__':
     if result.failures:
         print(f"\nFailures:")
         for test, traceback in result.failures:
-            print(f"  - {test}: {traceback.split('AssertionError: ')[-1].split('\\n')[0]}")
+            message = traceback.split('AssertionError: ')[-1].split('\n')[0]
+            print(f"  - {test}: {message}")
     
     if result.errors:
         print(f"\nErrors:")
         for test, traceback in result.errors:
-            print(f"  - {test}: {traceback.split('\\n')[-2]}")
\ No newline at end of file
+            message = traceback.split('\n')[-2]
+            print(f"  - {test}: {message}")
\ No newline at end of file
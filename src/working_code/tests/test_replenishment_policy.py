@@ -222,6 +222,23 @@ class TestReplenishmentPolicy:
         assert len(recommendations['reorder_items']) == 1
         assert recommendations['reorder_items'][0]['item']['id'] == 'ITEM001'
         assert recommendations['total_estimated_cost'] > 0
+    
+    def test_reorder_recommendations_match_per_item_on_mixed_input(self, policy, sample_item):
+        """Test batch quantities equal calculate_order_quantity for non-numeric fields."""
+        inventory_data = [
+            sample_item,
+            {**sample_item, 'id': 'STR001', 'annual_demand': '10000'},
+            {**sample_item, 'id': 'NONE001', 'demand_std_deviation': None},
+            {**sample_item, 'id': 'NONE002', 'average_daily_demand': None, 'annual_demand': None},
+            {**sample_item, 'id': 'BIG001', 'annual_demand': 10000, 'lead_time_days': 12},
+        ]
+        
+        recommendations = policy.get_reorder_recommendations(inventory_data)
+        
+        assert len(recommendations['reorder_items']) == len(inventory_data)
+        for reorder_item in recommendations['reorder_items']:
+            item = reorder_item['item']
+            assert reorder_item['recommended_quantity'] == policy.calculate_order_quantity(item), item['id']
 
 if __name__ == "__main__":
     pytest.main([__file__])
\ No newline at end of file